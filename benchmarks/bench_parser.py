@@ -0,0 +1,84 @@
+"""
+Benchmark: single-pass metadata parser vs. the BeautifulSoup reference.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parser [--iterations N]
+
+Parses a synthetic but realistic page (a head with ~60 meta/link tags and a
+large body) with both parsers, checks they agree, and prints the mean CPU
+time per document.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from src.infrastructure.scraper.parser import parse_metadata, parse_metadata_bs4
+
+_URL = "https://example.com/articles/benchmark"
+
+
+def _build_page(body_paragraphs: int = 400) -> str:
+    head = [
+        "<!DOCTYPE html><html lang='en'><head>",
+        "<meta charset='utf-8'>",
+        "<title>Benchmark Article &mdash; Example News</title>",
+        "<meta name='description' content='A long article used to benchmark metadata parsing.'>",
+        "<link rel='icon' href='/favicon.ico'>",
+        "<link rel='apple-touch-icon' href='/apple-touch-icon.png'>",
+    ]
+    for i in range(20):
+        head.append(f"<meta property='og:field{i}' content='OpenGraph value {i}'>")
+        head.append(f"<meta name='twitter:field{i}' content='Twitter value {i}'>")
+        head.append(f"<link rel='preload' href='/static/chunk-{i}.js' as='script'>")
+    head.append("<script>window.__STATE__ = {\"items\": [1, 2, 3]};</script>")
+    head.append("</head>")
+
+    body = ["<body><main>"]
+    for i in range(body_paragraphs):
+        body.append(
+            f"<section id='s{i}'><h2>Heading {i}</h2>"
+            f"<p class='lead'>Paragraph {i} with <a href='/link/{i}'>a link</a> and "
+            f"<em>emphasis</em>.</p></section>"
+        )
+    body.append("</main></body></html>")
+    return "".join(head + body)
+
+
+def _bench(label: str, fn, iterations: int) -> float:
+    fn()  # warm-up
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    per_doc_ms = (time.process_time() - start) / iterations * 1000
+    print(f"{label:<38} {per_doc_ms:8.3f} ms/doc")
+    return per_doc_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    page = _build_page()
+    head = page[: page.index("</head>") + len("</head>")]
+
+    assert parse_metadata(page, _URL, head_only=False) == parse_metadata_bs4(page, _URL)
+    assert parse_metadata(head, _URL) == parse_metadata_bs4(head, _URL)
+
+    print(f"page: {len(page) / 1024:.1f} KiB, head: {len(head) / 1024:.1f} KiB\n")
+    bs4_full = _bench("bs4, full document", lambda: parse_metadata_bs4(page, _URL), args.iterations)
+    fast_full = _bench(
+        "fast, full document", lambda: parse_metadata(page, _URL, head_only=False), args.iterations
+    )
+    bs4_head = _bench("bs4, head only", lambda: parse_metadata_bs4(head, _URL), args.iterations)
+    fast_head = _bench("fast, head only", lambda: parse_metadata(head, _URL), args.iterations)
+
+    print(f"\nspeed-up (full document): {bs4_full / fast_full:5.1f}x")
+    print(f"speed-up (head only):     {bs4_head / fast_head:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark: precompiled repository statements vs. building them per call.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_queries [--iterations N] [--links N]
+
+Seeds an in-memory SQLite database with one user's links, then runs the
+hot read queries (get a link, list a page, count) both ways — building a
+fresh `select()` per call as the repository used to, and executing the
+module-level precompiled statements — and prints the mean CPU time per
+call. A second table isolates construction + compilation for the
+PostgreSQL (asyncpg) dialect, without any I/O.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.link.domain.models import Link, User
+from src.core.link.domain.pagination import LinkCursor
+from src.infrastructure.database.orm_models import Base, LinkModel, UserLinkCountModel
+from src.infrastructure.database.postgres_repository import (
+    _GET_LINK,
+    _USER_LINK_COUNT,
+    PostgresLinkRepository,
+    PostgresUserRepository,
+    _links_page_stmt,
+    _page_params,
+    _select_links,
+)
+
+
+def _adhoc_get_link(link_id: uuid.UUID, user_id: uuid.UUID):
+    return _select_links().where(LinkModel.id == link_id, LinkModel.user_id == user_id)
+
+
+def _adhoc_page(user_id: uuid.UUID, after: LinkCursor, limit: int):
+    return (
+        _select_links()
+        .where(LinkModel.user_id == user_id)
+        .order_by(LinkModel.created_at.desc(), LinkModel.id.desc())
+        .limit(limit)
+        .where(tuple_(LinkModel.created_at, LinkModel.id) < tuple_(after.created_at, after.id))
+    )
+
+
+def _adhoc_count(user_id: uuid.UUID):
+    return select(UserLinkCountModel.link_count).where(UserLinkCountModel.user_id == user_id)
+
+
+async def _bench(label: str, fn, iterations: int) -> float:
+    await fn()  # warm-up (fills the compiled cache)
+    start = time.process_time()
+    for _ in range(iterations):
+        await fn()
+    per_call_us = (time.process_time() - start) / iterations * 1_000_000
+    print(f"{label:<44} {per_call_us:9.1f} µs/call")
+    return per_call_us
+
+
+def _bench_compile(label: str, fn, iterations: int) -> float:
+    dialect = postgresql.asyncpg.dialect()
+    cache: dict = {}
+    fn().compile(dialect=dialect)
+    start = time.process_time()
+    for _ in range(iterations):
+        # What execute() does before any I/O: build, derive the cache key, look up
+        stmt = fn()
+        key = stmt._generate_cache_key().key
+        if key not in cache:
+            cache[key] = stmt.compile(dialect=dialect)
+    per_call_us = (time.process_time() - start) / iterations * 1_000_000
+    print(f"{label:<44} {per_call_us:9.1f} µs/call")
+    return per_call_us
+
+
+async def main_async(iterations: int, link_count: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with factory() as session:
+        user = await PostgresUserRepository(session).create_user(
+            User(username="bench", hashed_password="x")
+        )
+        repo = PostgresLinkRepository(session)
+        await repo.insert_links(
+            [
+                Link(user_id=user.id, url=f"https://example.com/{i}", title=f"Link {i}")
+                for i in range(link_count)
+            ]
+        )
+        await session.commit()
+
+    async with factory() as session:
+        first = (await PostgresLinkRepository(session).get_links_by_user(user.id, limit=1))[0]
+        after = LinkCursor.after(first)
+        params = _page_params(user.id, offset=0, limit=20, after=after)
+        page_stmt = _links_page_stmt(None, keyset=True, tag_count=0, search=False)
+
+        print(f"Executed against SQLite ({link_count} links, {iterations} iterations)")
+        pairs = [
+            (
+                "get_link",
+                lambda: session.execute(_adhoc_get_link(first.id, user.id)),
+                lambda: session.execute(_GET_LINK, {"link_id": first.id, "user_id": user.id}),
+            ),
+            (
+                "list page (keyset, 20 rows)",
+                lambda: session.execute(_adhoc_page(user.id, after, 20)),
+                lambda: session.execute(page_stmt, params),
+            ),
+            (
+                "count_links",
+                lambda: session.execute(_adhoc_count(user.id)),
+                lambda: session.execute(_USER_LINK_COUNT, {"user_id": user.id}),
+            ),
+        ]
+        for name, adhoc, prebuilt in pairs:
+            before = await _bench(f"{name}: built per call", adhoc, iterations)
+            now = await _bench(f"{name}: precompiled", prebuilt, iterations)
+            print(f"{'':<44} {before / now:9.2f}x\n")
+
+    await engine.dispose()
+
+    print(f"Statement preparation only, asyncpg dialect ({iterations * 10} iterations)")
+    user_id, link_id = uuid.uuid4(), uuid.uuid4()
+    for name, adhoc, prebuilt in [
+        ("get_link", lambda: _adhoc_get_link(link_id, user_id), lambda: _GET_LINK),
+        ("list page", lambda: _adhoc_page(user_id, after, 20), lambda: page_stmt),
+    ]:
+        before = _bench_compile(f"{name}: built per call", adhoc, iterations * 10)
+        now = _bench_compile(f"{name}: precompiled", prebuilt, iterations * 10)
+        print(f"{'':<44} {before / now:9.2f}x\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--links", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.iterations, args.links))
+
+
+if __name__ == "__main__":
+    main()
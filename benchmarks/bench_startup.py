@@ -0,0 +1,88 @@
+"""
+Benchmark: database work at process start — `create_all` vs. the schema check.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup [--iterations N] [--database-url URL]
+
+Migrates a database once (a temporary SQLite file unless `--database-url`
+points at e.g. a scratch PostgreSQL), then simulates cold worker boots: each
+iteration creates a fresh engine, runs the startup step and disposes of it.
+It prints the mean wall time per boot for the old lifespan step
+(`Base.metadata.create_all` against an existing schema) and for
+`check_schema()`, next to the time it takes to import the application.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure.database.migrations import check_schema, migrate
+from src.infrastructure.database.orm_models import Base
+
+
+async def _create_all(engine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def _bench(label: str, step, url: str, iterations: int) -> float:
+    elapsed = 0.0
+    for _ in range(iterations):
+        engine = create_async_engine(url)
+        start = time.perf_counter()
+        await step(engine)
+        elapsed += time.perf_counter() - start
+        await engine.dispose()
+    per_boot_ms = elapsed / iterations * 1000
+    print(f"{label:<44} {per_boot_ms:9.2f} ms/boot")
+    return per_boot_ms
+
+
+def _import_time_ms() -> float:
+    """Wall time to import the application in a fresh interpreter."""
+    code = (
+        "import time; start = time.perf_counter(); import src.api.main; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+async def main_async(iterations: int, url: str) -> None:
+    engine = create_async_engine(url)
+    await migrate(engine)
+    await engine.dispose()
+
+    print(f"Cold boots against {url.split('://')[0]} ({iterations} iterations)")
+    before = await _bench("create_all on an existing schema", _create_all, url, iterations)
+    now = await _bench("check_schema (one indexed lookup)", check_schema, url, iterations)
+    print(f"{'':<44} {before / now:9.2f}x\n")
+    print(f"{'import src.api.main':<44} {_import_time_ms():9.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+    if args.database_url:
+        asyncio.run(main_async(args.iterations, args.database_url))
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "startup.db")
+        asyncio.run(main_async(args.iterations, f"sqlite+aiosqlite:///{path}"))
+
+
+if __name__ == "__main__":
+    main()
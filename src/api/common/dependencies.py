@@ -1,7 +1,8 @@
 """
 FastAPI dependencies for dependency injection.
 
-Provides database sessions, authenticated user context, and rate limiting.
+Provides database sessions (read-write on the primary, read-only on a
+replica when configured), authenticated user context, and rate limiting.
 """
 
 from __future__ import annotations
@@ -9,13 +10,19 @@ from __future__ import annotations
 import uuid
 from typing import Annotated
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.link.domain.exceptions import AuthenticationError, RateLimitExceededError
 from src.core.link.service.auth_usecases import TokenService
-from src.infrastructure.cache.redis_client import check_rate_limit, is_token_blacklisted
+from src.infrastructure.cache.redis_client import (
+    check_rate_limit,
+    is_pinned_to_primary,
+    is_token_blacklisted,
+    pin_to_primary,
+)
 from src.infrastructure.config import settings
+from src.infrastructure.database import database
 from src.infrastructure.database.database import async_session_factory
 
 
@@ -44,11 +51,15 @@ _token_service = TokenService(
 
 
 async def get_current_user_id(
+    request: Request,
     authorization: Annotated[str | None, Header()] = None,
 ) -> uuid.UUID:
     """
     Extract and validate JWT from the Authorization header.
     Returns the authenticated user's UUID.
+
+    With read replicas configured, a write request pins the user's reads
+    to the primary before it writes anything (read-your-writes).
     """
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(
@@ -69,7 +80,7 @@ async def get_current_user_id(
 
     try:
         payload = _token_service.verify_token(token)
-        return uuid.UUID(payload["sub"])
+        user_id = uuid.UUID(payload["sub"])
     except AuthenticationError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -77,11 +88,34 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if database.replica_pool and request.method not in ("GET", "HEAD", "OPTIONS"):
+        await pin_to_primary(str(user_id), settings.database_replica_pin_seconds)
+    return user_id
+
 
 # Reusable dependency type
 CurrentUserId = Annotated[uuid.UUID, Depends(get_current_user_id)]
 
 
+async def reads_pinned_to_primary(user_id: uuid.UUID) -> bool:
+    """Whether the user wrote within `database_replica_pin_seconds`."""
+    return bool(database.replica_pool) and await is_pinned_to_primary(str(user_id))
+
+
+async def get_read_db(current_user_id: CurrentUserId) -> AsyncSession:
+    """
+    Provide a read-only session: on a replica when configured, unless the
+    user's reads are pinned to the primary after a recent write.
+    """
+    use_primary = await reads_pinned_to_primary(current_user_id)
+    async with database.read_session(use_primary=use_primary) as session:
+        yield session
+
+
+# Reusable dependency type for read-only endpoints
+ReadDBSession = Annotated[AsyncSession, Depends(get_read_db)]
+
+
 async def rate_limit_check(
     authorization: Annotated[str | None, Header()] = None,
 ) -> None:
@@ -14,6 +14,8 @@ from fastapi.responses import JSONResponse
 
 from src.core.link.domain.exceptions import (
     AuthenticationError,
+    InvalidCursorError,
+    InvalidFilterError,
     InvalidURLError,
     LinkAlreadyExistsError,
     LinkNotFoundError,
@@ -30,6 +32,8 @@ _EXCEPTION_MAP: dict[type[SaveLinksError], int] = {
     LinkAlreadyExistsError: 409,
     LinkNotFoundError: 404,
     InvalidURLError: 422,
+    InvalidCursorError: 400,
+    InvalidFilterError: 400,
     UserNotFoundError: 404,
     UserAlreadyExistsError: 409,
     AuthenticationError: 401,
@@ -52,9 +56,12 @@ def register_error_handlers(app: FastAPI) -> None:
                 status_code=500,
                 content={"detail": "An internal error occurred."},
             )
+        content = {"detail": str(exc)}
+        if isinstance(exc, LinkAlreadyExistsError) and exc.duplicate_of is not None:
+            content["duplicate_of"] = str(exc.duplicate_of)
         return JSONResponse(
             status_code=status_code,
-            content={"detail": str(exc)},
+            content=content,
         )
 
     @app.exception_handler(Exception)
@@ -4,7 +4,7 @@ FastAPI Application Factory.
 Creates and configures the FastAPI app with:
 - API versioned routes (v1)
 - Global error handlers (domain → HTTP mapping)
-- Lifespan management (DB + Redis startup/shutdown)
+- Lifespan management (DB + Redis + scraper client/executor startup/shutdown)
 - CORS middleware
 """
 
@@ -17,11 +17,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.common.error_handlers import register_error_handlers
-from src.api.v1 import auth, links
+from src.api.v1 import auth, links, tags
 from src.infrastructure.cache.redis_client import close_redis
 from src.infrastructure.config import settings
-from src.infrastructure.database.database import engine
-from src.infrastructure.database.orm_models import Base
+from src.infrastructure.database.database import engine, replica_pool
+from src.infrastructure.database.migrations import check_schema, migrate
+from src.infrastructure.database.write_buffer import close_metadata_writer
+from src.infrastructure.scraper.executor import close_parse_executor, get_parse_executor
+from src.infrastructure.scraper.scraper import close_scraper_client, get_scraper_client
 
 # Configure logging
 logging.basicConfig(
@@ -36,16 +39,26 @@ async def lifespan(app: FastAPI):
     """Application lifespan — setup and teardown."""
     logger.info("Starting SaveLinks API...")
 
-    # Create tables if they don't exist (dev convenience; use Alembic in production)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("Database tables ensured.")
+    # DDL belongs to `python -m src.manage migrate`; booting only checks the
+    # schema version, so restarting many workers costs one lookup each
+    if settings.database_migrate_on_startup:
+        await migrate(engine)
+    version = await check_schema(engine)
+    logger.info(f"Database schema at version {version}.")
+
+    # Shared, pooled HTTP client and parse executor for background metadata scraping
+    await get_scraper_client()
+    get_parse_executor()
 
     yield
 
     # Cleanup
     logger.info("Shutting down SaveLinks API...")
+    await close_scraper_client()
+    close_parse_executor()
+    await close_metadata_writer()
     await close_redis()
+    await replica_pool.dispose()
     await engine.dispose()
     logger.info("Shutdown complete.")
 
@@ -79,10 +92,15 @@ def create_app() -> FastAPI:
     # Mount versioned routers
     app.include_router(auth.router, prefix="/api/v1")
     app.include_router(links.router, prefix="/api/v1")
+    app.include_router(tags.router, prefix="/api/v1")
 
     @app.get("/health", tags=["Health"])
     async def health_check():
-        return {"status": "healthy", "version": "1.0.0"}
+        return {
+            "status": "healthy",
+            "version": "1.0.0",
+            "parse_executor": get_parse_executor().stats(),
+        }
 
     return app
 
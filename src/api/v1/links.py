@@ -1,50 +1,171 @@
 """
 Link CRUD API endpoints.
 
-POST   /api/v1/links          — Save a new link (triggers background metadata scrape)
-GET    /api/v1/links          — List user's links (paginated)
-GET    /api/v1/links/search   — Search links by title/url
+POST   /api/v1/links          — Save a new link (enqueues a metadata scrape job)
+POST   /api/v1/links/import   — Bulk import NDJSON, CSV or Netscape bookmark HTML
+GET    /api/v1/links/export   — Stream the whole library as NDJSON, CSV or bookmark HTML
+GET    /api/v1/links          — List user's links (cursor-paginated, ?tag= filter, ?fields=)
+GET    /api/v1/links/search   — Search links (substring, ranked full-text or fuzzy)
+POST   /api/v1/links/bulk-delete — Delete links by ids or filter (tag, domain, age, unprocessed)
+PATCH  /api/v1/links/bulk     — Add / remove tags on links by ids or filter
 GET    /api/v1/links/{id}     — Get a single link by ID
 DELETE /api/v1/links/{id}     — Delete a link
 """
 
 from __future__ import annotations
 
+import logging
 import uuid
+from datetime import timedelta
+from typing import AsyncIterator, Literal
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
-from src.api.common.dependencies import CurrentUserId, DBSession, rate_limit_check
-from src.api.v1.schemas import LinkCreate, LinkListResponse, LinkResponse, MessageResponse
+from src.api.common.dependencies import (
+    CurrentUserId,
+    DBSession,
+    ReadDBSession,
+    rate_limit_check,
+    reads_pinned_to_primary,
+)
+from src.api.v1.schemas import (
+    BulkResultResponse,
+    LinkBulkDelete,
+    LinkBulkUpdate,
+    LinkCreate,
+    LinkImportResponse,
+    LinkImportRow,
+    LinkListItem,
+    LinkListResponse,
+    LinkResponse,
+    MessageResponse,
+)
+from src.core.link.domain.models import (
+    COMPACT_LINK_FIELDS,
+    LINK_FIELDS,
+    ImportStatus,
+    Link,
+    LinkFilter,
+    SearchMode,
+)
+from src.core.link.service.bookmark_formats import (
+    read_csv,
+    read_ndjson,
+    read_netscape_html,
+    write_csv,
+    write_ndjson,
+    write_netscape_html,
+)
 from src.core.link.service.link_usecases import (
+    BulkDeleteLinksUseCase,
+    BulkUpdateLinksUseCase,
     DeleteLinkUseCase,
+    ExportLinksUseCase,
     GetLinkUseCase,
+    ImportLinksUseCase,
     ListLinksUseCase,
     SaveLinkUseCase,
     SearchLinksUseCase,
 )
-from src.infrastructure.database.postgres_repository import PostgresLinkRepository
-from src.infrastructure.database.database import async_session_factory
-from src.infrastructure.scraper.scraper import extract_metadata
+from src.infrastructure.config import settings
+from src.infrastructure.database import database
+from src.infrastructure.database.postgres_repository import (
+    PostgresLinkRepository,
+    PostgresPageMetadataRepository,
+)
+from src.infrastructure.queue.scrape_queue import enqueue_scrape_job, enqueue_scrape_jobs
+from src.infrastructure.scraper.jobs import scrape_and_update
+
+logger = logging.getLogger("SaveLinks.api")
 
 router = APIRouter(prefix="/links", tags=["Links"])
 
+_FIELD_NAMES = "|".join(LINK_FIELDS)
+_FIELDS_QUERY = Query(
+    None,
+    pattern=rf"^({_FIELD_NAMES})(,({_FIELD_NAMES}))*$",
+    description="Comma-separated link attributes to return, e.g. `id,url,title` (`id` is always included)",
+)
+_VIEW_QUERY = Query(
+    "full",
+    description="`compact` returns only id, url, title, is_processed and created_at",
+)
+
+
+def _requested_fields(fields: str | None, view: str) -> frozenset[str] | None:
+    """Attributes to load and return per link; None means all of them."""
+    if fields:
+        return frozenset(fields.split(",")) | {"id"}
+    if view == "compact":
+        return COMPACT_LINK_FIELDS
+    return None
+
+
+def _to_response(link: Link) -> LinkResponse:
+    return LinkResponse(
+        id=link.id,
+        user_id=link.user_id,
+        url=link.url,
+        title=link.title,
+        description=link.description,
+        metadata=link.metadata,
+        is_processed=link.is_processed,
+        tags=link.tags,
+        created_at=link.created_at,
+        updated_at=link.updated_at,
+    )
+
+
+def _to_list_item(link: Link, fields: frozenset[str] | None) -> LinkListItem:
+    """Build a list item that sets only the requested attributes (unset ones are omitted)."""
+    names = LINK_FIELDS if fields is None else (name for name in LINK_FIELDS if name in fields)
+    return LinkListItem(**{name: getattr(link, name) for name in names})
+
 
-async def _scrape_and_update(link_id: uuid.UUID, url: str) -> None:
-    """Background task: scrape metadata from URL and update the link record."""
-    metadata = await extract_metadata(url)
-    async with async_session_factory() as session:
-        try:
-            repo = PostgresLinkRepository(session)
-            await repo.update_link_metadata(
-                link_id=link_id,
-                title=metadata.get("title"),
-                description=metadata.get("description"),
-                metadata=metadata,
-            )
-            await session.commit()
-        except Exception:
-            await session.rollback()
+async def _scrape_and_update(link_id: uuid.UUID, user_id: uuid.UUID, url: str) -> None:
+    """Background task fallback when the scrape queue is unavailable."""
+    try:
+        await scrape_and_update(link_id, user_id, url)
+    except Exception as e:
+        logger.warning(f"In-process scrape failed for {url}: {e}")
+
+
+async def _scrape_many(jobs: list[tuple[uuid.UUID, uuid.UUID, str]]) -> None:
+    """Background fallback for a batch of imported links, one scrape at a time."""
+    for link_id, user_id, url in jobs:
+        await _scrape_and_update(link_id, user_id, url)
+
+
+# Import readers by request Content-Type
+_IMPORT_READERS = {
+    "application/x-ndjson": read_ndjson,
+    "application/jsonl": read_ndjson,
+    "text/csv": read_csv,
+    "text/html": read_netscape_html,
+}
+
+# Export writer, media type and file extension by `format`
+_EXPORT_FORMATS = {
+    "ndjson": (write_ndjson, "application/x-ndjson", "ndjson"),
+    "csv": (write_csv, "text/csv; charset=utf-8", "csv"),
+    "html": (write_netscape_html, "text/html; charset=utf-8", "html"),
+}
+
+
+async def _export_chunks(user_id: uuid.UUID, writer, use_primary: bool) -> AsyncIterator[bytes]:
+    """
+    Stream an export from a read session of its own.
+
+    The request-scoped session is closed once the endpoint returns, before
+    the response body is sent, so the stream cannot borrow it.
+    """
+    async with database.read_session(use_primary=use_primary) as session:
+        use_case = ExportLinksUseCase(
+            PostgresLinkRepository(session), batch_size=settings.export_batch_size
+        )
+        async for chunk in writer(use_case.execute(user_id)):
+            yield chunk.encode()
 
 
 @router.post(
@@ -61,7 +182,11 @@ async def create_link(
     background_tasks: BackgroundTasks,
 ):
     repo = PostgresLinkRepository(db)
-    use_case = SaveLinkUseCase(repo)
+    use_case = SaveLinkUseCase(
+        repo,
+        page_repo=PostgresPageMetadataRepository(db),
+        page_max_age=timedelta(seconds=settings.page_metadata_ttl_seconds),
+    )
     link = await use_case.execute(
         user_id=current_user_id,
         url=body.url,
@@ -69,88 +194,193 @@ async def create_link(
         tags=body.tags,
     )
 
-    # Fire-and-forget metadata scraping
-    background_tasks.add_task(_scrape_and_update, link.id, link.url)
+    # Links to pages with fresh shared metadata need no scrape. Otherwise hand
+    # scraping to the worker queue; scrape in-process only if the queue is
+    # disabled or Redis is unreachable
+    if not link.is_processed:
+        # Commit first so a worker never picks up a job for an unseen row
+        await db.commit()
+        if not await enqueue_scrape_job(link.id, link.user_id, link.url):
+            background_tasks.add_task(_scrape_and_update, link.id, link.user_id, link.url)
 
-    return LinkResponse(
-        id=link.id,
-        user_id=link.user_id,
-        url=link.url,
-        title=link.title,
-        description=link.description,
-        metadata=link.metadata,
-        is_processed=link.is_processed,
-        tags=link.tags,
-        created_at=link.created_at,
-        updated_at=link.updated_at,
+    return _to_response(link)
+
+
+@router.post(
+    "/import",
+    response_model=LinkImportResponse,
+    summary="Bulk import links from NDJSON, CSV or Netscape bookmark HTML",
+    dependencies=[Depends(rate_limit_check)],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {media: {"schema": {"type": "string"}} for media in _IMPORT_READERS},
+        }
+    },
+)
+async def import_links(
+    request: Request,
+    db: DBSession,
+    current_user_id: CurrentUserId,
+    background_tasks: BackgroundTasks,
+):
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    reader = _IMPORT_READERS.get(media_type)
+    if reader is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Content-Type must be one of: {', '.join(_IMPORT_READERS)}",
+        )
+
+    use_case = ImportLinksUseCase(PostgresLinkRepository(db), batch_size=settings.import_batch_size)
+    rows: list[LinkImportRow] = []
+    # The body is parsed while it streams in; each batch is committed before
+    # its scrape jobs are enqueued so workers never see unknown link ids
+    async for batch in use_case.execute(current_user_id, reader(request.stream())):
+        await db.commit()
+        jobs = [
+            (r.link_id, current_user_id, r.url) for r in batch if r.status is ImportStatus.CREATED
+        ]
+        if jobs and not await enqueue_scrape_jobs(jobs):
+            background_tasks.add_task(_scrape_many, jobs)
+        rows.extend(LinkImportRow(**r.model_dump(mode="json")) for r in batch)
+
+    return LinkImportResponse(
+        created=sum(r.status == ImportStatus.CREATED for r in rows),
+        duplicates=sum(r.status == ImportStatus.DUPLICATE for r in rows),
+        invalid=sum(r.status == ImportStatus.INVALID for r in rows),
+        results=rows,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all saved links as NDJSON, CSV or Netscape bookmark HTML",
+    dependencies=[Depends(rate_limit_check)],
+)
+async def export_links(
+    current_user_id: CurrentUserId,
+    export_format: Literal["ndjson", "csv", "html"] = Query("ndjson", alias="format"),
+):
+    writer, media_type, extension = _EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        _export_chunks(
+            current_user_id, writer, use_primary=await reads_pinned_to_primary(current_user_id)
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="savelinks-export.{extension}"'},
     )
 
 
 @router.get(
     "",
     response_model=LinkListResponse,
+    response_model_exclude_unset=True,
     summary="List all saved links (paginated)",
     dependencies=[Depends(rate_limit_check)],
 )
 async def list_links(
-    db: DBSession,
+    db: ReadDBSession,
     current_user_id: CurrentUserId,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="`next_cursor` from the previous page"),
+    tag: list[str] | None = Query(None, description="Only links carrying all of these tags"),
+    fields: str | None = _FIELDS_QUERY,
+    view: Literal["full", "compact"] = _VIEW_QUERY,
 ):
     repo = PostgresLinkRepository(db)
     use_case = ListLinksUseCase(repo)
-    links = await use_case.execute(current_user_id, offset=offset, limit=limit)
-    items = [
-        LinkResponse(
-            id=l.id,
-            user_id=l.user_id,
-            url=l.url,
-            title=l.title,
-            description=l.description,
-            metadata=l.metadata,
-            is_processed=l.is_processed,
-            tags=l.tags,
-            created_at=l.created_at,
-            updated_at=l.updated_at,
-        )
-        for l in links
-    ]
-    return LinkListResponse(items=items, total=len(items), offset=offset, limit=limit)
+    requested = _requested_fields(fields, view)
+    page = await use_case.execute(
+        current_user_id, offset=offset, limit=limit, cursor=cursor, tags=tag, fields=requested
+    )
+    items = [_to_list_item(link, requested) for link in page.items]
+    return LinkListResponse(
+        items=items,
+        total=page.total if page.total is not None else len(items),
+        offset=offset,
+        limit=limit,
+        next_cursor=page.next_cursor,
+    )
 
 
 @router.get(
     "/search",
     response_model=LinkListResponse,
-    summary="Search links by title or URL",
+    response_model_exclude_unset=True,
+    summary="Search links by title or URL, or full-text with ranking",
     dependencies=[Depends(rate_limit_check)],
 )
 async def search_links(
-    db: DBSession,
+    db: ReadDBSession,
     current_user_id: CurrentUserId,
     q: str = Query(..., min_length=1, description="Search query"),
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="`next_cursor` from the previous page"),
+    mode: SearchMode = Query(
+        SearchMode.SUBSTRING,
+        description=(
+            "`substring` (newest first), `fulltext` or `fuzzy` (typo-tolerant); "
+            "the last two are ranked by relevance"
+        ),
+    ),
+    fields: str | None = _FIELDS_QUERY,
+    view: Literal["full", "compact"] = _VIEW_QUERY,
 ):
     repo = PostgresLinkRepository(db)
-    use_case = SearchLinksUseCase(repo)
-    links = await use_case.execute(current_user_id, q, offset=offset, limit=limit)
-    items = [
-        LinkResponse(
-            id=l.id,
-            user_id=l.user_id,
-            url=l.url,
-            title=l.title,
-            description=l.description,
-            metadata=l.metadata,
-            is_processed=l.is_processed,
-            tags=l.tags,
-            created_at=l.created_at,
-            updated_at=l.updated_at,
-        )
-        for l in links
-    ]
-    return LinkListResponse(items=items, total=len(items), offset=offset, limit=limit)
+    use_case = SearchLinksUseCase(repo, fuzzy_threshold=settings.search_fuzzy_threshold)
+    requested = _requested_fields(fields, view)
+    page = await use_case.execute(
+        current_user_id, q, offset=offset, limit=limit, cursor=cursor, mode=mode, fields=requested
+    )
+    items = [_to_list_item(link, requested) for link in page.items]
+    return LinkListResponse(
+        items=items,
+        total=len(items),
+        offset=offset,
+        limit=limit,
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.post(
+    "/bulk-delete",
+    response_model=BulkResultResponse,
+    summary="Delete every link matching ids or a filter",
+    dependencies=[Depends(rate_limit_check)],
+)
+async def bulk_delete_links(
+    body: LinkBulkDelete,
+    db: DBSession,
+    current_user_id: CurrentUserId,
+):
+    use_case = BulkDeleteLinksUseCase(PostgresLinkRepository(db), batch_size=settings.bulk_batch_size)
+    deleted = await use_case.execute(current_user_id, LinkFilter(**body.model_dump()))
+    return BulkResultResponse(count=deleted)
+
+
+@router.patch(
+    "/bulk",
+    response_model=BulkResultResponse,
+    summary="Add or remove tags on every link matching ids or a filter",
+    dependencies=[Depends(rate_limit_check)],
+)
+async def bulk_update_links(
+    body: LinkBulkUpdate,
+    db: DBSession,
+    current_user_id: CurrentUserId,
+):
+    use_case = BulkUpdateLinksUseCase(PostgresLinkRepository(db), batch_size=settings.bulk_batch_size)
+    matched = await use_case.execute(
+        current_user_id,
+        LinkFilter(**body.model_dump(exclude={"add_tags", "remove_tags"})),
+        add_tags=body.add_tags,
+        remove_tags=body.remove_tags,
+    )
+    return BulkResultResponse(count=matched)
 
 
 @router.get(
@@ -161,24 +391,13 @@ async def search_links(
 )
 async def get_link(
     link_id: uuid.UUID,
-    db: DBSession,
+    db: ReadDBSession,
     current_user_id: CurrentUserId,
 ):
     repo = PostgresLinkRepository(db)
     use_case = GetLinkUseCase(repo)
     link = await use_case.execute(link_id, current_user_id)
-    return LinkResponse(
-        id=link.id,
-        user_id=link.user_id,
-        url=link.url,
-        title=link.title,
-        description=link.description,
-        metadata=link.metadata,
-        is_processed=link.is_processed,
-        tags=link.tags,
-        created_at=link.created_at,
-        updated_at=link.updated_at,
-    )
+    return _to_response(link)
 
 
 @router.delete(
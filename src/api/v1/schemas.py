@@ -67,12 +67,78 @@ class LinkResponse(BaseModel):
     updated_at: datetime
 
 
+class LinkListItem(BaseModel):
+    """
+    Link in list responses. With `fields=` or `view=compact` only the
+    requested attributes are present; `id` always is.
+    """
+    id: uuid.UUID
+    user_id: uuid.UUID | None = None
+    url: str | None = None
+    title: str | None = None
+    description: str | None = None
+    metadata: dict[str, Any] | None = None
+    is_processed: bool | None = None
+    tags: list[str] | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
 class LinkListResponse(BaseModel):
-    """Paginated list of links."""
-    items: list[LinkResponse]
+    """Paginated list of links. Pass `next_cursor` back as `cursor` for the next page."""
+    items: list[LinkListItem]
     total: int
     offset: int
     limit: int
+    next_cursor: str | None = None
+
+
+class LinkImportRow(BaseModel):
+    """Outcome for one bookmark of an import: created, duplicate or invalid."""
+    row: int
+    url: str
+    status: str
+    link_id: uuid.UUID | None = None
+    error: str | None = None
+
+
+class LinkImportResponse(BaseModel):
+    """Summary and per-row results of a bulk import."""
+    created: int
+    duplicates: int
+    invalid: int
+    results: list[LinkImportRow]
+
+
+class LinkBulkDelete(BaseModel):
+    """Request body selecting links for a bulk operation; all given criteria must match."""
+    ids: list[uuid.UUID] | None = Field(None, max_length=10_000)
+    tag: str | None = Field(None, examples=["python"])
+    domain: str | None = Field(None, description="Host, subdomains included", examples=["github.com"])
+    older_than: datetime | None = None
+    unprocessed: bool | None = Field(None, description="Only links still waiting for metadata")
+
+
+class LinkBulkUpdate(LinkBulkDelete):
+    """Request body for bulk tagging: the selection plus the tags to add / remove."""
+    add_tags: list[str] = Field(default_factory=list, examples=[["archive"]])
+    remove_tags: list[str] = Field(default_factory=list, examples=[["inbox"]])
+
+
+class BulkResultResponse(BaseModel):
+    """Number of links a bulk operation deleted or matched."""
+    count: int
+
+
+class TagResponse(BaseModel):
+    """A tag and the number of links carrying it."""
+    name: str
+    link_count: int
+
+
+class TagListResponse(BaseModel):
+    """A user's tags, most used first."""
+    items: list[TagResponse]
 
 
 # ── Common Schemas ─────────────────────────────────────────────────
@@ -0,0 +1,31 @@
+"""
+Tag API endpoints.
+
+GET    /api/v1/tags           — List user's tags with link counts
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from src.api.common.dependencies import CurrentUserId, ReadDBSession, rate_limit_check
+from src.api.v1.schemas import TagListResponse, TagResponse
+from src.core.link.service.link_usecases import ListTagsUseCase
+from src.infrastructure.database.postgres_repository import PostgresTagRepository
+
+router = APIRouter(prefix="/tags", tags=["Tags"])
+
+
+@router.get(
+    "",
+    response_model=TagListResponse,
+    summary="List tags with link counts",
+    dependencies=[Depends(rate_limit_check)],
+)
+async def list_tags(db: ReadDBSession, current_user_id: CurrentUserId):
+    repo = PostgresTagRepository(db)
+    use_case = ListTagsUseCase(repo)
+    tags = await use_case.execute(current_user_id)
+    return TagListResponse(
+        items=[TagResponse(name=t.name, link_count=t.link_count) for t in tags]
+    )
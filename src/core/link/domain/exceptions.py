@@ -5,6 +5,10 @@ Each exception maps to a specific HTTP status code in the API layer.
 Domain code raises these; the API error handler translates them.
 """
 
+from __future__ import annotations
+
+import uuid
+
 
 class SaveLinksError(Exception):
     """Base exception for the SaveLinks domain."""
@@ -12,8 +16,15 @@ class SaveLinksError(Exception):
 
 
 class LinkAlreadyExistsError(SaveLinksError):
-    """Raised when a user tries to save a duplicate URL. → HTTP 409"""
-    pass
+    """
+    Raised when a user tries to save a duplicate URL. → HTTP 409
+
+    `duplicate_of` is the id of the link already saved, when known.
+    """
+
+    def __init__(self, message: str, duplicate_of: uuid.UUID | None = None) -> None:
+        super().__init__(message)
+        self.duplicate_of = duplicate_of
 
 
 class LinkNotFoundError(SaveLinksError):
@@ -26,6 +37,16 @@ class InvalidURLError(SaveLinksError):
     pass
 
 
+class InvalidCursorError(SaveLinksError):
+    """Raised when a pagination cursor is malformed, tampered with or not applicable. → HTTP 400"""
+    pass
+
+
+class InvalidFilterError(SaveLinksError):
+    """Raised when a bulk operation has no selection criteria or nothing to do. → HTTP 400"""
+    pass
+
+
 class UserNotFoundError(SaveLinksError):
     """Raised when a user cannot be found. → HTTP 404"""
     pass
@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from enum import Enum
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -37,6 +38,33 @@ class Tag(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     name: str
     user_id: uuid.UUID
+    link_count: int = 0
+
+
+class SearchMode(str, Enum):
+    """How link search matches the query."""
+
+    SUBSTRING = "substring"  # ILIKE on title / URL, newest first
+    FULLTEXT = "fulltext"  # Ranked full-text search over title, description, URL, og tags
+    FUZZY = "fuzzy"  # Typo-tolerant trigram similarity on title / URL
+
+
+# Link attributes clients can pick with sparse fieldsets (`fields=`)
+LINK_FIELDS = (
+    "id",
+    "user_id",
+    "url",
+    "title",
+    "description",
+    "metadata",
+    "is_processed",
+    "tags",
+    "created_at",
+    "updated_at",
+)
+
+# `view=compact`: enough to render a list row, without metadata or tags
+COMPACT_LINK_FIELDS = frozenset({"id", "url", "title", "is_processed", "created_at"})
 
 
 class Link(BaseModel):
@@ -59,3 +87,99 @@ class Link(BaseModel):
     tags: list[str] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=_utcnow)
     updated_at: datetime = Field(default_factory=_utcnow)
+
+
+class LinkFilter(BaseModel):
+    """
+    Selects a user's links for bulk operations; all given criteria must match.
+
+    `domain` matches the host and its subdomains, `older_than` the creation
+    time and `unprocessed` whether metadata is still to be scraped.
+    """
+
+    ids: list[uuid.UUID] | None = None
+    tag: str | None = None
+    domain: str | None = None
+    older_than: datetime | None = None
+    unprocessed: bool | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return all(value is None for value in self.model_dump().values())
+
+
+class PageMetadata(BaseModel):
+    """
+    Scraped metadata for a page, shared by every link to the same URL.
+
+    Keyed by the hash of the normalized URL so a popular page is scraped
+    and stored once, no matter how many users save it.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    url_hash: str
+    url: str
+    title: str | None = None
+    description: str | None = None
+    metadata: dict[str, Any] = Field(default_factory=dict)
+    fetched_at: datetime = Field(default_factory=_utcnow)
+
+
+class LinkMetadataUpdate(BaseModel):
+    """Scraped metadata to apply to one link (see `bulk_update_link_metadata`)."""
+
+    link_id: uuid.UUID
+    user_id: uuid.UUID  # The link's owner: its partition key
+    title: str | None = None
+    description: str | None = None
+    metadata: dict[str, Any] = Field(default_factory=dict)
+    page_hash: str | None = None
+
+
+class BookmarkEntry(BaseModel):
+    """
+    One bookmark read from an import file.
+
+    `row` is its 1-based position in the file. Entries the parser could not
+    read carry an `error` and are reported as invalid.
+    """
+
+    row: int
+    url: str = ""
+    title: str | None = None
+    tags: list[str] = Field(default_factory=list)
+    error: str | None = None
+
+
+class ImportStatus(str, Enum):
+    """Outcome of importing one bookmark."""
+
+    CREATED = "created"
+    DUPLICATE = "duplicate"  # Already saved, or repeated earlier in the file
+    INVALID = "invalid"
+
+
+class LinkImportResult(BaseModel):
+    """Per-row result of a bulk import."""
+
+    row: int
+    url: str
+    status: ImportStatus
+    link_id: uuid.UUID | None = None
+    error: str | None = None
+
+
+class LinkExportRow(NamedTuple):
+    """
+    One link as written by an export.
+
+    A plain tuple rather than a `Link`: exports stream whole libraries and
+    build no pydantic model per row.
+    """
+
+    url: str
+    title: str | None
+    description: str | None
+    tags: list[str]
+    created_at: datetime
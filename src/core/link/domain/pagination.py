@@ -0,0 +1,67 @@
+"""
+Keyset (cursor) pagination for link listings.
+
+Links are ordered by `(created_at DESC, id DESC)`. A page ends with the
+position of its last link, and the next page starts strictly after it, so
+the database seeks straight to that position through the
+`(user_id, created_at DESC, id DESC)` index instead of skipping rows —
+page N costs the same as page 1, and concurrent inserts do not shift pages.
+
+Cursors are opaque to clients: URL-safe base64 of the position.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from src.core.link.domain.exceptions import InvalidCursorError
+from src.core.link.domain.models import Link
+
+
+class LinkCursor(BaseModel):
+    """Position of a link in `(created_at DESC, id DESC)` order."""
+
+    created_at: datetime
+    id: uuid.UUID
+
+    @classmethod
+    def after(cls, link: Link) -> LinkCursor:
+        return cls(created_at=link.created_at, id=link.id)
+
+    def encode(self) -> str:
+        raw = json.dumps([self.created_at.isoformat(), str(self.id)]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> LinkCursor:
+        """Parse a cursor from `encode()`; raises InvalidCursorError if malformed."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            created_at, link_id = json.loads(raw)
+            return cls(created_at=datetime.fromisoformat(created_at), id=uuid.UUID(link_id))
+        except Exception as e:
+            raise InvalidCursorError("Invalid pagination cursor.") from e
+
+
+class LinkPage(BaseModel):
+    """
+    One page of links plus the cursor for the next page (None on the last).
+
+    `total` is the size of the whole result set when it is known cheaply.
+    """
+
+    items: list[Link] = Field(default_factory=list)
+    next_cursor: str | None = None
+    total: int | None = None
+
+    @classmethod
+    def from_rows(cls, rows: list[Link], limit: int) -> LinkPage:
+        """Build a page from up to `limit + 1` rows (the extra one signals more)."""
+        items = rows[:limit]
+        next_cursor = LinkCursor.after(items[-1]).encode() if len(rows) > limit else None
+        return cls(items=items, next_cursor=next_cursor)
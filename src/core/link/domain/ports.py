@@ -9,8 +9,20 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC, abstractmethod
-
-from src.core.link.domain.models import Link, User
+from datetime import timedelta
+from typing import AsyncIterator
+
+from src.core.link.domain.models import (
+    Link,
+    LinkExportRow,
+    LinkFilter,
+    LinkMetadataUpdate,
+    PageMetadata,
+    SearchMode,
+    Tag,
+    User,
+)
+from src.core.link.domain.pagination import LinkCursor
 
 
 class LinkRepositoryPort(ABC):
@@ -18,7 +30,21 @@ class LinkRepositoryPort(ABC):
 
     @abstractmethod
     async def save_link(self, link: Link) -> Link:
-        """Persist a new link. Raises LinkAlreadyExistsError if duplicate URL for user."""
+        """
+        Persist a new link with its tags (created on first use).
+
+        Raises LinkAlreadyExistsError if duplicate URL for user.
+        """
+        ...
+
+    @abstractmethod
+    async def insert_links(self, links: list[Link]) -> list[uuid.UUID]:
+        """
+        Persist many new links (and their tags) in one round trip per table.
+
+        Links whose URL the user already saved are skipped, not raised on.
+        Returns the ids of the links actually inserted.
+        """
         ...
 
     @abstractmethod
@@ -33,8 +59,20 @@ class LinkRepositoryPort(ABC):
         *,
         offset: int = 0,
         limit: int = 20,
+        after: LinkCursor | None = None,
+        tags: list[str] | None = None,
+        fields: frozenset[str] | None = None,
     ) -> list[Link]:
-        """Retrieve paginated links for a user, ordered by created_at desc."""
+        """
+        Retrieve paginated links for a user, ordered by (created_at, id) desc.
+
+        With `after`, returns the links strictly after that position (keyset
+        pagination) instead of skipping `offset` rows. With `tags`, only
+        links carrying every one of those tags are returned.
+
+        With `fields` (a subset of `LINK_FIELDS`), only those attributes are
+        loaded; the others keep their defaults on the returned links.
+        """
         ...
 
     @abstractmethod
@@ -45,8 +83,33 @@ class LinkRepositoryPort(ABC):
         *,
         offset: int = 0,
         limit: int = 20,
+        after: LinkCursor | None = None,
+        mode: SearchMode = SearchMode.SUBSTRING,
+        similarity_threshold: float = 0.3,
+        fields: frozenset[str] | None = None,
     ) -> list[Link]:
-        """Search links by title/url using ILIKE. Returns paginated results."""
+        """
+        Search a user's links.
+
+        `SUBSTRING` matches title/url with ILIKE and is paginated like
+        `get_links_by_user`. `FULLTEXT` and `FUZZY` order by relevance and
+        are paginated by `offset` only (`after` is ignored); `FUZZY` keeps
+        links whose title or URL word-similarity reaches
+        `similarity_threshold` (0–1). `fields` works as in
+        `get_links_by_user`.
+        """
+        ...
+
+    @abstractmethod
+    def export_links(
+        self, user_id: uuid.UUID, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[LinkExportRow]]:
+        """
+        Stream all of a user's links, oldest first, in batches of `batch_size`.
+
+        Rows come from a server-side cursor, so memory use does not grow
+        with the size of the library.
+        """
         ...
 
     @abstractmethod
@@ -54,15 +117,98 @@ class LinkRepositoryPort(ABC):
         """Delete a link. Returns True if deleted, False if not found."""
         ...
 
+    @abstractmethod
+    async def delete_links(
+        self, user_id: uuid.UUID, link_filter: LinkFilter, *, batch_size: int = 1000
+    ) -> int:
+        """
+        Delete the user's links matching `link_filter`, `batch_size` at a
+        time, within the caller's transaction. Link and tag counters are
+        adjusted. Returns the number of links deleted.
+        """
+        ...
+
+    @abstractmethod
+    async def retag_links(
+        self,
+        user_id: uuid.UUID,
+        link_filter: LinkFilter,
+        *,
+        add: list[str],
+        remove: list[str],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Remove the tags `remove`, then add the tags `add` (created on first
+        use), on the user's links matching `link_filter`, `batch_size` links
+        at a time. Tag counters are adjusted. Returns the number of links
+        matched.
+        """
+        ...
+
+    @abstractmethod
+    async def count_links(self, user_id: uuid.UUID, *, tag: str | None = None) -> int:
+        """
+        Total number of links saved by a user, or carrying `tag`.
+
+        O(1): read from maintained counters, never counted on the fly.
+        """
+        ...
+
     @abstractmethod
     async def update_link_metadata(
         self,
         link_id: uuid.UUID,
+        user_id: uuid.UUID,
         title: str | None,
         description: str | None,
         metadata: dict,
+        *,
+        page_hash: str | None = None,
     ) -> None:
-        """Update scraped metadata and mark link as processed."""
+        """
+        Update scraped metadata and mark link as processed.
+
+        With `page_hash`, the link references the shared page metadata entry
+        instead of storing its own copy of the metadata blob.
+        """
+        ...
+
+    @abstractmethod
+    async def bulk_update_link_metadata(self, updates: list[LinkMetadataUpdate]) -> int:
+        """
+        Apply `update_link_metadata` to many links in one statement.
+
+        Returns the number of links updated (missing links are skipped).
+        """
+        ...
+
+
+class TagRepositoryPort(ABC):
+    """Abstract interface for reading a user's tags."""
+
+    @abstractmethod
+    async def get_tags_by_user(self, user_id: uuid.UUID) -> list[Tag]:
+        """Tags in use by a user with their link counts, most used first."""
+        ...
+
+
+class PageMetadataRepositoryPort(ABC):
+    """Abstract interface for the cross-user page metadata store."""
+
+    @abstractmethod
+    async def get_fresh_page(self, url_hash: str, max_age: timedelta) -> PageMetadata | None:
+        """Retrieve page metadata fetched within `max_age`, or None."""
+        ...
+
+    @abstractmethod
+    async def upsert_page(self, page: PageMetadata) -> None:
+        """Insert or replace the metadata stored for a page."""
+        ...
+
+    @abstractmethod
+    async def upsert_pages(self, pages: list[PageMetadata]) -> None:
+        """Insert or replace the metadata stored for several pages at once."""
         ...
 
 
@@ -0,0 +1,79 @@
+"""
+URL normalization for the SaveLinks domain.
+
+Produces the canonical form used to recognize the same page — across users
+(shared page metadata) and within one user's library (duplicate links) —
+and its fixed-size hash. Pure Python — no infrastructure imports.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+
+# Ports implied by the scheme — dropped from the canonical form
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Query parameters that only track where a visitor came from
+_TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "gbraid",
+        "wbraid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_hsenc",
+        "_hsmi",
+    }
+)
+
+
+def _is_tracking_param(pair: str) -> bool:
+    name = pair.split("=", 1)[0].lower()
+    return name.startswith("utm_") or name in _TRACKING_PARAMS
+
+
+def _canonical_query(query: str) -> str:
+    """Drop empty and tracking parameters and sort the rest (encoding kept as is)."""
+    pairs = [pair for pair in query.split("&") if pair and not _is_tracking_param(pair)]
+    return "&".join(sorted(pairs))
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonicalize a URL for identity comparison.
+
+    Lowercases the scheme and host, drops default ports, the fragment and
+    tracking parameters (`utm_*`, `fbclid`, ...), sorts the query and uses
+    "/" for an empty path. http and https are treated as the same page.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:  # IPv6 literal
+        host = f"[{host}]"
+    port = parts.port
+    netloc = host if port is None or port == _DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+    if parts.username or parts.password:
+        userinfo = parts.username or ""
+        if parts.password:
+            userinfo += f":{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+    if scheme == "http":
+        scheme = "https"
+    return urlunsplit((scheme, netloc, parts.path or "/", _canonical_query(parts.query), ""))
+
+
+def url_digest(url: str) -> bytes:
+    """SHA-256 digest of the normalized URL (32 bytes)."""
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).digest()
+
+
+def url_hash(url: str) -> str:
+    """SHA-256 hex digest of the normalized URL (64 characters)."""
+    return url_digest(url).hex()
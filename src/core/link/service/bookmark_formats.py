@@ -0,0 +1,312 @@
+"""
+Readers and writers for bookmark import / export files.
+
+Each reader consumes an upload as a stream of byte chunks and yields
+`BookmarkEntry` objects as soon as they are complete, so an import never
+holds the whole file in memory. Each writer turns batches of
+`LinkExportRow` into text chunks, one per batch. Supported formats:
+
+- NDJSON: one JSON object per line, `{"url": ..., "title": ..., "tags": [...]}`
+- CSV: a header row with a `url` column and optional `title` / `tags`
+  columns (tags comma-separated within the field, themselves quoted
+  CSV-style when they contain a comma or quote)
+- Netscape bookmark HTML, as exported by browsers: `<A HREF=... TAGS=...>title</A>`
+
+Pure Python — no infrastructure imports.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import html
+import io
+import json
+from html.parser import HTMLParser
+from typing import Any, AsyncIterable, AsyncIterator
+
+from src.core.link.domain.models import BookmarkEntry, LinkExportRow
+
+# Longest NDJSON line or CSV record accepted; longer ones are invalid rows
+_MAX_LINE_LENGTH = 64 * 1024
+
+
+def _split_tags(value: Any) -> list[str]:
+    """Tags given as a list, or as one comma-separated string."""
+    if isinstance(value, str):
+        return value.split(",")
+    if isinstance(value, list):
+        return [tag for tag in value if isinstance(tag, str)]
+    return []
+
+
+def _split_csv_tags(value: str) -> list[str]:
+    """Tags from a CSV `tags` cell: one nested CSV record."""
+    return next(csv.reader(io.StringIO(value)), [])
+
+
+def _join_csv_tags(tags: list[str]) -> str:
+    """Inverse of `_split_csv_tags`; plain tags come out as `a,b`."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(tags)
+    return buffer.getvalue().removesuffix("\r\n")
+
+
+async def _decode(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """UTF-8 decode a byte stream (BOM tolerated) without splitting characters."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+async def _lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str | None]:
+    """
+    Split a byte stream into lines (without line endings).
+
+    A line longer than `_MAX_LINE_LENGTH` is discarded as it streams in and
+    yielded as None, so a body without newlines is never buffered whole.
+    """
+    pending: list[str] = []
+    size = 0
+    async for text in _decode(chunks):
+        *lines, tail = text.split("\n")
+        for line in lines:
+            if size + len(line) > _MAX_LINE_LENGTH:
+                yield None
+            else:
+                pending.append(line)
+                yield "".join(pending).rstrip("\r")
+            pending, size = [], 0
+        # Past the limit `size` keeps growing but nothing more is kept
+        size += len(tail)
+        if size <= _MAX_LINE_LENGTH:
+            pending.append(tail)
+        else:
+            pending = []
+    if size > _MAX_LINE_LENGTH:
+        yield None
+    elif size:
+        yield "".join(pending).rstrip("\r")
+
+
+_LINE_TOO_LONG = f"Line longer than {_MAX_LINE_LENGTH} characters."
+
+
+async def read_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[BookmarkEntry]:
+    """Read newline-delimited JSON objects; blank lines are skipped."""
+    row = 0
+    async for line in _lines(chunks):
+        if line is None:
+            row += 1
+            yield BookmarkEntry(row=row, error=_LINE_TOO_LONG)
+            continue
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield BookmarkEntry(row=row, error=f"Invalid JSON: {e}")
+            continue
+        if not isinstance(data, dict) or not isinstance(data.get("url"), str):
+            yield BookmarkEntry(row=row, error='Expected an object with a "url" string.')
+            continue
+        title = data.get("title")
+        yield BookmarkEntry(
+            row=row,
+            url=data["url"],
+            title=title if isinstance(title, str) else None,
+            tags=_split_tags(data.get("tags")),
+        )
+
+
+async def read_csv(chunks: AsyncIterable[bytes]) -> AsyncIterator[BookmarkEntry]:
+    """Read CSV rows keyed by the header row; quoted fields may span lines."""
+    header: list[str] | None = None
+    row = 0
+    record: list[str] = []
+    record_size = 0
+    in_quotes = False
+    async for line in _lines(chunks):
+        error = None
+        if line is None:
+            error = _LINE_TOO_LONG
+        else:
+            record.append(line)
+            record_size += len(line) + 1
+            # RFC 4180 escapes quotes by doubling them, so an odd count toggles
+            if line.count('"') % 2:
+                in_quotes = not in_quotes
+            if in_quotes and record_size > _MAX_LINE_LENGTH:
+                error = f"Record longer than {_MAX_LINE_LENGTH} characters."
+            elif in_quotes:
+                continue
+        if error is not None:
+            # The rest of the record cannot be told apart from the next one
+            record, record_size, in_quotes = [], 0, False
+            if header is None:
+                yield BookmarkEntry(row=1, error=f"Invalid CSV header: {error}")
+                return
+            row += 1
+            yield BookmarkEntry(row=row, error=error)
+            continue
+
+        fields = next(csv.reader(["\n".join(record)]), [])
+        record, record_size = [], 0
+        if not any(field.strip() for field in fields):
+            continue
+
+        if header is None:
+            header = [name.strip().lower() for name in fields]
+            if "url" not in header:
+                yield BookmarkEntry(row=1, error='CSV header must include a "url" column.')
+                return
+            continue
+
+        row += 1
+        values = dict(zip(header, fields))
+        yield BookmarkEntry(
+            row=row,
+            url=values.get("url", ""),
+            title=values.get("title") or None,
+            tags=_split_csv_tags(values.get("tags", "")),
+        )
+
+    if in_quotes:
+        error = "Unterminated quoted field at end of file."
+        if header is None:
+            yield BookmarkEntry(row=1, error=f"Invalid CSV header: {error}")
+        else:
+            yield BookmarkEntry(row=row + 1, error=error)
+
+
+class _NetscapeParser(HTMLParser):
+    """Collects `<A HREF>` bookmarks from a Netscape bookmark file."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.entries: list[BookmarkEntry] = []
+        self._row = 0
+        self._current: BookmarkEntry | None = None
+        self._title: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag != "a":
+            return
+        self._finish()
+        values = dict(attrs)
+        if not values.get("href"):
+            return
+        self._row += 1
+        self._current = BookmarkEntry(
+            row=self._row, url=values["href"], tags=_split_tags(values.get("tags") or "")
+        )
+        self._title = []
+
+    def handle_data(self, data: str) -> None:
+        if self._current is not None:
+            self._title.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a":
+            self._finish()
+
+    def close(self) -> None:
+        super().close()
+        self._finish()
+
+    def _finish(self) -> None:
+        if self._current is None:
+            return
+        self._current.title = "".join(self._title).strip() or None
+        self.entries.append(self._current)
+        self._current = None
+
+
+async def read_netscape_html(chunks: AsyncIterable[bytes]) -> AsyncIterator[BookmarkEntry]:
+    """Read bookmarks from a browser's Netscape-format HTML export."""
+    parser = _NetscapeParser()
+    async for text in _decode(chunks):
+        parser.feed(text)
+        for entry in parser.entries:
+            yield entry
+        parser.entries.clear()
+    parser.close()
+    for entry in parser.entries:
+        yield entry
+
+
+# ── Writers ────────────────────────────────────────────────────────
+
+
+async def write_ndjson(batches: AsyncIterable[list[LinkExportRow]]) -> AsyncIterator[str]:
+    """Write one JSON object per link, in the shape `read_ndjson` accepts."""
+    async for rows in batches:
+        yield "".join(
+            json.dumps(
+                {
+                    "url": row.url,
+                    "title": row.title,
+                    "description": row.description,
+                    "tags": row.tags,
+                    "created_at": row.created_at.isoformat(),
+                }
+            )
+            + "\n"
+            for row in rows
+        )
+
+
+async def write_csv(batches: AsyncIterable[list[LinkExportRow]]) -> AsyncIterator[str]:
+    """Write a header row, then one CSV row per link."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["url", "title", "description", "tags", "created_at"])
+    async for rows in batches:
+        writer.writerows(
+            (
+                row.url,
+                row.title or "",
+                row.description or "",
+                _join_csv_tags(row.tags),
+                row.created_at.isoformat(),
+            )
+            for row in rows
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+_NETSCAPE_HEADER = (
+    "<!DOCTYPE NETSCAPE-Bookmark-file-1>\n"
+    '<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">\n'
+    "<TITLE>Bookmarks</TITLE>\n"
+    "<H1>Bookmarks</H1>\n"
+    "<DL><p>\n"
+)
+
+
+def _netscape_entry(row: LinkExportRow) -> str:
+    attrs = f'HREF="{html.escape(row.url)}" ADD_DATE="{int(row.created_at.timestamp())}"'
+    if row.tags:
+        attrs += f' TAGS="{html.escape(",".join(row.tags))}"'
+    entry = f"<DT><A {attrs}>{html.escape(row.title or row.url, quote=False)}</A>\n"
+    if row.description:
+        entry += f"<DD>{html.escape(row.description, quote=False)}\n"
+    return entry
+
+
+async def write_netscape_html(batches: AsyncIterable[list[LinkExportRow]]) -> AsyncIterator[str]:
+    """Write a Netscape bookmark file that browsers (and `read_netscape_html`) import."""
+    yield _NETSCAPE_HEADER
+    async for rows in batches:
+        yield "".join(_netscape_entry(row) for row in rows)
+    yield "</DL><p>\n"
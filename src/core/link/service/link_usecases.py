@@ -8,15 +8,34 @@ They MUST NOT import infrastructure code (SQLAlchemy, FastAPI, Redis, etc.).
 from __future__ import annotations
 
 import uuid
+from datetime import timedelta
+from typing import AsyncIterable, AsyncIterator
 from urllib.parse import urlparse
 
 from src.core.link.domain.exceptions import (
+    InvalidCursorError,
+    InvalidFilterError,
     InvalidURLError,
     LinkAlreadyExistsError,
     LinkNotFoundError,
 )
-from src.core.link.domain.models import Link
-from src.core.link.domain.ports import LinkRepositoryPort
+from src.core.link.domain.models import (
+    BookmarkEntry,
+    ImportStatus,
+    Link,
+    LinkExportRow,
+    LinkFilter,
+    LinkImportResult,
+    SearchMode,
+    Tag,
+)
+from src.core.link.domain.pagination import LinkCursor, LinkPage
+from src.core.link.domain.ports import (
+    LinkRepositoryPort,
+    PageMetadataRepositoryPort,
+    TagRepositoryPort,
+)
+from src.core.link.domain.urls import url_hash
 
 
 def _validate_url(url: str) -> str:
@@ -27,6 +46,7 @@ def _validate_url(url: str) -> str:
             raise InvalidURLError(f"URL must use http or https scheme, got: {result.scheme!r}")
         if not result.netloc:
             raise InvalidURLError("URL must have a valid domain.")
+        result.port  # Raises ValueError for an out-of-range port
         return url.strip()
     except InvalidURLError:
         raise
@@ -34,11 +54,33 @@ def _validate_url(url: str) -> str:
         raise InvalidURLError(f"Invalid URL format: {e}") from e
 
 
+# Matches the tags.name column length
+_MAX_TAG_LENGTH = 100
+
+
+def _normalize_tags(tags: list[str] | None) -> list[str]:
+    """Strip, drop empty and de-duplicate tag names, keeping their order."""
+    names = (tag.strip()[:_MAX_TAG_LENGTH] for tag in tags or [])
+    return list(dict.fromkeys(name for name in names if name))
+
+
 class SaveLinkUseCase:
-    """Validates and persists a new link for a user."""
+    """
+    Validates and persists a new link for a user.
 
-    def __init__(self, link_repo: LinkRepositoryPort) -> None:
+    If the shared page metadata store already holds a fresh entry for the
+    URL, the link is attached to it right away and needs no scrape.
+    """
+
+    def __init__(
+        self,
+        link_repo: LinkRepositoryPort,
+        page_repo: PageMetadataRepositoryPort | None = None,
+        page_max_age: timedelta = timedelta(days=7),
+    ) -> None:
         self._link_repo = link_repo
+        self._page_repo = page_repo
+        self._page_max_age = page_max_age
 
     async def execute(
         self,
@@ -53,14 +95,127 @@ class SaveLinkUseCase:
             user_id=user_id,
             url=validated_url,
             title=title,
-            tags=tags or [],
+            tags=_normalize_tags(tags),
+        )
+
+        saved = await self._link_repo.save_link(link)
+        if self._page_repo is None:
+            return saved
+
+        page = await self._page_repo.get_fresh_page(url_hash(saved.url), self._page_max_age)
+        if page is None:
+            return saved
+
+        await self._link_repo.update_link_metadata(
+            link_id=saved.id,
+            user_id=saved.user_id,
+            title=page.title,
+            description=page.description,
+            metadata=page.metadata,
+            page_hash=page.url_hash,
+        )
+        return saved.model_copy(
+            update={
+                "title": page.title or saved.title,
+                "description": page.description or saved.description,
+                "metadata": page.metadata,
+                "is_processed": True,
+            }
         )
 
-        return await self._link_repo.save_link(link)
+
+class ImportLinksUseCase:
+    """
+    Imports a stream of bookmarks for a user.
+
+    Entries are validated and de-duplicated as they arrive and inserted
+    `batch_size` at a time with `insert_links`, which skips URLs the user
+    already saved. Results are yielded per batch, in file order, so the
+    caller can commit and enqueue scrapes while the upload is still read.
+    """
+
+    def __init__(self, link_repo: LinkRepositoryPort, batch_size: int = 500) -> None:
+        self._link_repo = link_repo
+        self._batch_size = max(1, batch_size)
+
+    async def execute(
+        self,
+        user_id: uuid.UUID,
+        entries: AsyncIterable[BookmarkEntry],
+    ) -> AsyncIterator[list[LinkImportResult]]:
+        seen: set[str] = set()  # Normalized URL hashes
+        results: list[LinkImportResult] = []
+        pending: list[tuple[LinkImportResult, Link]] = []
+
+        async for entry in entries:
+            result = LinkImportResult(row=entry.row, url=entry.url, status=ImportStatus.INVALID)
+            results.append(result)
+            if entry.error:
+                result.error = entry.error
+            else:
+                try:
+                    result.url = _validate_url(entry.url)
+                    key = url_hash(result.url)
+                except InvalidURLError as e:
+                    result.error = str(e)
+                except ValueError as e:
+                    # Normalization is stricter than validation; fail the row only
+                    result.error = f"Invalid URL format: {e}"
+                else:
+                    if key in seen:
+                        result.status = ImportStatus.DUPLICATE
+                    else:
+                        seen.add(key)
+                        link = Link(
+                            user_id=user_id,
+                            url=result.url,
+                            title=entry.title,
+                            tags=_normalize_tags(entry.tags),
+                        )
+                        pending.append((result, link))
+
+            if len(results) >= self._batch_size:
+                yield await self._insert(results, pending)
+                results, pending = [], []
+
+        if results:
+            yield await self._insert(results, pending)
+
+    async def _insert(
+        self,
+        results: list[LinkImportResult],
+        pending: list[tuple[LinkImportResult, Link]],
+    ) -> list[LinkImportResult]:
+        inserted = set(await self._link_repo.insert_links([link for _, link in pending]))
+        for result, link in pending:
+            if link.id in inserted:
+                result.status = ImportStatus.CREATED
+                result.link_id = link.id
+            else:
+                result.status = ImportStatus.DUPLICATE
+        return results
+
+
+class ExportLinksUseCase:
+    """Streams a user's whole library in batches, oldest first."""
+
+    def __init__(self, link_repo: LinkRepositoryPort, batch_size: int = 1000) -> None:
+        self._link_repo = link_repo
+        self._batch_size = max(1, batch_size)
+
+    def execute(self, user_id: uuid.UUID) -> AsyncIterator[list[LinkExportRow]]:
+        return self._link_repo.export_links(user_id, batch_size=self._batch_size)
 
 
 class ListLinksUseCase:
-    """Returns paginated links for a user."""
+    """
+    Returns paginated links for a user.
+
+    Pass the previous page's `next_cursor` as `cursor` for keyset
+    pagination; `offset` is only used when no cursor is given. `tags`
+    narrows the listing to links carrying all of them; `fields` limits the
+    attributes loaded per link (see `LINK_FIELDS`).
+    """
 
     def __init__(self, link_repo: LinkRepositoryPort) -> None:
         self._link_repo = link_repo
@@ -70,16 +225,37 @@ class ListLinksUseCase:
         user_id: uuid.UUID,
         offset: int = 0,
         limit: int = 20,
-    ) -> list[Link]:
+        cursor: str | None = None,
+        tags: list[str] | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> LinkPage:
         limit = min(limit, 100)  # Hard cap to prevent abuse
-        return await self._link_repo.get_links_by_user(user_id, offset=offset, limit=limit)
+        tags = _normalize_tags(tags)
+        after = LinkCursor.decode(cursor) if cursor else None
+        # One extra row tells whether another page follows
+        rows = await self._link_repo.get_links_by_user(
+            user_id, offset=offset, limit=limit + 1, after=after, tags=tags, fields=fields
+        )
+        page = LinkPage.from_rows(rows, limit)
+        # Counters exist per user and per tag; tag intersections have none
+        if not tags:
+            page.total = await self._link_repo.count_links(user_id)
+        elif len(tags) == 1:
+            page.total = await self._link_repo.count_links(user_id, tag=tags[0])
+        return page
 
 
 class SearchLinksUseCase:
-    """Searches links by title/url using server-side query."""
+    """
+    Searches links using a server-side query.
 
-    def __init__(self, link_repo: LinkRepositoryPort) -> None:
+    Substring results are newest first and cursor-paginated; full-text and
+    fuzzy results are ordered by relevance and paginated by offset.
+    """
+
+    def __init__(self, link_repo: LinkRepositoryPort, fuzzy_threshold: float = 0.3) -> None:
         self._link_repo = link_repo
+        self._fuzzy_threshold = fuzzy_threshold
 
     async def execute(
         self,
@@ -87,13 +263,44 @@ class SearchLinksUseCase:
         query: str,
         offset: int = 0,
         limit: int = 20,
-    ) -> list[Link]:
+        cursor: str | None = None,
+        mode: SearchMode = SearchMode.SUBSTRING,
+        fields: frozenset[str] | None = None,
+    ) -> LinkPage:
         if not query or not query.strip():
-            return []
+            return LinkPage()
         limit = min(limit, 100)
-        return await self._link_repo.search_links(
-            user_id, query.strip(), offset=offset, limit=limit
+
+        if mode is not SearchMode.SUBSTRING:
+            # Relevance order has no stable (created_at, id) position to seek to
+            if cursor:
+                raise InvalidCursorError("Cursors are not supported for ranked search; use offset.")
+            rows = await self._link_repo.search_links(
+                user_id,
+                query.strip(),
+                offset=offset,
+                limit=limit,
+                mode=mode,
+                similarity_threshold=self._fuzzy_threshold,
+                fields=fields,
+            )
+            return LinkPage(items=rows)
+
+        after = LinkCursor.decode(cursor) if cursor else None
+        rows = await self._link_repo.search_links(
+            user_id, query.strip(), offset=offset, limit=limit + 1, after=after, fields=fields
         )
+        return LinkPage.from_rows(rows, limit)
+
+
+class ListTagsUseCase:
+    """Returns a user's tags with their link counts."""
+
+    def __init__(self, tag_repo: TagRepositoryPort) -> None:
+        self._tag_repo = tag_repo
+
+    async def execute(self, user_id: uuid.UUID) -> list[Tag]:
+        return await self._tag_repo.get_tags_by_user(user_id)
 
 
 class GetLinkUseCase:
@@ -119,3 +326,63 @@ class DeleteLinkUseCase:
         deleted = await self._link_repo.delete_link(link_id, user_id)
         if not deleted:
             raise LinkNotFoundError(f"Link {link_id} not found.")
+
+
+def _normalize_filter(link_filter: LinkFilter) -> LinkFilter:
+    """Reject filters that would select a whole library; tidy tag and domain."""
+    update = {}
+    if link_filter.tag is not None:
+        update["tag"] = link_filter.tag.strip()
+    if link_filter.domain is not None:
+        domain = link_filter.domain.strip().lower().removeprefix("www.")
+        if not domain:
+            raise InvalidFilterError("Domain filter must name a host.")
+        update["domain"] = domain
+    link_filter = link_filter.model_copy(update=update)
+    if link_filter.is_empty:
+        raise InvalidFilterError("Give link ids or at least one filter criterion.")
+    return link_filter
+
+
+class BulkDeleteLinksUseCase:
+    """Deletes every link of a user matching a filter."""
+
+    def __init__(self, link_repo: LinkRepositoryPort, batch_size: int = 1000) -> None:
+        self._link_repo = link_repo
+        self._batch_size = max(1, batch_size)
+
+    async def execute(self, user_id: uuid.UUID, link_filter: LinkFilter) -> int:
+        return await self._link_repo.delete_links(
+            user_id, _normalize_filter(link_filter), batch_size=self._batch_size
+        )
+
+
+class BulkUpdateLinksUseCase:
+    """
+    Adds and removes tags on every link of a user matching a filter.
+
+    A tag named in both lists ends up added.
+    """
+
+    def __init__(self, link_repo: LinkRepositoryPort, batch_size: int = 1000) -> None:
+        self._link_repo = link_repo
+        self._batch_size = max(1, batch_size)
+
+    async def execute(
+        self,
+        user_id: uuid.UUID,
+        link_filter: LinkFilter,
+        add_tags: list[str] | None = None,
+        remove_tags: list[str] | None = None,
+    ) -> int:
+        add = _normalize_tags(add_tags)
+        remove = [tag for tag in _normalize_tags(remove_tags) if tag not in add]
+        if not add and not remove:
+            raise InvalidFilterError("Nothing to update: give tags to add or remove.")
+        return await self._link_repo.retag_links(
+            user_id,
+            _normalize_filter(link_filter),
+            add=add,
+            remove=remove,
+            batch_size=self._batch_size,
+        )
@@ -1,5 +1,5 @@
 """
-Redis client adapter for JWT blacklist and rate limiting.
+Redis client adapter for JWT blacklist, rate limiting and read-replica pinning.
 
 Uses the redis.asyncio client for non-blocking operations.
 Gracefully degrades if Redis is unavailable (logs warning, doesn't crash).
@@ -60,6 +60,28 @@ async def is_token_blacklisted(token: str) -> bool:
         return False  # Fail open — if Redis is down, don't block users
 
 
+# ── Read-your-writes pinning ──────────────────────────────────────
+
+
+async def pin_to_primary(user_id: str, seconds: float) -> None:
+    """Send the user's reads to the primary for `seconds` (after they wrote)."""
+    try:
+        r = await get_redis()
+        await r.set(f"pin:{user_id}", "1", px=max(1, int(seconds * 1000)))
+    except Exception as e:
+        logger.warning(f"Failed to pin {user_id} to the primary in Redis: {e}")
+
+
+async def is_pinned_to_primary(user_id: str) -> bool:
+    """Check whether the user wrote recently and must read from the primary."""
+    try:
+        r = await get_redis()
+        return await r.exists(f"pin:{user_id}") > 0
+    except Exception as e:
+        logger.warning(f"Failed to check primary pin in Redis: {e}")
+        return True  # Fail safe — without the marker, only the primary is fresh
+
+
 # ── Rate Limiting (Sliding Window) ─────────────────────────────────
 
 
@@ -2,9 +2,21 @@
 Async SQLAlchemy engine and session factory for PostgreSQL.
 
 Provides the database connection pool and session lifecycle management.
+Reads may be spread over optional replicas (`database_replica_urls`); writes
+always go to the primary `engine`.
 """
 
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -12,14 +24,26 @@ from sqlalchemy.ext.asyncio import (
 
 from src.infrastructure.config import settings
 
-# Create async engine with connection pooling
-engine = create_async_engine(
-    settings.database_url,
-    echo=(settings.app_env == "development"),
-    pool_size=20,
-    max_overflow=10,
-    pool_pre_ping=True,
-)
+logger = logging.getLogger("SaveLinks.database")
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Async engine with connection pooling."""
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        # Sized for the repository's precompiled statements and their variants
+        connect_args["prepared_statement_cache_size"] = settings.database_prepared_statement_cache_size
+    return create_async_engine(
+        url,
+        echo=(settings.app_env == "development"),
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+    )
+
+
+engine = _create_engine(settings.database_url)
 
 # Session factory — each request gets its own session
 async_session_factory = async_sessionmaker(
@@ -40,3 +64,85 @@ async def get_async_session() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+# ── Read replicas ──────────────────────────────────────────────────
+
+
+class ReplicaPool:
+    """
+    Round-robin over read replica engines.
+
+    A replica that fails is skipped for `retry_after` seconds, after which
+    it is tried again; with every replica down, `choose()` returns None and
+    reads fall back to the primary.
+    """
+
+    def __init__(self, engines: list[AsyncEngine], retry_after: float = 30.0) -> None:
+        self._engines = engines
+        self._retry_after = retry_after
+        self._down_until = [0.0] * len(engines)
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def choose(self) -> AsyncEngine | None:
+        now = time.monotonic()
+        for _ in range(len(self._engines)):
+            index = self._next
+            self._next = (self._next + 1) % len(self._engines)
+            if self._down_until[index] <= now:
+                return self._engines[index]
+        return None
+
+    def mark_down(self, replica: AsyncEngine) -> None:
+        index = self._engines.index(replica)
+        self._down_until[index] = time.monotonic() + self._retry_after
+        logger.warning(
+            f"Read replica {replica.url.host} marked down for {self._retry_after:.0f}s."
+        )
+
+    async def dispose(self) -> None:
+        for replica in self._engines:
+            await replica.dispose()
+
+
+replica_pool = ReplicaPool(
+    [_create_engine(url.strip()) for url in settings.database_replica_urls.split(",") if url.strip()],
+    retry_after=settings.database_replica_retry_seconds,
+)
+
+
+async def _replica_session() -> AsyncSession | None:
+    """A session on the next healthy replica, connected up front; None if none is up."""
+    while (replica := replica_pool.choose()) is not None:
+        session = async_session_factory(bind=replica)
+        try:
+            await session.connection()
+            return session
+        except (DBAPIError, OSError) as e:
+            await session.close()
+            logger.warning(f"Read replica {replica.url.host} unavailable: {e}")
+            replica_pool.mark_down(replica)
+    return None
+
+
+@asynccontextmanager
+async def read_session(use_primary: bool = False) -> AsyncIterator[AsyncSession]:
+    """
+    Session for read-only work: a replica when configured and healthy,
+    otherwise (or with `use_primary`) the primary. Never commits.
+    """
+    session = None if use_primary or not replica_pool else await _replica_session()
+    replica = session.bind if session is not None else None
+    if session is None:
+        session = async_session_factory()
+    try:
+        yield session
+    except DBAPIError as e:
+        if replica is not None and e.connection_invalidated:
+            replica_pool.mark_down(replica)
+        raise
+    finally:
+        await session.close()
@@ -0,0 +1,510 @@
+"""
+Schema versioning and migrations.
+
+DDL is applied only by `python -m src.manage migrate`. Application and
+worker processes call `check_schema()` at startup instead: one primary-key
+lookup on `schema_version`, rather than `create_all`'s catalog queries over
+every table and index (and its DDL listeners) on each boot.
+
+Migrations are ordered `(version, description, step)` entries; `step`
+upgrades a database from the previous version, running on the migrating
+connection, and everything a run applies commits in one transaction. Add a
+new entry — never edit an applied one — whenever the ORM models change.
+Steps build tables from frozen snapshots (`V1_METADATA`, `V2_METADATA`),
+never from the live models, so what a step does never changes.
+
+A database without a recorded version is adopted first:
+
+- empty: created from the current models and recorded at `SCHEMA_VERSION`
+- the original schema (`V1_METADATA`, as created on boot by early releases):
+  recorded at version 1, then upgraded by the steps below
+- already matching the current models: recorded at `SCHEMA_VERSION`
+
+Anything else is refused rather than recorded as a version it is not.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import uuid
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    Text,
+    Uuid,
+    and_,
+    event,
+    func,
+    inspect,
+    literal,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.link.domain.urls import url_digest
+from src.infrastructure.database.orm_models import (
+    LINK_PARTITIONS,
+    Base,
+    CompatibleJSON,
+    schema_version,
+)
+
+logger = logging.getLogger("SaveLinks.database")
+
+
+# ── Version 1: the original schema (frozen snapshot) ───────────────
+
+V1_METADATA = MetaData()
+
+Table(
+    "users",
+    V1_METADATA,
+    Column("id", Uuid, primary_key=True),
+    Column("username", String(150), nullable=False, unique=True, index=True),
+    Column("hashed_password", Text, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+)
+Table(
+    "links",
+    V1_METADATA,
+    Column("id", Uuid, primary_key=True),
+    Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    Column("url", Text, nullable=False),
+    Column("title", Text),
+    Column("description", Text),
+    Column("metadata", CompatibleJSON, nullable=False),
+    Column("is_processed", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+    Index("ix_links_user_url", "user_id", "url", unique=True),
+    Index("ix_links_user_id", "user_id"),
+)
+Table(
+    "tags",
+    V1_METADATA,
+    Column("id", Uuid, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    Index("ix_tags_user_name", "user_id", "name", unique=True),
+)
+Table(
+    "link_tags",
+    V1_METADATA,
+    Column("link_id", ForeignKey("links.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+)
+
+
+# ── Version 2: partition-ready keys, url_digest, counters, search ──
+
+# Frozen snapshot of the version 2 tables and their backend-specific DDL;
+# later model changes get their own step, never an edit here
+V2_METADATA = MetaData()
+
+# Hash partitioning is deployment configuration, not schema shape
+_V2_PARTITION_ARGS = {"postgresql_partition_by": "HASH (user_id)"} if LINK_PARTITIONS else {}
+
+Table(
+    "users",
+    V2_METADATA,
+    Column("id", Uuid, primary_key=True),
+    Column("username", String(150), nullable=False, unique=True, index=True),
+    Column("hashed_password", Text, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+)
+Table(
+    "page_metadata",
+    V2_METADATA,
+    Column("url_hash", String(64), primary_key=True),
+    Column("url", Text, nullable=False),
+    Column("title", Text),
+    Column("description", Text),
+    Column("metadata", CompatibleJSON, nullable=False),
+    Column("fetched_at", DateTime(timezone=True), nullable=False),
+)
+_v2_links = Table(
+    "links",
+    V2_METADATA,
+    Column("id", Uuid, primary_key=True),
+    Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column("url", Text, nullable=False),
+    Column("url_digest", LargeBinary(32), nullable=False),
+    Column("title", Text),
+    Column("description", Text),
+    Column("metadata", CompatibleJSON, nullable=False),
+    Column("page_hash", ForeignKey("page_metadata.url_hash", ondelete="SET NULL")),
+    Column("is_processed", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+    Index("ix_links_user_url_digest", "user_id", "url_digest", unique=True),
+    Index("ix_links_page_hash", "page_hash"),
+    **_V2_PARTITION_ARGS,
+)
+Index(
+    "ix_links_user_created_id",
+    _v2_links.c.user_id,
+    _v2_links.c.created_at.desc(),
+    _v2_links.c.id.desc(),
+)
+Table(
+    "tags",
+    V2_METADATA,
+    Column("id", Uuid, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    Column("link_count", Integer, nullable=False),
+    Index("ix_tags_user_name", "user_id", "name", unique=True),
+)
+_v2_link_tags = Table(
+    "link_tags",
+    V2_METADATA,
+    Column("link_id", Uuid, primary_key=True),
+    Column("tag_id", ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Column("user_id", Uuid, primary_key=True),
+    ForeignKeyConstraint(
+        ["link_id", "user_id"], ["links.id", "links.user_id"], ondelete="CASCADE"
+    ),
+    Index("ix_link_tags_tag_link", "tag_id", "link_id"),
+    **_V2_PARTITION_ARGS,
+)
+Table(
+    "user_link_counts",
+    V2_METADATA,
+    Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column("link_count", Integer, nullable=False),
+)
+
+_V2_PG_LINKS_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_links_title_gin ON links USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_links_url_gin ON links USING gin (url gin_trgm_ops)",
+    "ALTER TABLE links ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('simple', regexp_replace(url, '\\W+', ' ', 'g')), 'C') || "
+    "setweight(jsonb_to_tsvector('simple', "
+    "coalesce(metadata -> 'og', '{}'::jsonb), '[\"string\"]'), 'D')"
+    ") STORED",
+    "CREATE INDEX IF NOT EXISTS ix_links_search_vector ON links USING gin (search_vector)",
+)
+_V2_SQLITE_FTS_ROW = (
+    "new.rowid, new.title, new.description, new.url, json_extract(new.metadata, '$.og')"
+)
+_V2_SQLITE_LINKS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS links_fts USING fts5(title, description, url, og)",
+    "CREATE TRIGGER IF NOT EXISTS links_fts_insert AFTER INSERT ON links BEGIN "
+    f"INSERT INTO links_fts (rowid, title, description, url, og) VALUES ({_V2_SQLITE_FTS_ROW}); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS links_fts_delete AFTER DELETE ON links BEGIN "
+    "DELETE FROM links_fts WHERE rowid = old.rowid; "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS links_fts_update AFTER UPDATE ON links BEGIN "
+    "DELETE FROM links_fts WHERE rowid = old.rowid; "
+    f"INSERT INTO links_fts (rowid, title, description, url, og) VALUES ({_V2_SQLITE_FTS_ROW}); "
+    "END",
+)
+
+
+def _v2_partitions(target, connection, **kw):
+    if connection.dialect.name != "postgresql" or not LINK_PARTITIONS:
+        return
+    for remainder in range(LINK_PARTITIONS):
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {target.name}_p{remainder} "
+                f"PARTITION OF {target.name} "
+                f"FOR VALUES WITH (MODULUS {LINK_PARTITIONS}, REMAINDER {remainder})"
+            )
+        )
+
+
+def _v2_links_ddl(target, connection, **kw):
+    """Trigram indexes and full-text search structures of version 2."""
+    statements = {
+        "postgresql": _V2_PG_LINKS_DDL,
+        "sqlite": _V2_SQLITE_LINKS_DDL,
+    }.get(connection.dialect.name, ())
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+event.listen(_v2_links, "after_create", _v2_partitions)
+event.listen(_v2_links, "after_create", _v2_links_ddl)
+event.listen(_v2_link_tags, "after_create", _v2_partitions)
+
+# Tables rebuilt by version 2 (in drop order) and the v1 index names that
+# would collide with the new tables' indexes
+_V1_REBUILT = ("link_tags", "links", "tags")
+_V1_INDEXES = ("ix_links_user_url", "ix_links_user_id", "ix_tags_user_name", "ix_links_title_gin")
+
+_COPY_BATCH_SIZE = 1000
+
+
+def _insert(connection: Connection):
+    return pg_insert if connection.dialect.name == "postgresql" else sqlite_insert
+
+
+def _v1_digest(url: str) -> bytes:
+    try:
+        return url_digest(url)
+    except ValueError:
+        # Saved before URLs were validated this strictly: hash it as stored
+        return hashlib.sha256(url.strip().encode("utf-8")).digest()
+
+
+def _copy_links(connection: Connection, old: Table) -> dict[uuid.UUID, uuid.UUID]:
+    """
+    Copy v1 links oldest first, computing url_digest.
+
+    v1 compared raw URLs, so one user may have saved several variants of a
+    normalized URL; the oldest is kept and the others are merged into it
+    (see `_merge_link`). Returns the dropped ids mapped to the kept ones.
+    """
+    links = V2_METADATA.tables["links"]
+    insert = _insert(connection)
+    merged: dict[uuid.UUID, uuid.UUID] = {}
+    last: tuple | None = None
+    while True:
+        stmt = select(old).order_by(old.c.created_at, old.c.id).limit(_COPY_BATCH_SIZE)
+        if last is not None:
+            stmt = stmt.where(
+                or_(
+                    old.c.created_at > last[0],
+                    and_(old.c.created_at == last[0], old.c.id > last[1]),
+                )
+            )
+        rows = connection.execute(stmt).mappings().all()
+        if not rows:
+            return merged
+        last = rows[-1]["created_at"], rows[-1]["id"]
+        rows = [{**row, "url_digest": _v1_digest(row["url"])} for row in rows]
+        stmt = (
+            insert(links)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["user_id", "url_digest"])
+            .returning(links.c.id)
+        )
+        inserted = set(connection.execute(stmt).scalars())
+        for row in rows:
+            if row["id"] not in inserted:
+                merged[row["id"]] = _merge_link(connection, row)
+
+
+def _merge_link(connection: Connection, row: dict) -> uuid.UUID:
+    """Fill the kept link's missing title / description from a dropped variant."""
+    links = V2_METADATA.tables["links"]
+    kept = connection.execute(
+        update(links)
+        .where(links.c.user_id == row["user_id"], links.c.url_digest == row["url_digest"])
+        .values(
+            title=func.coalesce(links.c.title, row["title"]),
+            description=func.coalesce(links.c.description, row["description"]),
+        )
+        .returning(links.c.id, links.c.url)
+    ).one()
+    logger.warning(
+        f"Merged link {row['id']} ({row['url']}) into {kept.id} ({kept.url}) of user "
+        f"{row['user_id']}: the same URL after normalization."
+    )
+    return kept.id
+
+
+def _upgrade_to_v2(connection: Connection) -> None:
+    """
+    Rebuild links, tags and link_tags from `V2_METADATA` and copy the
+    data over: (id, user_id) keys with user_id on link_tags (hash
+    partitioning), url_digest, page_hash, maintained counters and the
+    backend's full-text search structures.
+    """
+    postgresql = connection.dialect.name == "postgresql"
+    for name in _V1_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    for name in _V1_REBUILT:
+        connection.execute(text(f"ALTER TABLE {name} RENAME TO {name}_v1"))
+        if postgresql:
+            connection.execute(text(f"ALTER INDEX IF EXISTS {name}_pkey RENAME TO {name}_v1_pkey"))
+    V2_METADATA.create_all(connection)
+
+    old = {
+        name: V1_METADATA.tables[name].to_metadata(MetaData(), name=f"{name}_v1")
+        for name in _V1_REBUILT
+    }
+    users, tags, links, link_tags, user_link_counts = (
+        V2_METADATA.tables[name]
+        for name in ("users", "tags", "links", "link_tags", "user_link_counts")
+    )
+    connection.execute(
+        tags.insert().from_select(
+            ["id", "name", "user_id", "link_count"],
+            select(old["tags"].c.id, old["tags"].c.name, old["tags"].c.user_id, literal(0)),
+        )
+    )
+    merged = _copy_links(connection, old["links"])
+    connection.execute(
+        link_tags.insert().from_select(
+            ["link_id", "tag_id", "user_id"],
+            select(old["link_tags"].c.link_id, old["link_tags"].c.tag_id, links.c.user_id).join(
+                links, links.c.id == old["link_tags"].c.link_id
+            ),
+        )
+    )
+    # A merged link's tags move to the link it was merged into
+    insert = _insert(connection)
+    for dropped_id, kept_id in merged.items():
+        connection.execute(
+            insert(link_tags)
+            .from_select(
+                ["link_id", "tag_id", "user_id"],
+                select(literal(kept_id, Uuid), old["link_tags"].c.tag_id, links.c.user_id)
+                .join(links, links.c.id == kept_id)
+                .where(old["link_tags"].c.link_id == dropped_id),
+            )
+            .on_conflict_do_nothing()
+        )
+    if merged:
+        logger.warning(f"Merged {len(merged)} links duplicating another after URL normalization.")
+
+    # Backfill the maintained counters
+    tagged = (
+        select(func.count())
+        .select_from(link_tags)
+        .where(link_tags.c.tag_id == tags.c.id)
+        .scalar_subquery()
+    )
+    connection.execute(update(tags).values(link_count=tagged))
+    connection.execute(
+        user_link_counts.insert().from_select(
+            ["user_id", "link_count"],
+            select(users.c.id, func.count(links.c.id))
+            .outerjoin(links, links.c.user_id == users.c.id)
+            .group_by(users.c.id),
+        )
+    )
+
+    for name in _V1_REBUILT:
+        connection.execute(text(f"DROP TABLE {name}_v1"))
+
+
+_MIGRATIONS = [
+    (1, "Original schema: users, links, tags", V1_METADATA.create_all),
+    (2, "Partition-ready keys, url_digest, shared page metadata, counters and search", _upgrade_to_v2),
+]
+
+SCHEMA_VERSION = _MIGRATIONS[-1][0]
+
+# Serializes concurrent `migrate` runs on PostgreSQL (arbitrary, app-wide key)
+_MIGRATION_LOCK_KEY = 0x5A7E_11C5
+
+_CURRENT_VERSION = select(func.max(schema_version.c.version))
+
+
+class SchemaVersionError(RuntimeError):
+    """The database schema is not the one this release expects."""
+
+
+def _matches(columns: dict[str, set[str]], metadata: MetaData, *, exact: bool) -> bool:
+    for table in metadata.sorted_tables:
+        if table.name == schema_version.name:
+            continue
+        expected = set(table.c.keys())
+        found = columns.get(table.name, set())
+        # Backend-only columns (e.g. links.search_vector) are not mapped
+        if not (found == expected if exact else found >= expected):
+            return False
+    return True
+
+
+def _adopt(connection: Connection) -> int:
+    """Create or recognize the schema of a database without a recorded version."""
+    inspector = inspect(connection)
+    columns = {
+        name: {column["name"] for column in inspector.get_columns(name)}
+        for name in inspector.get_table_names()
+        if name != schema_version.name
+    }
+    if not columns:
+        Base.metadata.create_all(connection)
+        version, description = SCHEMA_VERSION, "Created from the current models"
+    elif _matches(columns, V1_METADATA, exact=True):
+        version, description = 1, _MIGRATIONS[0][1]
+    elif _matches(columns, Base.metadata, exact=False):
+        version, description = SCHEMA_VERSION, "Adopted schema matching the current models"
+    else:
+        raise SchemaVersionError(
+            f"Database has tables ({', '.join(sorted(columns))}) matching no known schema "
+            "version; refusing to record a version for it."
+        )
+    logger.info(f"Unversioned database recorded at schema version {version}: {description}")
+    connection.execute(schema_version.insert().values(version=version, description=description))
+    return version
+
+
+async def get_schema_version(engine: AsyncEngine) -> int:
+    """Highest applied migration; 0 for a database that was never migrated."""
+    async with engine.connect() as conn:
+        try:
+            return (await conn.execute(_CURRENT_VERSION)).scalar() or 0
+        except DBAPIError:
+            # No schema_version table (connection errors surface above)
+            return 0
+
+
+async def check_schema(engine: AsyncEngine) -> int:
+    """
+    Verify the database is migrated for this release; returns its version.
+
+    A newer schema is accepted (migrations run before a rolling deploy
+    replaces the old processes) and only logged.
+    """
+    version = await get_schema_version(engine)
+    if version < SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Database schema is at version {version}, this release needs "
+            f"{SCHEMA_VERSION}: run `python -m src.manage migrate`."
+        )
+    if version > SCHEMA_VERSION:
+        logger.warning(
+            f"Database schema is at version {version}, newer than this release ({SCHEMA_VERSION})."
+        )
+    return version
+
+
+async def migrate(engine: AsyncEngine) -> int:
+    """Apply pending migrations in one transaction; returns the resulting version."""
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY}
+            )
+        await conn.run_sync(schema_version.create, checkfirst=True)
+        current = (await conn.execute(_CURRENT_VERSION)).scalar() or 0
+        if not current:
+            current = await conn.run_sync(_adopt)
+        for version, description, step in _MIGRATIONS:
+            if version <= current:
+                continue
+            logger.info(f"Applying schema migration {version}: {description}")
+            await conn.run_sync(step)
+            await conn.execute(
+                schema_version.insert().values(version=version, description=description)
+            )
+            current = version
+    return current
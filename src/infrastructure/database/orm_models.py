@@ -7,10 +7,25 @@ The domain layer never imports from here; mapping happens in the repository adap
 Uses `JSON.with_variant(JSONB, "postgresql")` so the same models work with both
 PostgreSQL (JSONB) and SQLite (JSON) backends. GIN indexes are PostgreSQL-only
 and are skipped during SQLite table creation.
+
+Relationships are `lazy="raise"`: nothing is loaded implicitly, every query
+states the relationships it needs (see the repository's loader options), so
+resolving a user never drags in their whole library.
+
+Full-text search is backend-specific DDL: a weighted `tsvector` generated
+column with a GIN index on PostgreSQL, an FTS5 table kept in sync by
+triggers on SQLite. Neither is mapped; queries reference them by name.
+
+`links` and `link_tags` can be hash-partitioned by `user_id` on PostgreSQL
+(`database_link_partitions`). Both tables carry `user_id` in their primary
+key, and the link_tags → links foreign key includes it, as partitioned
+tables require; every repository query filters on `user_id`, so each one
+touches a single partition.
 """
 
 from __future__ import annotations
 
+import re
 import uuid
 from datetime import datetime, timezone
 
@@ -19,17 +34,24 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    ForeignKeyConstraint,
     Index,
+    Integer,
     JSON,
+    LargeBinary,
     String,
     Table,
     Text,
+    Uuid,
     text,
     event,
 )
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from src.infrastructure.config import settings
+
 
 # Cross-backend compatible JSON column: JSONB on PostgreSQL, JSON on others
 CompatibleJSON = JSON().with_variant(JSONB, "postgresql")
@@ -40,12 +62,24 @@ class Base(DeclarativeBase):
     pass
 
 
-# M:N association table for links ↔ tags
+# Hash partitioning of links / link_tags by user_id (PostgreSQL only)
+LINK_PARTITIONS = max(settings.database_link_partitions, 0)
+_PARTITION_ARGS = {"postgresql_partition_by": "HASH (user_id)"} if LINK_PARTITIONS else {}
+
+
+# M:N association table for links ↔ tags; user_id is the link's owner
 link_tags = Table(
     "link_tags",
     Base.metadata,
-    Column("link_id", ForeignKey("links.id", ondelete="CASCADE"), primary_key=True),
+    Column("link_id", Uuid, primary_key=True),
     Column("tag_id", ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Column("user_id", Uuid, primary_key=True),
+    ForeignKeyConstraint(
+        ["link_id", "user_id"], ["links.id", "links.user_id"], ondelete="CASCADE"
+    ),
+    # Tag-filtered listing: tag → links (the PK only serves link → tags)
+    Index("ix_link_tags_tag_link", "tag_id", "link_id"),
+    **_PARTITION_ARGS,
 )
 
 
@@ -68,11 +102,12 @@ class UserModel(Base):
     )
 
     # Relationships
+    # ON DELETE CASCADE removes a user's rows; never load them for that
     links: Mapped[list["LinkModel"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
     tags: Mapped[list["TagModel"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
 
 
@@ -89,16 +124,26 @@ class LinkModel(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
     )
+    # Part of the key so that links can be partitioned by user
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
+        primary_key=True,
     )
     url: Mapped[str] = mapped_column(Text, nullable=False)
+    # SHA-256 of the normalized URL: fixed-size duplicate detection key
+    url_digest: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     title: Mapped[str | None] = mapped_column(Text, nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     metadata_json: Mapped[dict] = mapped_column(
         "metadata", CompatibleJSON, default=dict, nullable=False
     )
+    # Shared scraped metadata; when set, `metadata` keeps only the OpenGraph
+    # values, which full-text search indexes
+    page_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        ForeignKey("page_metadata.url_hash", ondelete="SET NULL"),
+        nullable=True,
+    )
     is_processed: Mapped[bool] = mapped_column(
         Boolean, default=False, nullable=False
     )
@@ -115,32 +160,221 @@ class LinkModel(Base):
     )
 
     # Relationships
-    user: Mapped["UserModel"] = relationship(back_populates="links")
+    user: Mapped["UserModel"] = relationship(back_populates="links", lazy="raise")
     tags: Mapped[list["TagModel"]] = relationship(
-        secondary=link_tags, back_populates="links", lazy="selectin"
+        secondary=link_tags, back_populates="links", lazy="raise"
     )
+    page: Mapped["PageMetadataModel | None"] = relationship(lazy="raise")
 
     __table_args__ = (
-        # Unique constraint: one URL per user
-        Index("ix_links_user_url", "user_id", "url", unique=True),
-        # B-Tree index on user_id for fast user-scoped queries
-        Index("ix_links_user_id", "user_id"),
+        # Unique constraint: one URL per user, compared in normalized form
+        Index("ix_links_user_url_digest", "user_id", "url_digest", unique=True),
+        # Links referencing a shared page (FK lookups / ON DELETE SET NULL)
+        Index("ix_links_page_hash", "page_hash"),
+        _PARTITION_ARGS,
+    )
+
+
+# Keyset pagination: a user's links in (created_at, id) desc order. Also
+# serves plain user_id lookups, so no separate user_id index is needed.
+Index(
+    "ix_links_user_created_id",
+    LinkModel.user_id,
+    LinkModel.created_at.desc(),
+    LinkModel.id.desc(),
+)
+
+
+class PageMetadataModel(Base):
+    """
+    ORM model for the page_metadata table.
+
+    Scraped metadata shared across users, keyed by the SHA-256 hex digest of
+    the normalized URL. Links point here instead of each storing a copy of
+    the OpenGraph / Twitter Card blob.
+    """
+
+    __tablename__ = "page_metadata"
+
+    url_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    title: Mapped[str | None] = mapped_column(Text, nullable=True)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    metadata_json: Mapped[dict] = mapped_column(
+        "metadata", CompatibleJSON, default=dict, nullable=False
+    )
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class UserLinkCountModel(Base):
+    """
+    ORM model for the user_link_counts table.
+
+    Per-user link counter, maintained in the same transaction as every link
+    insert/delete so listing endpoints can report a real total without a
+    COUNT(*) over the user's links. `python -m src.manage reconcile-counters`
+    repairs any drift.
+    """
+
+    __tablename__ = "user_link_counts"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
     )
+    link_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
 
-# PostgreSQL-only GIN trigram index — created via DDL event listener
+# PostgreSQL-only GIN trigram indexes — created via DDL event listener
 # This is skipped entirely on non-PostgreSQL backends (e.g., SQLite in tests)
 _GIN_INDEX_SQL = text(
     "CREATE INDEX IF NOT EXISTS ix_links_title_gin "
     "ON links USING gin (title gin_trgm_ops)"
 )
+_GIN_URL_INDEX_SQL = text(
+    "CREATE INDEX IF NOT EXISTS ix_links_url_gin "
+    "ON links USING gin (url gin_trgm_ops)"
+)
+
+
+def _create_hash_partitions(target, connection, **kw):
+    """Create the partitions of a table declared `PARTITION BY HASH (user_id)`."""
+    if connection.dialect.name != "postgresql" or not LINK_PARTITIONS:
+        return
+    for remainder in range(LINK_PARTITIONS):
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {target.name}_p{remainder} "
+                f"PARTITION OF {target.name} "
+                f"FOR VALUES WITH (MODULUS {LINK_PARTITIONS}, REMAINDER {remainder})"
+            )
+        )
+
+
+event.listen(LinkModel.__table__, "after_create", _create_hash_partitions)
+event.listen(link_tags, "after_create", _create_hash_partitions)
 
 
 @event.listens_for(LinkModel.__table__, "after_create")
 def _create_gin_index(target, connection, **kw):
-    """Create GIN trigram index only on PostgreSQL."""
+    """Create GIN trigram indexes (ILIKE and fuzzy search) only on PostgreSQL."""
     if connection.dialect.name == "postgresql":
         connection.execute(_GIN_INDEX_SQL)
+        connection.execute(_GIN_URL_INDEX_SQL)
+
+
+def _trigrams(value: str) -> set[str]:
+    """pg_trgm-style trigrams: lowercased words padded with "  " / " "."""
+    grams = set()
+    for word in re.findall(r"\w+", value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def word_similarity(needle: str | None, haystack: str | None) -> float | None:
+    """
+    Stand-in for pg_trgm's `word_similarity()` on SQLite (tests).
+
+    Best trigram similarity between `needle` and any run of consecutive
+    words in `haystack` — close to, not identical with, pg_trgm's extents.
+    """
+    if needle is None or haystack is None:
+        return None
+    target = _trigrams(needle)
+    if not target:
+        return 0.0
+    words = re.findall(r"\w+", haystack)
+    span = len(re.findall(r"\w+", needle)) + 1
+    best = 0.0
+    for start in range(len(words)):
+        for end in range(start + 1, min(start + span, len(words)) + 1):
+            grams = _trigrams(" ".join(words[start:end]))
+            best = max(best, len(target & grams) / len(target | grams))
+    return best
+
+
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    """Make `word_similarity()` available to fuzzy search on SQLite."""
+    if "sqlite" in type(dbapi_connection).__module__:
+        dbapi_connection.create_function("word_similarity", 2, word_similarity, deterministic=True)
+
+
+# ── Full-text search ───────────────────────────────────────────────
+
+# Text search configuration: no stemming or stop words, so titles in any
+# language are indexed as written
+FTS_CONFIG = "simple"
+
+# PostgreSQL: weighted generated tsvector (title A, description B, URL words C,
+# OpenGraph string values D) with a GIN index
+_PG_FTS_SQL = (
+    text(
+        "ALTER TABLE links ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('{FTS_CONFIG}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{FTS_CONFIG}', coalesce(description, '')), 'B') || "
+        f"setweight(to_tsvector('{FTS_CONFIG}', regexp_replace(url, '\\W+', ' ', 'g')), 'C') || "
+        f"setweight(jsonb_to_tsvector('{FTS_CONFIG}', "
+        "coalesce(metadata -> 'og', '{}'::jsonb), '[\"string\"]'), 'D')"
+        ") STORED"
+    ),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_links_search_vector "
+        "ON links USING gin (search_vector)"
+    ),
+)
+
+# SQLite (tests): FTS5 table keyed by the links rowid, maintained by triggers
+_SQLITE_FTS_ROW = (
+    "new.rowid, new.title, new.description, new.url, json_extract(new.metadata, '$.og')"
+)
+_SQLITE_FTS_SQL = (
+    text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS links_fts "
+        "USING fts5(title, description, url, og)"
+    ),
+    text(
+        "CREATE TRIGGER IF NOT EXISTS links_fts_insert AFTER INSERT ON links BEGIN "
+        f"INSERT INTO links_fts (rowid, title, description, url, og) VALUES ({_SQLITE_FTS_ROW}); "
+        "END"
+    ),
+    text(
+        "CREATE TRIGGER IF NOT EXISTS links_fts_delete AFTER DELETE ON links BEGIN "
+        "DELETE FROM links_fts WHERE rowid = old.rowid; "
+        "END"
+    ),
+    text(
+        "CREATE TRIGGER IF NOT EXISTS links_fts_update AFTER UPDATE ON links BEGIN "
+        "DELETE FROM links_fts WHERE rowid = old.rowid; "
+        f"INSERT INTO links_fts (rowid, title, description, url, og) VALUES ({_SQLITE_FTS_ROW}); "
+        "END"
+    ),
+)
+
+
+@event.listens_for(LinkModel.__table__, "after_create")
+def _create_fts(target, connection, **kw):
+    """Create the backend's full-text search structures."""
+    if connection.dialect.name == "postgresql":
+        statements = _PG_FTS_SQL
+    elif connection.dialect.name == "sqlite":
+        statements = _SQLITE_FTS_SQL
+    else:
+        return
+    for statement in statements:
+        connection.execute(statement)
+
+
+@event.listens_for(LinkModel.__table__, "before_drop")
+def _drop_sqlite_fts(target, connection, **kw):
+    """The FTS5 table is not part of the metadata — drop it with `links`."""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("DROP TABLE IF EXISTS links_fts"))
 
 
 class TagModel(Base):
@@ -156,14 +390,32 @@ class TagModel(Base):
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
+    # Links carrying this tag, maintained with link_tags inserts/deletes
+    link_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Relationships
-    user: Mapped["UserModel"] = relationship(back_populates="tags")
+    user: Mapped["UserModel"] = relationship(back_populates="tags", lazy="raise")
     links: Mapped[list["LinkModel"]] = relationship(
-        secondary=link_tags, back_populates="tags", lazy="selectin"
+        secondary=link_tags, back_populates="tags", lazy="raise"
     )
 
     __table_args__ = (
         # Unique tag name per user
         Index("ix_tags_user_name", "user_id", "name", unique=True),
     )
+
+
+# Applied schema migrations, one row each (see migrations.py); startup reads
+# the highest version through the primary key
+schema_version = Table(
+    "schema_version",
+    Base.metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("description", Text, nullable=False),
+    Column(
+        "applied_at",
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    ),
+)
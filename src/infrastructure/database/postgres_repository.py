@@ -7,19 +7,291 @@ via async SQLAlchemy. The domain layer never imports this directly.
 
 from __future__ import annotations
 
+import re
 import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import AsyncIterator, Iterator, Mapping
 
-from sqlalchemy import delete, select, or_
+from sqlalchemy import (
+    Integer,
+    Select,
+    String,
+    Text,
+    Uuid,
+    bindparam,
+    column,
+    delete,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    true,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
 from src.core.link.domain.exceptions import (
     LinkAlreadyExistsError,
     UserAlreadyExistsError,
 )
-from src.core.link.domain.models import Link, User
-from src.core.link.domain.ports import LinkRepositoryPort, UserRepositoryPort
-from src.infrastructure.database.orm_models import LinkModel, UserModel
+from src.core.link.domain.models import (
+    LINK_FIELDS,
+    Link,
+    LinkExportRow,
+    LinkFilter,
+    LinkMetadataUpdate,
+    PageMetadata,
+    SearchMode,
+    Tag,
+    User,
+)
+from src.core.link.domain.pagination import LinkCursor
+from src.core.link.domain.urls import url_digest
+from src.core.link.domain.ports import (
+    LinkRepositoryPort,
+    PageMetadataRepositoryPort,
+    TagRepositoryPort,
+    UserRepositoryPort,
+)
+from src.infrastructure.database.orm_models import (
+    FTS_CONFIG,
+    CompatibleJSON,
+    LinkModel,
+    PageMetadataModel,
+    TagModel,
+    UserLinkCountModel,
+    UserModel,
+    link_tags,
+)
+
+
+_ALL_FIELDS = frozenset(LINK_FIELDS)
+
+# Joins tag names aggregated per link in exports (ASCII unit separator)
+_TAG_SEPARATOR = "\x1f"
+
+# Columns behind each optional Link attribute (sparse fieldsets)
+_FIELD_COLUMNS = {
+    "title": (LinkModel.title,),
+    "description": (LinkModel.description,),
+    "metadata": (LinkModel.metadata_json, LinkModel.page_hash),
+    "is_processed": (LinkModel.is_processed,),
+    "updated_at": (LinkModel.updated_at,),
+}
+
+# Always loaded: required by the domain model and by keyset pagination
+_BASE_COLUMNS = (LinkModel.id, LinkModel.user_id, LinkModel.url, LinkModel.created_at)
+
+
+def _select_links(fields: frozenset[str] | None = None) -> Select:
+    """
+    SELECT of links loading exactly what `_to_domain` reads for `fields`.
+
+    With `fields`, only the matching columns are fetched, and the tags
+    query / page join are skipped unless tags / metadata are requested.
+    """
+    page = joinedload(LinkModel.page).load_only(PageMetadataModel.metadata_json)
+    if fields is None:
+        return select(LinkModel).options(selectinload(LinkModel.tags), page)
+
+    columns = list(_BASE_COLUMNS)
+    for name in fields & _FIELD_COLUMNS.keys():
+        columns.extend(_FIELD_COLUMNS[name])
+    options = [load_only(*columns, raiseload=True)]
+    if "tags" in fields:
+        options.append(selectinload(LinkModel.tags))
+    if "metadata" in fields:
+        options.append(page)
+    return select(LinkModel).options(*options)
+
+
+# ── Precompiled statements ──────────────────────────────────────────
+# Hot queries are built once, with bind parameters, instead of on every
+# call: no per-request construction, and SQLAlchemy's compiled cache and
+# asyncpg's prepared statement cache see the very same statement each time.
+
+_GET_LINK = _select_links().where(
+    LinkModel.id == bindparam("link_id"),
+    LinkModel.user_id == bindparam("user_id"),
+)
+
+_LINK_ID_BY_DIGEST = select(LinkModel.id).where(
+    LinkModel.user_id == bindparam("user_id"),
+    LinkModel.url_digest == bindparam("url_digest"),
+)
+
+_USER_LINK_COUNT = select(UserLinkCountModel.link_count).where(
+    UserLinkCountModel.user_id == bindparam("user_id")
+)
+
+_TAG_LINK_COUNT = select(TagModel.link_count).where(
+    TagModel.user_id == bindparam("user_id"),
+    TagModel.name == bindparam("tag"),
+)
+
+
+@lru_cache(maxsize=256)
+def _links_page_stmt(
+    fields: frozenset[str] | None, *, keyset: bool, tag_count: int, search: bool
+) -> Select:
+    """
+    One page of a user's links, built once per query shape.
+
+    Binds `user_id` and `limit`, plus `after_created_at` / `after_id` with
+    `keyset` (else `offset`), `tag_0`… for each tag filter and `pattern`
+    (an ILIKE pattern on title / URL) with `search`.
+    """
+    stmt = _select_links(fields).where(LinkModel.user_id == bindparam("user_id"))
+    for i in range(tag_count):
+        # One semi-join per tag: ix_tags_user_name → ix_link_tags_tag_link
+        tagged = (
+            select(link_tags.c.link_id)
+            .join(TagModel, TagModel.id == link_tags.c.tag_id)
+            .where(
+                link_tags.c.user_id == bindparam("user_id"),
+                TagModel.user_id == bindparam("user_id"),
+                TagModel.name == bindparam(f"tag_{i}"),
+            )
+        )
+        stmt = stmt.where(LinkModel.id.in_(tagged))
+    if search:
+        pattern = bindparam("pattern", type_=Text)
+        stmt = stmt.where(or_(LinkModel.title.ilike(pattern), LinkModel.url.ilike(pattern)))
+
+    stmt = stmt.order_by(LinkModel.created_at.desc(), LinkModel.id.desc()).limit(
+        bindparam("limit", type_=Integer)
+    )
+    if keyset:
+        # Row-value comparison matches the composite index order exactly
+        after = tuple_(
+            bindparam("after_created_at", type_=LinkModel.created_at.type),
+            bindparam("after_id", type_=LinkModel.id.type),
+        )
+        return stmt.where(tuple_(LinkModel.created_at, LinkModel.id) < after)
+    return stmt.offset(bindparam("offset", type_=Integer))
+
+
+def _page_params(
+    user_id: uuid.UUID, *, offset: int, limit: int, after: LinkCursor | None
+) -> dict:
+    """Bind values for `_links_page_stmt`."""
+    params = {"user_id": user_id, "limit": limit}
+    if after is not None:
+        params.update(after_created_at=after.created_at, after_id=after.id)
+    else:
+        params["offset"] = offset
+    return params
+
+
+def _filter_clauses(user_id: uuid.UUID, link_filter: LinkFilter) -> list:
+    """WHERE clauses selecting the user's links that match `link_filter`."""
+    clauses = [LinkModel.user_id == user_id]
+    if link_filter.ids is not None:
+        clauses.append(LinkModel.id.in_(link_filter.ids))
+    if link_filter.tag is not None:
+        tagged = (
+            select(link_tags.c.link_id)
+            .join(TagModel, TagModel.id == link_tags.c.tag_id)
+            .where(
+                link_tags.c.user_id == user_id,
+                TagModel.user_id == user_id,
+                TagModel.name == link_filter.tag,
+            )
+        )
+        clauses.append(LinkModel.id.in_(tagged))
+    if link_filter.domain is not None:
+        # Host or any subdomain, anchored to the URL's authority (past any
+        # userinfo, before any port); SQLAlchemy provides REGEXP on SQLite
+        host = re.sub(r"[^\w]", lambda m: "\\" + m.group(), link_filter.domain.lower())
+        clauses.append(
+            func.lower(LinkModel.url).regexp_match(
+                rf"^[a-z][a-z0-9+.-]*://([^/?#@]*@)?([^/?#@]*\.)?{host}(:[0-9]*)?([/?#]|$)"
+            )
+        )
+    if link_filter.older_than is not None:
+        clauses.append(LinkModel.created_at < link_filter.older_than)
+    if link_filter.unprocessed is not None:
+        clauses.append(LinkModel.is_processed.is_(not link_filter.unprocessed))
+    return clauses
+
+
+def _link_metadata(metadata: dict, page_hash: str | None) -> dict:
+    """
+    The metadata blob stored on a link row.
+
+    When the link references page_metadata, only the OpenGraph values are
+    kept on the row: full-text search indexes them from there.
+    """
+    if not page_hash:
+        return metadata
+    og = metadata.get("og")
+    return {"og": og} if og else {}
+
+
+def _fts5_query(query: str) -> str:
+    """Quote each word so user input cannot use FTS5 query syntax (implicit AND)."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
+
+def _fulltext_filter(session: AsyncSession, stmt: Select, query: str) -> Select:
+    """Restrict `stmt` to full-text matches of `query`, best match first."""
+    if session.bind.dialect.name == "postgresql":
+        vector = literal_column("links.search_vector")
+        tsquery = func.websearch_to_tsquery(literal_column(f"'{FTS_CONFIG}'::regconfig"), query)
+        return stmt.where(vector.op("@@")(tsquery)).order_by(func.ts_rank(vector, tsquery).desc())
+
+    # SQLite FTS5; bm25 is lower-is-better, column weights mirror A/B/C/D
+    fts = table("links_fts", column("rowid"))
+    return (
+        stmt.join(fts, fts.c.rowid == literal_column("links.rowid"))
+        .where(literal_column("links_fts").op("MATCH")(_fts5_query(query)))
+        .order_by(func.bm25(literal_column("links_fts"), 8.0, 4.0, 2.0, 1.0))
+    )
+
+
+def _fuzzy_filter(session: AsyncSession, stmt: Select, query: str, threshold: float) -> Select:
+    """Restrict `stmt` to title/URL trigram matches of `query`, most similar first."""
+    title_score = func.word_similarity(query, func.coalesce(LinkModel.title, ""))
+    url_score = func.word_similarity(query, LinkModel.url)
+    if session.bind.dialect.name == "postgresql":
+        # `<%` compares against pg_trgm.word_similarity_threshold (set by the
+        # caller) and is served by the title / url GIN trigram indexes
+        needle = literal(query)
+        return stmt.where(
+            or_(needle.op("<%")(LinkModel.title), needle.op("<%")(LinkModel.url))
+        ).order_by(func.greatest(title_score, url_score).desc())
+
+    # SQLite (tests): word_similarity() is a Python stand-in, see orm_models
+    score = func.max(title_score, url_score)
+    return stmt.where(score >= threshold).order_by(score.desc())
+
+
+def _dialect_insert(session: AsyncSession):
+    """INSERT construct with ON CONFLICT support for the session's backend."""
+    if session.bind.dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
+
+
+# Bind parameters one statement may carry (asyncpg / the PostgreSQL protocol)
+_MAX_BIND_PARAMS = 32_767
+
+
+def _values_batches(rows: list[dict]) -> Iterator[list[dict]]:
+    """Split the rows of a multi-row VALUES so each statement fits `_MAX_BIND_PARAMS`."""
+    size = max(_MAX_BIND_PARAMS // len(rows[0]), 1) if rows else 1
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
 
 
 class PostgresLinkRepository(LinkRepositoryPort):
@@ -31,28 +303,157 @@ class PostgresLinkRepository(LinkRepositoryPort):
     # ── Mapping helpers ─────────────────────────────────────────────
 
     @staticmethod
-    def _to_domain(row: LinkModel) -> Link:
-        """Convert ORM model → domain entity."""
-        return Link(
-            id=row.id,
-            user_id=row.user_id,
-            url=row.url,
-            title=row.title,
-            description=row.description,
-            metadata=row.metadata_json or {},
-            is_processed=row.is_processed,
-            tags=[t.name for t in row.tags] if row.tags else [],
-            created_at=row.created_at,
-            updated_at=row.updated_at,
+    def _to_domain(row: LinkModel, fields: frozenset[str] | None = None) -> Link:
+        """
+        Convert ORM model → domain entity.
+
+        With `fields`, only those attributes are read (the row was loaded by
+        `_select_links(fields)`); the others keep their defaults.
+        """
+        if fields is None:
+            fields = _ALL_FIELDS
+        link = Link(id=row.id, user_id=row.user_id, url=row.url, created_at=row.created_at)
+        if "title" in fields:
+            link.title = row.title
+        if "description" in fields:
+            link.description = row.description
+        if "metadata" in fields:
+            page = row.page
+            link.metadata = (page.metadata_json if page is not None else row.metadata_json) or {}
+        if "is_processed" in fields:
+            link.is_processed = row.is_processed
+        if "tags" in fields:
+            link.tags = [t.name for t in row.tags]
+        if "updated_at" in fields:
+            link.updated_at = row.updated_at
+        return link
+
+    # ── Link counters ───────────────────────────────────────────────
+
+    async def _adjust_link_count(self, user_id: uuid.UUID, delta: int) -> None:
+        """Apply `delta` to the user's counter in the current transaction."""
+        counts = UserLinkCountModel.__table__
+        insert = _dialect_insert(self._session)
+        stmt = insert(counts).values(user_id=user_id, link_count=max(delta, 0))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={"link_count": counts.c.link_count + delta},
+        )
+        await self._session.execute(stmt)
+
+    async def reconcile_link_counts(self) -> int:
+        """
+        Recount every user's links and repair counters that drifted.
+
+        Returns the number of counters that were corrected (or created).
+        """
+        counts = UserLinkCountModel.__table__
+        actual = (
+            select(UserModel.id, func.count(LinkModel.id))
+            .outerjoin(LinkModel, LinkModel.user_id == UserModel.id)
+            .where(true())  # SQLite needs a WHERE before ON CONFLICT in INSERT ... SELECT
+            .group_by(UserModel.id)
+        )
+        insert = _dialect_insert(self._session)
+        stmt = insert(counts).from_select(["user_id", "link_count"], actual)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={"link_count": stmt.excluded.link_count},
+            where=counts.c.link_count != stmt.excluded.link_count,
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    async def reconcile_tag_counts(self) -> int:
+        """Recount links per tag and repair drifted counters; returns how many."""
+        tags = TagModel.__table__
+        actual = (
+            select(func.count())
+            .select_from(link_tags)
+            .where(link_tags.c.tag_id == tags.c.id)
+            .scalar_subquery()
+        )
+        stmt = update(tags).where(tags.c.link_count != actual).values(link_count=actual)
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    # ── Tags ────────────────────────────────────────────────────────
+
+    async def _attach_tags(self, tagged: list[tuple[uuid.UUID, uuid.UUID, list[str]]]) -> None:
+        """
+        Tag links given as (link_id, user_id, names).
+
+        Gets-or-creates the tags in an upsert that also bumps their counts
+        (split only past the bind-parameter cap), then links them in one
+        executemany.
+        """
+        added: dict[tuple[uuid.UUID, str], int] = {}
+        for _, user_id, names in tagged:
+            for name in names:
+                added[(user_id, name)] = added.get((user_id, name), 0) + 1
+        if not added:
+            return
+
+        tags = TagModel.__table__
+        insert = _dialect_insert(self._session)
+        rows = [
+            {"id": uuid.uuid4(), "name": name, "user_id": user_id, "link_count": count}
+            for (user_id, name), count in added.items()
+        ]
+        tag_ids = {}
+        for batch in _values_batches(rows):
+            stmt = insert(tags).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "name"],
+                set_={"link_count": tags.c.link_count + stmt.excluded.link_count},
+            ).returning(tags.c.id, tags.c.user_id, tags.c.name)
+            result = await self._session.execute(stmt)
+            tag_ids.update(((row.user_id, row.name), row.id) for row in result)
+        await self._session.execute(
+            link_tags.insert(),
+            [
+                {"link_id": link_id, "tag_id": tag_ids[(user_id, name)], "user_id": user_id}
+                for link_id, user_id, names in tagged
+                for name in names
+            ],
+        )
+
+    async def _detach_tags(self, link_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        """Unlink all tags from the user's link and decrement their counts."""
+        result = await self._session.execute(
+            delete(link_tags)
+            .where(link_tags.c.link_id == link_id, link_tags.c.user_id == user_id)
+            .returning(link_tags.c.tag_id)
+        )
+        tag_ids = result.scalars().all()
+        if tag_ids:
+            tags = TagModel.__table__
+            await self._session.execute(
+                update(tags).where(tags.c.id.in_(tag_ids)).values(link_count=tags.c.link_count - 1)
+            )
+
+    async def _adjust_tag_counts(self, deltas: Mapping[uuid.UUID, int]) -> None:
+        """Apply per-tag `deltas` to the counters in one executemany."""
+        deltas = {tag_id: delta for tag_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        tags = TagModel.__table__
+        await self._session.execute(
+            update(tags)
+            .where(tags.c.id == bindparam("b_id"))
+            .values(link_count=tags.c.link_count + bindparam("b_delta")),
+            [{"b_id": tag_id, "b_delta": delta} for tag_id, delta in deltas.items()],
         )
 
     # ── Port implementations ────────────────────────────────────────
 
     async def save_link(self, link: Link) -> Link:
+        digest = url_digest(link.url)
         db_link = LinkModel(
             id=link.id,
             user_id=link.user_id,
             url=link.url,
+            url_digest=digest,
             title=link.title,
             description=link.description,
             metadata_json=link.metadata,
@@ -63,16 +464,67 @@ class PostgresLinkRepository(LinkRepositoryPort):
             await self._session.flush()
         except IntegrityError:
             await self._session.rollback()
-            raise LinkAlreadyExistsError(f"URL already saved: {link.url}")
-        await self._session.refresh(db_link)
-        return self._to_domain(db_link)
+            result = await self._session.execute(
+                _LINK_ID_BY_DIGEST, {"user_id": link.user_id, "url_digest": digest}
+            )
+            raise LinkAlreadyExistsError(
+                f"URL already saved: {link.url}", duplicate_of=result.scalar_one_or_none()
+            )
+        await self._adjust_link_count(link.user_id, 1)
+        if link.tags:
+            await self._attach_tags([(link.id, link.user_id, link.tags)])
+        # Every column was set client-side — no need to read the row back
+        return link.model_copy(
+            update={"created_at": db_link.created_at, "updated_at": db_link.updated_at}
+        )
 
-    async def get_link(self, link_id: uuid.UUID, user_id: uuid.UUID) -> Link | None:
-        stmt = select(LinkModel).where(
-            LinkModel.id == link_id,
-            LinkModel.user_id == user_id,
+    async def insert_links(self, links: list[Link]) -> list[uuid.UUID]:
+        if not links:
+            return []
+        links_table = LinkModel.__table__
+        insert = _dialect_insert(self._session)
+        rows = [
+            {
+                "id": link.id,
+                "user_id": link.user_id,
+                "url": link.url,
+                "url_digest": url_digest(link.url),
+                "title": link.title,
+                "description": link.description,
+                "metadata": link.metadata,
+                "is_processed": link.is_processed,
+                "created_at": link.created_at,
+                "updated_at": link.updated_at,
+            }
+            for link in links
+        ]
+        # Multi-row INSERT ... ON CONFLICT DO NOTHING: duplicates against
+        # ix_links_user_url_digest are skipped by the database, not raised.
+        # Large batches are split to stay under the bind-parameter cap
+        inserted: set[uuid.UUID] = set()
+        for batch in _values_batches(rows):
+            stmt = (
+                insert(links_table)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=["user_id", "url_digest"])
+                .returning(links_table.c.id)
+            )
+            result = await self._session.execute(stmt)
+            inserted.update(result.scalars().all())
+
+        per_user: dict[uuid.UUID, int] = {}
+        for link in links:
+            if link.id in inserted:
+                per_user[link.user_id] = per_user.get(link.user_id, 0) + 1
+        for user_id, count in per_user.items():
+            await self._adjust_link_count(user_id, count)
+        await self._attach_tags(
+            [(link.id, link.user_id, link.tags) for link in links if link.id in inserted and link.tags]
         )
-        result = await self._session.execute(stmt)
+        return [link.id for link in links if link.id in inserted]
+
+    async def get_link(self, link_id: uuid.UUID, user_id: uuid.UUID) -> Link | None:
+        result = await self._session.execute(_GET_LINK, {"link_id": link_id, "user_id": user_id})
         row = result.scalar_one_or_none()
         return self._to_domain(row) if row else None
 
@@ -82,16 +534,16 @@ class PostgresLinkRepository(LinkRepositoryPort):
         *,
         offset: int = 0,
         limit: int = 20,
+        after: LinkCursor | None = None,
+        tags: list[str] | None = None,
+        fields: frozenset[str] | None = None,
     ) -> list[Link]:
-        stmt = (
-            select(LinkModel)
-            .where(LinkModel.user_id == user_id)
-            .order_by(LinkModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
-        result = await self._session.execute(stmt)
-        return [self._to_domain(row) for row in result.scalars().all()]
+        tags = tags or []
+        stmt = _links_page_stmt(fields, keyset=after is not None, tag_count=len(tags), search=False)
+        params = _page_params(user_id, offset=offset, limit=limit, after=after)
+        params.update((f"tag_{i}", name) for i, name in enumerate(tags))
+        result = await self._session.execute(stmt, params)
+        return [self._to_domain(row, fields) for row in result.scalars().all()]
 
     async def search_links(
         self,
@@ -100,50 +552,376 @@ class PostgresLinkRepository(LinkRepositoryPort):
         *,
         offset: int = 0,
         limit: int = 20,
+        after: LinkCursor | None = None,
+        mode: SearchMode = SearchMode.SUBSTRING,
+        similarity_threshold: float = 0.3,
+        fields: frozenset[str] | None = None,
     ) -> list[Link]:
-        pattern = f"%{query}%"
+        if mode is not SearchMode.SUBSTRING:
+            stmt = _select_links(fields).where(LinkModel.user_id == user_id)
+            if mode is SearchMode.FUZZY:
+                if self._session.bind.dialect.name == "postgresql":
+                    # Threshold for the `<%` operator, for this transaction only
+                    await self._session.execute(
+                        select(
+                            func.set_config(
+                                "pg_trgm.word_similarity_threshold", str(similarity_threshold), True
+                            )
+                        )
+                    )
+                stmt = _fuzzy_filter(self._session, stmt, query, similarity_threshold)
+            else:
+                stmt = _fulltext_filter(self._session, stmt, query)
+            stmt = (
+                stmt.order_by(LinkModel.created_at.desc(), LinkModel.id.desc())
+                .offset(offset)
+                .limit(limit)
+            )
+            result = await self._session.execute(stmt)
+            return [self._to_domain(row, fields) for row in result.scalars().all()]
+
+        stmt = _links_page_stmt(fields, keyset=after is not None, tag_count=0, search=True)
+        params = _page_params(user_id, offset=offset, limit=limit, after=after)
+        params["pattern"] = f"%{query}%"
+        result = await self._session.execute(stmt, params)
+        return [self._to_domain(row, fields) for row in result.scalars().all()]
+
+    async def export_links(
+        self, user_id: uuid.UUID, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[LinkExportRow]]:
+        # Tag names folded into one string per link by a correlated aggregate
+        if self._session.bind.dialect.name == "postgresql":
+            names = func.string_agg(TagModel.name, literal(_TAG_SEPARATOR))
+        else:
+            names = func.group_concat(TagModel.name, _TAG_SEPARATOR)
+        tag_names = (
+            select(names)
+            .select_from(link_tags)
+            .join(TagModel, TagModel.id == link_tags.c.tag_id)
+            .where(link_tags.c.link_id == LinkModel.id, link_tags.c.user_id == LinkModel.user_id)
+            .scalar_subquery()
+        )
         stmt = (
-            select(LinkModel)
-            .where(
-                LinkModel.user_id == user_id,
-                or_(
-                    LinkModel.title.ilike(pattern),
-                    LinkModel.url.ilike(pattern),
-                ),
+            select(
+                LinkModel.url,
+                LinkModel.title,
+                LinkModel.description,
+                tag_names,
+                LinkModel.created_at,
             )
-            .order_by(LinkModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
+            .where(LinkModel.user_id == user_id)
+            .order_by(LinkModel.created_at, LinkModel.id)
+            .execution_options(yield_per=batch_size)
         )
-        result = await self._session.execute(stmt)
-        return [self._to_domain(row) for row in result.scalars().all()]
+        result = await self._session.stream(stmt)
+        async for rows in result.partitions():
+            yield [
+                LinkExportRow(
+                    url, title, description, tags.split(_TAG_SEPARATOR) if tags else [], created_at
+                )
+                for url, title, description, tags, created_at in rows
+            ]
 
     async def delete_link(self, link_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        await self._detach_tags(link_id, user_id)
         stmt = (
             delete(LinkModel)
             .where(LinkModel.id == link_id, LinkModel.user_id == user_id)
             .returning(LinkModel.id)
         )
         result = await self._session.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        if result.scalar_one_or_none() is None:
+            return False
+        await self._adjust_link_count(user_id, -1)
+        return True
+
+    async def delete_links(
+        self, user_id: uuid.UUID, link_filter: LinkFilter, *, batch_size: int = 1000
+    ) -> int:
+        # Deleted rows leave the selection, so each batch is simply the next LIMIT
+        batch_ids = (
+            select(LinkModel.id).where(*_filter_clauses(user_id, link_filter)).limit(batch_size)
+        )
+        deleted = 0
+        while ids := (await self._session.execute(batch_ids)).scalars().all():
+            result = await self._session.execute(
+                delete(link_tags)
+                .where(link_tags.c.user_id == user_id, link_tags.c.link_id.in_(ids))
+                .returning(link_tags.c.tag_id)
+            )
+            await self._adjust_tag_counts({tag_id: -n for tag_id, n in Counter(result.scalars()).items()})
+            result = await self._session.execute(
+                delete(LinkModel)
+                .where(LinkModel.user_id == user_id, LinkModel.id.in_(ids))
+                .returning(LinkModel.id)
+            )
+            deleted += len(result.all())
+            if len(ids) < batch_size:
+                break
+        if deleted:
+            await self._adjust_link_count(user_id, -deleted)
+        return deleted
+
+    async def retag_links(
+        self,
+        user_id: uuid.UUID,
+        link_filter: LinkFilter,
+        *,
+        add: list[str],
+        remove: list[str],
+        batch_size: int = 1000,
+    ) -> int:
+        tags = TagModel.__table__
+        insert = _dialect_insert(self._session)
+        remove_ids: list[uuid.UUID] = []
+        if remove:
+            result = await self._session.execute(
+                select(tags.c.id).where(tags.c.user_id == user_id, tags.c.name.in_(remove))
+            )
+            remove_ids = result.scalars().all()
+        add_ids: list[uuid.UUID] = []
+        if add:
+            stmt = insert(tags).values(
+                [{"id": uuid.uuid4(), "name": name, "user_id": user_id, "link_count": 0} for name in add]
+            )
+            # No-op update so RETURNING also yields the tags that already exist
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "name"], set_={"name": stmt.excluded.name}
+            ).returning(tags.c.id)
+            add_ids = (await self._session.execute(stmt)).scalars().all()
+
+        # Matched rows stay matched, so batches walk forward by id
+        batch_ids = (
+            select(LinkModel.id)
+            .where(*_filter_clauses(user_id, link_filter))
+            .order_by(LinkModel.id)
+            .limit(batch_size)
+        )
+        matched = 0
+        last_id: uuid.UUID | None = None
+        while True:
+            stmt = batch_ids if last_id is None else batch_ids.where(LinkModel.id > last_id)
+            ids = (await self._session.execute(stmt)).scalars().all()
+            if not ids:
+                break
+            matched += len(ids)
+            last_id = ids[-1]
+
+            deltas: Counter[uuid.UUID] = Counter()
+            if remove_ids:
+                result = await self._session.execute(
+                    delete(link_tags)
+                    .where(
+                        link_tags.c.user_id == user_id,
+                        link_tags.c.link_id.in_(ids),
+                        link_tags.c.tag_id.in_(remove_ids),
+                    )
+                    .returning(link_tags.c.tag_id)
+                )
+                deltas.subtract(result.scalars())
+            if add_ids:
+                pairs = (
+                    select(LinkModel.id, tags.c.id, LinkModel.user_id)
+                    .join(tags, tags.c.id.in_(add_ids))
+                    .where(LinkModel.user_id == user_id, LinkModel.id.in_(ids))
+                )
+                # Links that already carry a tag are skipped, and not counted
+                stmt = (
+                    insert(link_tags)
+                    .from_select(["link_id", "tag_id", "user_id"], pairs)
+                    .on_conflict_do_nothing()
+                    .returning(link_tags.c.tag_id)
+                )
+                deltas.update((await self._session.execute(stmt)).scalars())
+            await self._adjust_tag_counts(deltas)
+            if len(ids) < batch_size:
+                break
+        return matched
+
+    async def count_links(self, user_id: uuid.UUID, *, tag: str | None = None) -> int:
+        if tag is not None:
+            result = await self._session.execute(_TAG_LINK_COUNT, {"user_id": user_id, "tag": tag})
+        else:
+            result = await self._session.execute(_USER_LINK_COUNT, {"user_id": user_id})
+        return max(result.scalar_one_or_none() or 0, 0)
 
     async def update_link_metadata(
         self,
         link_id: uuid.UUID,
+        user_id: uuid.UUID,
         title: str | None,
         description: str | None,
         metadata: dict,
+        *,
+        page_hash: str | None = None,
     ) -> None:
-        stmt = select(LinkModel).where(LinkModel.id == link_id)
+        stmt = select(LinkModel).where(LinkModel.id == link_id, LinkModel.user_id == user_id)
         result = await self._session.execute(stmt)
         row = result.scalar_one_or_none()
         if row:
             row.title = title or row.title
             row.description = description or row.description
-            row.metadata_json = metadata
+            row.metadata_json = _link_metadata(metadata, page_hash)
+            row.page_hash = page_hash
             row.is_processed = True
             await self._session.flush()
 
+    async def bulk_update_link_metadata(self, updates: list[LinkMetadataUpdate]) -> int:
+        if not updates:
+            return 0
+        links = LinkModel.__table__
+        # Same rules as update_link_metadata; the last update per link wins.
+        # Matching on user_id too prunes each row to its link's partition
+        rows = {
+            u.link_id: (
+                u.link_id,
+                u.user_id,
+                u.title,
+                u.description,
+                _link_metadata(u.metadata, u.page_hash),
+                u.page_hash,
+            )
+            for u in updates
+        }
+
+        if self._session.bind.dialect.name == "postgresql":
+            # UPDATE links ... FROM (VALUES (...), (...)) AS v — one round trip
+            v = values(
+                column("id", Uuid),
+                column("user_id", Uuid),
+                column("title", Text),
+                column("description", Text),
+                column("metadata", CompatibleJSON),
+                column("page_hash", String(64)),
+                name="v",
+            ).data(list(rows.values()))
+            stmt = (
+                update(links)
+                .where(links.c.id == v.c.id, links.c.user_id == v.c.user_id)
+                .values(
+                    title=func.coalesce(func.nullif(v.c.title, ""), links.c.title),
+                    description=func.coalesce(func.nullif(v.c.description, ""), links.c.description),
+                    metadata=v.c.metadata,
+                    page_hash=v.c.page_hash,
+                    is_processed=True,
+                )
+            )
+            result = await self._session.execute(stmt)
+            return result.rowcount
+
+        # Backends without UPDATE ... FROM VALUES: one executemany instead
+        stmt = (
+            update(links)
+            .where(links.c.id == bindparam("b_id"), links.c.user_id == bindparam("b_user_id"))
+            .values(
+                title=func.coalesce(func.nullif(bindparam("b_title"), ""), links.c.title),
+                description=func.coalesce(
+                    func.nullif(bindparam("b_description"), ""), links.c.description
+                ),
+                metadata=bindparam("b_metadata", type_=CompatibleJSON),
+                page_hash=bindparam("b_page_hash"),
+                is_processed=True,
+            )
+        )
+        params = [
+            {
+                "b_id": link_id,
+                "b_user_id": user_id,
+                "b_title": title,
+                "b_description": description,
+                "b_metadata": metadata,
+                "b_page_hash": page_hash,
+            }
+            for link_id, user_id, title, description, metadata, page_hash in rows.values()
+        ]
+        result = await self._session.execute(stmt, params)
+        return result.rowcount
+
+
+class PostgresTagRepository(TagRepositoryPort):
+    """Concrete PostgreSQL adapter for tag listing."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_tags_by_user(self, user_id: uuid.UUID) -> list[Tag]:
+        # Counts are maintained on the tag rows — no join over link_tags
+        stmt = (
+            select(TagModel.id, TagModel.name, TagModel.user_id, TagModel.link_count)
+            .where(TagModel.user_id == user_id, TagModel.link_count > 0)
+            .order_by(TagModel.link_count.desc(), TagModel.name)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            Tag(id=row.id, name=row.name, user_id=row.user_id, link_count=row.link_count)
+            for row in result
+        ]
+
+
+class PostgresPageMetadataRepository(PageMetadataRepositoryPort):
+    """Concrete PostgreSQL adapter for the shared page metadata store."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    @staticmethod
+    def _to_domain(row: PageMetadataModel) -> PageMetadata:
+        return PageMetadata(
+            url_hash=row.url_hash,
+            url=row.url,
+            title=row.title,
+            description=row.description,
+            metadata=row.metadata_json or {},
+            fetched_at=row.fetched_at,
+        )
+
+    async def get_fresh_page(self, url_hash: str, max_age: timedelta) -> PageMetadata | None:
+        cutoff = datetime.now(timezone.utc) - max_age
+        stmt = select(PageMetadataModel).where(
+            PageMetadataModel.url_hash == url_hash,
+            PageMetadataModel.fetched_at >= cutoff,
+        )
+        result = await self._session.execute(stmt)
+        row = result.scalar_one_or_none()
+        return self._to_domain(row) if row else None
+
+    async def upsert_page(self, page: PageMetadata) -> None:
+        await self.upsert_pages([page])
+
+    async def upsert_pages(self, pages: list[PageMetadata]) -> None:
+        if not pages:
+            return
+        # One row per page — ON CONFLICT cannot touch the same row twice
+        rows = {
+            page.url_hash: {
+                "url_hash": page.url_hash,
+                "url": page.url,
+                "title": page.title,
+                "description": page.description,
+                "metadata": page.metadata,
+                "fetched_at": page.fetched_at,
+            }
+            for page in pages
+        }
+        insert = _dialect_insert(self._session)
+        stmt = insert(PageMetadataModel.__table__).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["url_hash"],
+            set_={
+                name: stmt.excluded[name]
+                for name in ("url", "title", "description", "metadata", "fetched_at")
+            },
+        )
+        await self._session.execute(stmt)
+
+
+# Just the columns a User needs — lookups never touch links or tags
+_USER_COLUMNS = (UserModel.id, UserModel.username, UserModel.hashed_password, UserModel.created_at)
+
+_USER_BY_USERNAME = select(*_USER_COLUMNS).where(UserModel.username == bindparam("username"))
+
+_USER_BY_ID = select(*_USER_COLUMNS).where(UserModel.id == bindparam("user_id"))
+
 
 class PostgresUserRepository(UserRepositoryPort):
     """Concrete PostgreSQL adapter for user persistence."""
@@ -172,17 +950,14 @@ class PostgresUserRepository(UserRepositoryPort):
         except IntegrityError:
             await self._session.rollback()
             raise UserAlreadyExistsError(f"Username '{user.username}' is already taken.")
-        await self._session.refresh(db_user)
         return self._to_domain(db_user)
 
     async def get_user_by_username(self, username: str) -> User | None:
-        stmt = select(UserModel).where(UserModel.username == username)
-        result = await self._session.execute(stmt)
-        row = result.scalar_one_or_none()
+        result = await self._session.execute(_USER_BY_USERNAME, {"username": username})
+        row = result.one_or_none()
         return self._to_domain(row) if row else None
 
     async def get_user_by_id(self, user_id: uuid.UUID) -> User | None:
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await self._session.execute(stmt)
-        row = result.scalar_one_or_none()
+        result = await self._session.execute(_USER_BY_ID, {"user_id": user_id})
+        row = result.one_or_none()
         return self._to_domain(row) if row else None
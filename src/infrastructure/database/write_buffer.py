@@ -0,0 +1,120 @@
+"""
+Write-behind buffer for scraped link metadata.
+
+Completed scrapes are not written one transaction per link. They are
+buffered for up to `metadata_write_batch_seconds` (or until
+`metadata_write_batch_size` results are waiting) and then applied together:
+one multi-row upsert into `page_metadata`, one `bulk_update_link_metadata`
+statement, one commit.
+
+`submit()` only returns once the batch containing the update has been
+committed (and raises if it failed), so a queue worker still acknowledges
+a job only after its result is durable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from src.core.link.domain.models import LinkMetadataUpdate, PageMetadata
+from src.infrastructure.config import settings
+from src.infrastructure.database import database
+from src.infrastructure.database.postgres_repository import (
+    PostgresLinkRepository,
+    PostgresPageMetadataRepository,
+)
+
+logger = logging.getLogger("SaveLinks.database")
+
+_Pending = tuple[LinkMetadataUpdate, PageMetadata | None, asyncio.Future]
+
+
+class MetadataWriteBuffer:
+    """Batches metadata updates into one transaction per window."""
+
+    def __init__(self, *, max_batch: int = 100, max_delay: float = 0.05) -> None:
+        self._max_batch = max(1, max_batch)
+        self._max_delay = max_delay
+        self._pending: list[_Pending] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def submit(self, update: LinkMetadataUpdate, page: PageMetadata | None = None) -> None:
+        """Queue an update (and the shared page it references) and wait for its commit."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((update, page, future))
+
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+        await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._write(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: list[_Pending]) -> None:
+        pages = [page for _, page, _ in batch if page is not None]
+        updates = [update for update, _, _ in batch]
+        try:
+            async with database.async_session_factory() as session:
+                try:
+                    await PostgresPageMetadataRepository(session).upsert_pages(pages)
+                    await PostgresLinkRepository(session).bulk_update_link_metadata(updates)
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+        except Exception as e:
+            logger.warning(f"Failed to write a batch of {len(batch)} metadata updates: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def close(self) -> None:
+        """Write anything still buffered and wait for in-flight batches."""
+        self._flush()
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+
+# Global write buffer (initialized lazily)
+_metadata_writer: MetadataWriteBuffer | None = None
+
+
+def get_metadata_writer() -> MetadataWriteBuffer:
+    """Get or create the shared metadata write buffer."""
+    global _metadata_writer
+    if _metadata_writer is None:
+        _metadata_writer = MetadataWriteBuffer(
+            max_batch=settings.metadata_write_batch_size,
+            max_delay=settings.metadata_write_batch_seconds,
+        )
+    return _metadata_writer
+
+
+async def close_metadata_writer() -> None:
+    """Flush and drop the shared write buffer on shutdown."""
+    global _metadata_writer
+    if _metadata_writer is not None:
+        await _metadata_writer.close()
+        _metadata_writer = None
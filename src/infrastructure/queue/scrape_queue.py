@@ -0,0 +1,246 @@
+"""
+Durable scrape job queue on Redis streams.
+
+Producers (the API) append jobs to the `scrape:jobs` stream. Workers read
+them through the `scrape-workers` consumer group, so each job is delivered
+to one worker and stays in the group's pending list until acknowledged:
+
+- Success → XACK + XDEL.
+- Failure → the job is parked in the `scrape:retry` sorted set, scored by
+  the time it becomes due (exponential backoff with jitter), then acked.
+  Due jobs are moved back to the stream atomically by a Lua script.
+- After `scrape_job_max_attempts` failures → appended to `scrape:dead`.
+- Jobs deferred by the per-domain scheduler (`ScrapeDeferred`) are parked
+  until the host is expected to be free without using up an attempt.
+- Jobs left pending by a crashed worker are reclaimed with XAUTOCLAIM
+  once idle for `scrape_job_claim_idle_seconds`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from typing import Awaitable, Callable
+
+import redis.asyncio as aioredis
+from redis.exceptions import ResponseError
+
+from src.infrastructure.cache.redis_client import get_redis
+from src.infrastructure.config import settings
+from src.infrastructure.scraper.errors import ScrapeDeferred
+
+logger = logging.getLogger("SaveLinks.queue")
+
+JOBS_STREAM = "scrape:jobs"
+RETRY_ZSET = "scrape:retry"
+DEAD_STREAM = "scrape:dead"
+CONSUMER_GROUP = "scrape-workers"
+
+# How long a worker blocks on XREADGROUP before checking retries/reclaims
+_BLOCK_MS = 2000
+
+# Max due retries promoted per poll
+_PROMOTE_BATCH = 100
+
+# Floor for requeueing deferred jobs, so a zero hint cannot cause a hot loop
+_MIN_DEFER_SECONDS = 1.0
+
+# Atomically move due jobs from the retry set back onto the jobs stream
+_PROMOTE_DUE_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(due) do
+    redis.call('ZREM', KEYS[1], member)
+    local job = cjson.decode(member)
+    redis.call('XADD', KEYS[2], '*', 'link_id', job.link_id, 'user_id', job.user_id,
+        'url', job.url, 'attempt', job.attempt)
+end
+return #due
+"""
+
+# (link_id, user_id, url); user_id routes the write-back to the link's partition
+ScrapeHandler = Callable[[uuid.UUID, uuid.UUID, str], Awaitable[None]]
+
+
+# ── Producer ───────────────────────────────────────────────────────
+
+
+async def enqueue_scrape_jobs(jobs: list[tuple[uuid.UUID, uuid.UUID, str]]) -> bool:
+    """
+    Append (link_id, user_id, url) scrape jobs to the stream in one round trip.
+
+    Returns False (after logging) if the queue is disabled or Redis is
+    unreachable, so the caller can fall back to scraping in-process.
+    """
+    if not settings.scrape_queue_enabled:
+        return False
+    if not jobs:
+        return True
+    try:
+        r = await get_redis()
+        async with r.pipeline(transaction=False) as pipe:
+            for link_id, user_id, url in jobs:
+                pipe.xadd(
+                    JOBS_STREAM,
+                    {"link_id": str(link_id), "user_id": str(user_id), "url": url, "attempt": 0},
+                )
+            await pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to enqueue {len(jobs)} scrape job(s) in Redis: {e}")
+        return False
+
+
+async def enqueue_scrape_job(link_id: uuid.UUID, user_id: uuid.UUID, url: str) -> bool:
+    """Append a single scrape job to the stream. See `enqueue_scrape_jobs`."""
+    return await enqueue_scrape_jobs([(link_id, user_id, url)])
+
+
+# ── Consumer ───────────────────────────────────────────────────────
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given (1-based) attempt."""
+    delay = min(
+        settings.scrape_retry_max_seconds,
+        settings.scrape_retry_base_seconds * 2 ** (attempt - 1),
+    )
+    return random.uniform(delay / 2, delay)
+
+
+class ScrapeWorker:
+    """Consumes scrape jobs with up to `concurrency` scrapes in flight."""
+
+    def __init__(
+        self,
+        handler: ScrapeHandler,
+        *,
+        concurrency: int | None = None,
+        consumer_name: str | None = None,
+    ) -> None:
+        self._handler = handler
+        self._concurrency = max(1, concurrency or settings.scrape_worker_concurrency)
+        self._consumer = consumer_name or f"worker-{uuid.uuid4().hex[:8]}"
+        self._in_flight: set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+        self._redis: aioredis.Redis | None = None
+        self._promote_due = None
+
+    def stop(self) -> None:
+        """Stop reading new jobs; in-flight jobs are allowed to finish."""
+        self._stopping.set()
+
+    async def _ensure_group(self) -> None:
+        try:
+            await self._redis.xgroup_create(JOBS_STREAM, CONSUMER_GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def run(self) -> None:
+        """Main loop: promote retries, reclaim stale jobs, read and dispatch."""
+        self._redis = await get_redis()
+        self._promote_due = self._redis.register_script(_PROMOTE_DUE_LUA)
+        await self._ensure_group()
+        logger.info(
+            f"Scrape worker {self._consumer} started (concurrency={self._concurrency})."
+        )
+
+        while not self._stopping.is_set():
+            free = self._concurrency - len(self._in_flight)
+            if free <= 0:
+                await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            try:
+                await self._promote_due(
+                    keys=[RETRY_ZSET, JOBS_STREAM], args=[time.time(), _PROMOTE_BATCH]
+                )
+                entries = await self._reclaim(free)
+                if not entries:
+                    entries = await self._read(free)
+            except Exception as e:
+                logger.warning(f"Scrape queue read failed: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            for message_id, fields in entries:
+                task = asyncio.create_task(self._process(message_id, fields))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        logger.info(f"Scrape worker {self._consumer} stopped.")
+
+    async def _read(self, count: int) -> list[tuple[str, dict]]:
+        response = await self._redis.xreadgroup(
+            CONSUMER_GROUP, self._consumer, {JOBS_STREAM: ">"}, count=count, block=_BLOCK_MS
+        )
+        return [entry for _, entries in response or [] for entry in entries]
+
+    async def _reclaim(self, count: int) -> list[tuple[str, dict]]:
+        """Take over jobs left pending too long by a crashed or stuck worker."""
+        response = await self._redis.xautoclaim(
+            JOBS_STREAM,
+            CONSUMER_GROUP,
+            self._consumer,
+            min_idle_time=settings.scrape_job_claim_idle_seconds * 1000,
+            count=count,
+        )
+        # Entries deleted while pending come back without fields
+        return [(message_id, fields) for message_id, fields in response[1] if fields]
+
+    async def _process(self, message_id: str, fields: dict) -> None:
+        attempt = int(fields.get("attempt", 0)) + 1
+        error: Exception | None = None
+        try:
+            link_id, user_id = uuid.UUID(fields["link_id"]), uuid.UUID(fields["user_id"])
+        except (KeyError, ValueError) as e:
+            # Malformed (e.g. enqueued before jobs carried user_id): not retryable
+            error = ValueError(f"Malformed scrape job: {e!r}")
+            attempt = max(attempt, settings.scrape_job_max_attempts)
+        else:
+            try:
+                await self._handler(link_id, user_id, fields["url"])
+            except Exception as e:
+                error = e
+
+        try:
+            if error is not None:
+                await self._reschedule(fields, attempt, error)
+            # Only acknowledge once the job is done or safely parked elsewhere
+            await self._redis.xack(JOBS_STREAM, CONSUMER_GROUP, message_id)
+            await self._redis.xdel(JOBS_STREAM, message_id)
+        except Exception as e:
+            # Left pending — another worker reclaims it after the idle timeout
+            logger.warning(f"Failed to settle scrape job {message_id}: {e}")
+
+    async def _reschedule(self, fields: dict, attempt: int, error: Exception) -> None:
+        retry_after = getattr(error, "retry_after", None) or 0.0
+        if isinstance(error, ScrapeDeferred):
+            # The host is busy, not broken — requeue without using an attempt
+            attempt -= 1
+            delay = max(retry_after, _MIN_DEFER_SECONDS)
+        elif attempt >= settings.scrape_job_max_attempts:
+            logger.error(f"Scrape job for {fields.get('url')} dead after {attempt} attempts: {error}")
+            await self._redis.xadd(DEAD_STREAM, {**fields, "attempt": attempt, "error": str(error)})
+            return
+        else:
+            delay = max(_retry_delay(attempt), retry_after)
+            logger.warning(
+                f"Scrape job for {fields.get('url')} failed (attempt {attempt}), "
+                f"retrying in {delay:.0f}s: {error}"
+            )
+
+        job = json.dumps(
+            {
+                "link_id": fields["link_id"],
+                "user_id": fields["user_id"],
+                "url": fields["url"],
+                "attempt": attempt,
+            }
+        )
+        await self._redis.zadd(RETRY_ZSET, {job: time.time() + delay})
@@ -0,0 +1,73 @@
+"""
+Failure memory for scrape targets.
+
+`CircuitBreaker` counts consecutive failures per key. Once `threshold`
+failures in a row have been seen, the key is blocked ("open") for an
+exponentially growing period; when that period has passed the next request
+is let through, and a success resets the key while another failure opens
+it again for twice as long.
+
+The scraper keeps two of these:
+
+- per normalized URL (threshold 1) — a negative cache, so a page that just
+  failed is not fetched again on every save;
+- per host (threshold `scraper_breaker_failure_threshold`) — hosts that keep
+  timing out or refusing connections are skipped without a request, so they
+  stop holding scrape concurrency slots.
+
+State is per process, like the politeness scheduler.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Upper bound on remembered keys
+_MAX_ENTRIES = 10_000
+
+
+@dataclass
+class _Failures:
+    count: int = 0
+    open_until: float = 0.0
+
+
+class CircuitBreaker:
+    """Per-key consecutive-failure counter with exponential open periods."""
+
+    def __init__(
+        self,
+        *,
+        threshold: int = 1,
+        base_delay: float = 60.0,
+        max_delay: float = 3600.0,
+    ) -> None:
+        self._threshold = max(1, threshold)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._entries: OrderedDict[str, _Failures] = OrderedDict()
+
+    def blocked_for(self, key: str) -> float:
+        """Seconds until `key` may be tried again (0 when it is not blocked)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0.0
+        return max(0.0, entry.open_until - time.monotonic())
+
+    def record_failure(self, key: str) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Failures()
+        self._entries.move_to_end(key)
+        while len(self._entries) > _MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+        entry.count += 1
+        if entry.count >= self._threshold:
+            delay = self._base_delay * 2 ** min(entry.count - self._threshold, 32)
+            entry.open_until = time.monotonic() + min(delay, self._max_delay)
+
+    def record_success(self, key: str) -> None:
+        self._entries.pop(key, None)
@@ -0,0 +1,111 @@
+"""
+Two-level cache for scrape results with HTTP revalidation.
+
+Entries live in a per-process LRU and in Redis (shared by all API and
+worker processes), keyed by the normalized-URL hash. Each entry keeps the
+response validators (`ETag`, `Last-Modified`):
+
+- younger than `scrape_cache_ttl_seconds` → served without any request;
+- older, but still retained (`scrape_cache_stale_ttl_seconds`) → the page is
+  revalidated with `If-None-Match` / `If-Modified-Since`, and a 304 reuses
+  the stored metadata without downloading or parsing the page.
+
+Like the rest of the Redis adapter, the cache degrades gracefully: Redis
+errors are logged and treated as misses.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from src.infrastructure.cache.redis_client import get_redis
+
+logger = logging.getLogger("SaveLinks.scraper")
+
+
+@dataclass
+class CachedScrape:
+    """A scrape result plus the validators needed to revalidate it."""
+
+    metadata: dict[str, Any]
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ScrapeCache:
+    """In-process LRU in front of a Redis-backed scrape result cache."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 3600.0,
+        stale_ttl: float = 7 * 24 * 3600.0,
+        lru_size: int = 1024,
+        use_redis: bool = True,
+    ) -> None:
+        self.ttl = ttl
+        self._stale_ttl = max(ttl, stale_ttl)
+        self._lru_size = lru_size
+        self._use_redis = use_redis
+        self._lru: OrderedDict[str, CachedScrape] = OrderedDict()
+
+    @staticmethod
+    def _redis_key(key: str) -> str:
+        return f"scrape:{key}"
+
+    def _remember(self, key: str, entry: CachedScrape) -> None:
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._lru_size:
+            self._lru.popitem(last=False)
+
+    async def get(self, key: str) -> CachedScrape | None:
+        """Look up an entry (fresh or stale); None if nothing is retained."""
+        entry = self._lru.get(key)
+        if entry is not None:
+            self._lru.move_to_end(key)
+            return entry
+        if not self._use_redis:
+            return None
+
+        try:
+            r = await get_redis()
+            raw = await r.get(self._redis_key(key))
+        except Exception as e:
+            logger.warning(f"Failed to read scrape cache from Redis: {e}")
+            return None
+        if raw is None:
+            return None
+
+        entry = CachedScrape(**json.loads(raw))
+        self._remember(key, entry)
+        return entry
+
+    async def set(self, key: str, entry: CachedScrape) -> None:
+        """Store an entry; Redis keeps it for revalidation up to `stale_ttl`."""
+        self._remember(key, entry)
+        if not self._use_redis:
+            return
+        try:
+            r = await get_redis()
+            await r.setex(self._redis_key(key), int(self._stale_ttl), json.dumps(asdict(entry)))
+        except Exception as e:
+            logger.warning(f"Failed to write scrape cache to Redis: {e}")
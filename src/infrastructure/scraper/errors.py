@@ -0,0 +1,41 @@
+"""
+Scraper exceptions.
+
+Infrastructure-level errors raised by `fetch_metadata`; the scrape queue
+uses them to decide whether and when a job is retried.
+"""
+
+from __future__ import annotations
+
+
+class ScrapeError(Exception):
+    """
+    Raised by `fetch_metadata` when a page could not be fetched.
+
+    `retryable` is True for failures that may succeed later (timeouts,
+    connection errors, HTTP 429/5xx) and False for permanent ones.
+    `retry_after` carries a server- or scheduler-provided delay in seconds.
+    """
+
+    def __init__(
+        self, message: str, *, retryable: bool, retry_after: float | None = None
+    ) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+class ScrapeDeferred(ScrapeError):
+    """
+    Raised when a host is too busy (or backing off) to start a request now.
+
+    Not a failure of the job itself, so the queue does not count it as an
+    attempt.
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(
+            f"Host {host} is busy; retry in {retry_after:.1f}s",
+            retryable=True,
+            retry_after=retry_after,
+        )
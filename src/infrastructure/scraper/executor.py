@@ -0,0 +1,141 @@
+"""
+Executor for CPU-bound HTML parsing.
+
+Parsing is synchronous work; running it directly in a coroutine stalls the
+event loop and every request it is serving. `ParseExecutor` moves it to a
+process pool (true parallelism, pickling overhead per document) and sends
+small documents to a thread pool, where that overhead would dominate.
+
+Outstanding parse jobs are capped by `scraper_parse_max_pending`: once the
+cap is reached, further scrapes wait for a slot instead of piling work up
+in the pool's unbounded internal queue. The current backlog is exposed via
+`stats()` and reported by the /health endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from src.infrastructure.config import settings
+from src.infrastructure.scraper.parser import parse_metadata, parse_metadata_bs4
+
+logger = logging.getLogger("SaveLinks.scraper")
+
+# Executor modes accepted by SCRAPER_PARSE_EXECUTOR
+_MODES = ("process", "thread", "inline")
+
+
+def _parse(markup: str, url: str, head_only: bool, parser: str) -> dict[str, Any]:
+    """Run the configured parser (module-level so process pools can pickle it)."""
+    if parser == "bs4":
+        return parse_metadata_bs4(markup, url)
+    return parse_metadata(markup, url, head_only=head_only)
+
+
+class ParseExecutor:
+    """Runs metadata parsing off the event loop with bounded queueing."""
+
+    def __init__(
+        self,
+        mode: str = "process",
+        workers: int = 2,
+        thread_max_bytes: int = 16 * 1024,
+        max_pending: int = 64,
+    ) -> None:
+        if mode not in _MODES:
+            raise ValueError(f"Unknown parse executor mode {mode!r}; expected one of {_MODES}.")
+        self._mode = mode
+        self._thread_max_bytes = thread_max_bytes
+        self._max_pending = max(1, max_pending)
+        self._slots = asyncio.Semaphore(self._max_pending)
+        self._queued = 0
+        self._running = 0
+
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._thread_pool: ThreadPoolExecutor | None = None
+        if mode == "process":
+            # "spawn" avoids forking a process that has a running event loop
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        if mode in ("process", "thread"):
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="savelinks-parse"
+            )
+
+    @property
+    def backlog(self) -> int:
+        """Parse jobs waiting for a slot or currently running."""
+        return self._queued + self._running
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of the executor backlog for health/metrics reporting."""
+        return {
+            "mode": self._mode,
+            "queued": self._queued,
+            "running": self._running,
+            "max_pending": self._max_pending,
+        }
+
+    def _pool_for(self, markup: str) -> Executor | None:
+        if self._process_pool is not None and len(markup) > self._thread_max_bytes:
+            return self._process_pool
+        return self._thread_pool
+
+    async def parse(self, markup: str, url: str) -> dict[str, Any]:
+        """Parse `markup` with the configured parser without blocking the loop."""
+        args = (markup, url, settings.scraper_head_only, settings.scraper_parser)
+        pool = self._pool_for(markup)
+        if pool is None:
+            return _parse(*args)
+
+        self._queued += 1
+        if self._queued + self._running > self._max_pending:
+            logger.warning(f"Parse executor saturated: backlog={self.backlog}")
+        try:
+            await self._slots.acquire()
+        finally:
+            self._queued -= 1
+
+        self._running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, _parse, *args)
+        finally:
+            self._running -= 1
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        """Stop the worker pools, cancelling parses that have not started."""
+        for pool in (self._process_pool, self._thread_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Global parse executor (initialized lazily)
+_parse_executor: ParseExecutor | None = None
+
+
+def get_parse_executor() -> ParseExecutor:
+    """Get or create the shared parse executor."""
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ParseExecutor(
+            mode=settings.scraper_parse_executor,
+            workers=settings.scraper_parse_workers,
+            thread_max_bytes=settings.scraper_parse_thread_max_bytes,
+            max_pending=settings.scraper_parse_max_pending,
+        )
+    return _parse_executor
+
+
+def close_parse_executor() -> None:
+    """Shut down the shared parse executor on application shutdown."""
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown()
+        _parse_executor = None
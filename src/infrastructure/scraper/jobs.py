@@ -0,0 +1,76 @@
+"""
+Scrape job: fetch a link's page and store the extracted metadata.
+
+Shared by the queue worker (`src/worker.py`) and the in-process fallback
+used by the API when the queue is unavailable.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import timedelta
+
+from src.core.link.domain.models import LinkMetadataUpdate, PageMetadata
+from src.core.link.domain.urls import url_hash
+from src.infrastructure.config import settings
+from src.infrastructure.database.database import async_session_factory
+from src.infrastructure.database.postgres_repository import PostgresPageMetadataRepository
+from src.infrastructure.database.write_buffer import get_metadata_writer
+from src.infrastructure.scraper.errors import ScrapeError
+from src.infrastructure.scraper.parser import empty_result
+from src.infrastructure.scraper.scraper import fetch_metadata
+
+logger = logging.getLogger("SaveLinks.scraper")
+
+
+async def _fresh_page(page_hash: str) -> PageMetadata | None:
+    async with async_session_factory() as session:
+        page_repo = PostgresPageMetadataRepository(session)
+        return await page_repo.get_fresh_page(
+            page_hash, timedelta(seconds=settings.page_metadata_ttl_seconds)
+        )
+
+
+async def scrape_and_update(link_id: uuid.UUID, user_id: uuid.UUID, url: str) -> None:
+    """
+    Scrape metadata from `url` and update the link record.
+
+    The result is written once to the shared page metadata store and the
+    link references it; if another user's save already produced a fresh
+    entry, no network fetch happens at all. Writes go through the shared
+    write-behind buffer, which commits many results in one transaction.
+
+    Raises `ScrapeError` for fetch failures worth retrying and re-raises
+    database errors, so the caller can reschedule the job. Permanent fetch
+    failures still mark the link as processed (with empty metadata).
+    """
+    page_hash = url_hash(url)
+    page = await _fresh_page(page_hash)
+    store_page = page is None
+
+    if store_page:
+        try:
+            metadata = await fetch_metadata(url)
+        except ScrapeError as e:
+            if e.retryable:
+                raise
+            logger.warning(str(e))
+            metadata = empty_result()
+        page = PageMetadata(
+            url_hash=page_hash,
+            url=url,
+            title=metadata.get("title"),
+            description=metadata.get("description"),
+            metadata=metadata,
+        )
+
+    update = LinkMetadataUpdate(
+        link_id=link_id,
+        user_id=user_id,
+        title=page.title,
+        description=page.description,
+        metadata=page.metadata,
+        page_hash=page.url_hash,
+    )
+    await get_metadata_writer().submit(update, page if store_page else None)
@@ -0,0 +1,310 @@
+"""
+HTML metadata parsers for the scraper.
+
+`parse_metadata` is a single-pass, event-driven extractor built on the
+stdlib `html.parser`. It collects the title, description, OpenGraph and
+Twitter Card tags and the favicon link in one scan, without building a
+document tree, and stops at `</head>` when `head_only` is set.
+
+`parse_metadata_bs4` is the original BeautifulSoup implementation. It is
+kept as the reference the fast parser is tested and benchmarked against,
+and can be selected with `SCRAPER_PARSER=bs4`.
+"""
+
+from __future__ import annotations
+
+import html
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import Any
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+# Void elements as BeautifulSoup's html.parser builder knows them — they are
+# never pushed on the open-element stack.
+_VOID_ELEMENTS = frozenset({
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed",
+    "frame", "hr", "image", "img", "input", "isindex", "keygen", "link",
+    "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr",
+})
+
+# Fields that fall back to og:* / twitter:* values when not set directly
+_FALLBACK_KEYS = ("title", "description", "image")
+
+
+def empty_result() -> dict[str, Any]:
+    """The metadata dict shape returned by every parser (and on failure)."""
+    return {
+        "title": None,
+        "description": None,
+        "image": None,
+        "favicon": None,
+        "og": {},
+        "twitter": {},
+    }
+
+
+def _absolute_favicon(href: str, url: str) -> str:
+    """Make root-relative favicon hrefs absolute."""
+    if href.startswith("/"):
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}{href}"
+    return href
+
+
+# ── Fast single-pass parser ────────────────────────────────────────
+
+
+class _StopParsing(Exception):
+    """Raised from a handler to abandon the rest of the document."""
+    pass
+
+
+class _MetadataParser(HTMLParser):
+    """
+    Streams parse events and records only what the scraper needs.
+
+    The only structure tracked is the stack of open element names (to know
+    when the first <title> closes) and the children of that <title>, so that
+    the title text follows the same rules as BeautifulSoup's `Tag.string`:
+    a single text child, or a single child element with a single text child.
+    """
+
+    def __init__(self, head_only: bool) -> None:
+        super().__init__(convert_charrefs=False)
+        self._head_only = head_only
+
+        # Open elements as (name, children) — children is a list only for
+        # the first <title> and elements nested inside it.
+        self._open: list[tuple[str, list | None]] = []
+        self._text: list[str] = []
+        self._title_children: list | None = None
+        self._in_title = False
+
+        self.description: str | None = None
+        self._description_seen = False
+        self.og: dict[str, str] = {}
+        self.twitter: dict[str, str] = {}
+        self.og_fallback: dict[str, str] = {}
+        self.twitter_fallback: dict[str, str] = {}
+        self.favicon: str | None = None
+        self._favicon_seen = False
+
+    # ── Title tree bookkeeping ─────────────────────────────────────
+
+    def _flush_text(self) -> None:
+        if self._text:
+            text = "".join(self._text)
+            self._text = []
+            if self._in_title:
+                self._open[-1][1].append(("str", text))
+
+    def _push(self, name: str) -> None:
+        children = None
+        if self._in_title:
+            children = []
+            self._open[-1][1].append(("tag", children))
+        elif name == "title" and self._title_children is None:
+            children = self._title_children = []
+            self._in_title = True
+        self._open.append((name, children))
+
+    def _pop_to(self, name: str) -> None:
+        if not any(open_name == name for open_name, _ in self._open):
+            return
+        while self._open:
+            open_name, children = self._open.pop()
+            if children is self._title_children:
+                self._in_title = False
+            if open_name == name:
+                break
+
+    def title(self) -> str | None:
+        """Text of the first <title>, following `Tag.string` semantics."""
+        children = self._title_children
+        while children is not None and len(children) == 1:
+            kind, value = children[0]
+            if kind == "str":
+                return value
+            children = value
+        return None
+
+    # ── HTMLParser events ──────────────────────────────────────────
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush_text()
+        attributes = {key: value or "" for key, value in attrs}
+        if tag == "meta":
+            self._handle_meta(attributes)
+        elif tag == "link":
+            self._handle_link(attributes)
+
+        if tag in _VOID_ELEMENTS:
+            if self._in_title:
+                self._open[-1][1].append(("tag", []))
+        else:
+            self._push(tag)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self._pop_to(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        self._pop_to(tag)
+        if tag == "head" and self._head_only:
+            raise _StopParsing
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self._text.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        character = html5.get(f"{name};")
+        self.handle_data(character if character is not None else f"&{name}")
+
+    def handle_charref(self, name: str) -> None:
+        self.handle_data(html.unescape(f"&#{name};"))
+
+    def _handle_markup(self, data: str) -> None:
+        # Comments, declarations, PIs and CDATA are strings to bs4 as well;
+        # it collapses an empty one to " " like any whitespace-only string
+        self._flush_text()
+        if self._in_title:
+            self._open[-1][1].append(("str", data or " "))
+
+    def handle_comment(self, data: str) -> None:
+        self._handle_markup(data)
+
+    def handle_decl(self, decl: str) -> None:
+        self._handle_markup(decl[len("DOCTYPE "):])
+
+    def handle_pi(self, data: str) -> None:
+        self._handle_markup(data)
+
+    def unknown_decl(self, data: str) -> None:
+        if data.upper().startswith("CDATA["):
+            data = data[len("CDATA["):]
+        self._handle_markup(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+
+    # ── Tag handlers ───────────────────────────────────────────────
+
+    def _handle_meta(self, attributes: dict[str, str]) -> None:
+        content = attributes.get("content", "")
+
+        name = attributes.get("name")
+        if name == "description" and not self._description_seen:
+            self._description_seen = True
+            if content:
+                self.description = content.strip()
+        if name is not None and name.startswith("twitter:") and content:
+            key = name[8:]
+            self.twitter[key] = content
+            self.twitter_fallback.setdefault(key, content)
+
+        prop = attributes.get("property")
+        if prop is not None and prop.startswith("og:") and content:
+            key = prop[3:]
+            self.og[key] = content
+            self.og_fallback.setdefault(key, content)
+
+    def _handle_link(self, attributes: dict[str, str]) -> None:
+        if self._favicon_seen:
+            return
+        if any("icon" in token for token in attributes.get("rel", "").split()):
+            self._favicon_seen = True
+            self.favicon = attributes.get("href") or None
+
+
+def parse_metadata(markup: str, url: str, *, head_only: bool = True) -> dict[str, Any]:
+    """
+    Extract metadata from an HTML document in a single pass.
+
+    Produces exactly the dict `parse_metadata_bs4` would for the same markup.
+    With `head_only`, parsing stops at `</head>`; the streaming fetch already
+    cuts documents there, so this only matters for full documents.
+    """
+    parser = _MetadataParser(head_only=head_only)
+    try:
+        parser.feed(markup)
+        parser.close()
+    except _StopParsing:
+        pass
+
+    result = empty_result()
+    title = parser.title()
+    if title:
+        result["title"] = title.strip()
+    result["description"] = parser.description
+    result["og"] = parser.og
+    result["twitter"] = parser.twitter
+
+    # og:* wins over twitter:* — the reference parser scans OpenGraph first
+    for fallback in (parser.og_fallback, parser.twitter_fallback):
+        for key in _FALLBACK_KEYS:
+            if not result[key] and key in fallback:
+                result[key] = fallback[key]
+
+    if parser.favicon:
+        result["favicon"] = _absolute_favicon(parser.favicon, url)
+    return result
+
+
+# ── Reference BeautifulSoup parser ─────────────────────────────────
+
+
+def parse_metadata_bs4(markup: str, url: str) -> dict[str, Any]:
+    """Extract metadata by building a full BeautifulSoup tree (reference)."""
+    result = empty_result()
+    soup = BeautifulSoup(markup, "html.parser")
+
+    # <title> tag
+    title_tag = soup.find("title")
+    if title_tag and title_tag.string:
+        result["title"] = title_tag.string.strip()
+
+    # Meta description
+    desc_tag = soup.find("meta", attrs={"name": "description"})
+    if desc_tag and desc_tag.get("content"):
+        result["description"] = desc_tag["content"].strip()
+
+    # OpenGraph tags
+    for tag in soup.find_all("meta", attrs={"property": True}):
+        prop = tag.get("property", "")
+        content = tag.get("content", "")
+        if prop.startswith("og:") and content:
+            key = prop[3:]  # strip "og:" prefix
+            result["og"][key] = content
+            if key == "title" and not result["title"]:
+                result["title"] = content
+            elif key == "description" and not result["description"]:
+                result["description"] = content
+            elif key == "image" and not result["image"]:
+                result["image"] = content
+
+    # Twitter Card tags
+    for tag in soup.find_all("meta", attrs={"name": True}):
+        name = tag.get("name", "")
+        content = tag.get("content", "")
+        if name.startswith("twitter:") and content:
+            key = name[8:]  # strip "twitter:" prefix
+            result["twitter"][key] = content
+            if key == "title" and not result["title"]:
+                result["title"] = content
+            elif key == "description" and not result["description"]:
+                result["description"] = content
+            elif key == "image" and not result["image"]:
+                result["image"] = content
+
+    # Favicon
+    icon_link = soup.find("link", rel=lambda r: r and "icon" in r)
+    if icon_link and icon_link.get("href"):
+        result["favicon"] = _absolute_favicon(icon_link["href"], url)
+
+    return result
@@ -0,0 +1,202 @@
+"""
+Per-domain politeness for the metadata scraper.
+
+`DomainScheduler` sits in front of every page fetch and, per host:
+
+- caps concurrent requests (`scraper_max_connections_per_host`),
+- spaces request starts by a minimum delay (`scraper_min_host_delay_seconds`,
+  raised to the host's robots.txt Crawl-delay when that is larger),
+- honors `Retry-After` from 429/503 responses by pushing the host's next
+  allowed start into the future,
+- caches each host's robots.txt for `scraper_robots_ttl_seconds`.
+
+A scrape that would have to wait longer than `scraper_max_host_wait_seconds`
+for its host is not parked on a worker slot: `ScrapeDeferred` is raised so
+the queue can hand the slot to other domains and retry the job later.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+from src.infrastructure.scraper.errors import ScrapeDeferred
+
+logger = logging.getLogger("SaveLinks.scraper")
+
+# Product token matched against robots.txt User-agent lines
+ROBOTS_USER_AGENT = "SaveLinksBot"
+
+# Upper bound on cached robots.txt entries
+_ROBOTS_CACHE_SIZE = 10_000
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class _HostState:
+    semaphore: asyncio.Semaphore
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    next_start: float = 0.0
+    users: int = 0
+
+
+@dataclass
+class _RobotsEntry:
+    parser: RobotFileParser | None  # None → fetch failed, allow everything
+    expires: float
+
+
+class DomainScheduler:
+    """Per-host concurrency cap, request spacing, back-off and robots.txt."""
+
+    def __init__(
+        self,
+        *,
+        per_host: int = 4,
+        min_delay: float = 1.0,
+        max_wait: float = 10.0,
+        max_retry_after: float = 3600.0,
+        respect_robots: bool = True,
+        robots_ttl: float = 3600.0,
+    ) -> None:
+        self._per_host = max(1, per_host)
+        self._min_delay = min_delay
+        self._max_wait = max_wait
+        self._max_retry_after = max_retry_after
+        self._respect_robots = respect_robots
+        self._robots_ttl = robots_ttl
+        self._hosts: dict[str, _HostState] = {}
+        self._robots: OrderedDict[str, _RobotsEntry] = OrderedDict()
+        self._robots_loading: dict[str, asyncio.Task] = {}
+
+    # ── Request slots ──────────────────────────────────────────────
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(asyncio.Semaphore(self._per_host))
+        return state
+
+    def _release_state(self, host: str, state: _HostState) -> None:
+        state.users -= 1
+        # Keep the state while a back-off or crawl delay is still pending
+        if state.users <= 0 and state.next_start <= time.monotonic():
+            self._hosts.pop(host, None)
+
+    def _delay_for(self, host: str) -> float:
+        """Minimum spacing between request starts, honoring Crawl-delay."""
+        entry = self._robots.get(host)
+        crawl_delay = None
+        if entry is not None and entry.parser is not None:
+            crawl_delay = entry.parser.crawl_delay(ROBOTS_USER_AGENT)
+        return max(self._min_delay, float(crawl_delay or 0))
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """
+        Wait for permission to send one request to `host`.
+
+        Raises `ScrapeDeferred` instead of waiting when the estimated wait
+        (back-off plus requests already queued for the host) exceeds
+        `max_wait`.
+        """
+        state = self._state(host)
+        delay = self._delay_for(host)
+        queued_rounds = state.users // self._per_host
+        estimate = max(0.0, state.next_start - time.monotonic()) + queued_rounds * delay
+        if estimate > self._max_wait:
+            if state.users == 0:
+                self._hosts.pop(host, None)
+            raise ScrapeDeferred(host, estimate)
+
+        state.users += 1
+        try:
+            async with state.semaphore:
+                async with state.lock:
+                    wait = state.next_start - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    state.next_start = time.monotonic() + delay
+                yield
+        finally:
+            self._release_state(host, state)
+
+    def defer(self, host: str, seconds: float) -> None:
+        """Hold off new requests to `host` for `seconds` (e.g. Retry-After)."""
+        seconds = min(seconds, self._max_retry_after)
+        now = time.monotonic()
+        # Drop idle hosts whose earlier back-off has already expired
+        for idle_host, idle in list(self._hosts.items()):
+            if idle.users <= 0 and idle.next_start <= now:
+                del self._hosts[idle_host]
+
+        state = self._state(host)
+        state.next_start = max(state.next_start, now + seconds)
+        logger.info(f"Backing off {host} for {seconds:.0f}s")
+
+    # ── robots.txt ─────────────────────────────────────────────────
+
+    async def allowed(self, client: httpx.AsyncClient, scheme: str, host: str, url: str) -> bool:
+        """Whether robots.txt for `host` lets us fetch `url` (cached per host)."""
+        if not self._respect_robots:
+            return True
+
+        entry = self._robots.get(host)
+        if entry is None or entry.expires <= time.monotonic():
+            # One robots.txt fetch per host, shared by concurrent scrapes
+            task = self._robots_loading.get(host)
+            if task is None:
+                task = asyncio.create_task(self._load_robots(client, f"{scheme}://{host}", host))
+                self._robots_loading[host] = task
+                task.add_done_callback(lambda _: self._robots_loading.pop(host, None))
+            entry = await asyncio.shield(task)
+
+        if entry.parser is None:
+            return True
+        return entry.parser.can_fetch(ROBOTS_USER_AGENT, url)
+
+    async def _load_robots(
+        self, client: httpx.AsyncClient, origin: str, host: str
+    ) -> _RobotsEntry:
+        parser: RobotFileParser | None = RobotFileParser()
+        try:
+            response = await client.get(f"{origin}/robots.txt")
+            # Same rules as RobotFileParser.read(): 401/403 → disallow all,
+            # other 4xx → allow all
+            if response.status_code in (401, 403):
+                parser.disallow_all = True
+            elif response.status_code >= 400:
+                parser.allow_all = True
+            else:
+                parser.parse(response.text.splitlines())
+        except Exception as e:
+            logger.info(f"Could not fetch {origin}/robots.txt ({e}); allowing scrapes.")
+            parser = None
+
+        entry = _RobotsEntry(parser=parser, expires=time.monotonic() + self._robots_ttl)
+        self._robots[host] = entry
+        self._robots.move_to_end(host)
+        while len(self._robots) > _ROBOTS_CACHE_SIZE:
+            self._robots.popitem(last=False)
+        return entry
@@ -2,33 +2,313 @@
 Async metadata scraper adapter.
 
 Extracts OpenGraph, Twitter Card, and generic meta tags from URLs.
-Uses httpx for async HTTP and BeautifulSoup for HTML parsing.
-Initially called via FastAPI BackgroundTasks (Celery deferred to FAZA 1).
+Uses httpx for async HTTP and a single-pass `html.parser` extractor
+(see `parser.py`; BeautifulSoup remains available via SCRAPER_PARSER=bs4).
+Called by the scrape worker (`src/worker.py`) for jobs taken from the
+Redis stream queue, or in-process when the queue is unavailable.
+
+A single long-lived `httpx.AsyncClient` is shared by all scrapes so that
+TCP/TLS connections are pooled and kept alive across links from the same
+host. The client is created lazily (or eagerly by the app lifespan) and
+closed on shutdown via `close_scraper_client()`.
+
+Every fetch goes through a per-domain politeness scheduler (see
+`politeness.py`) that caps per-host concurrency, spaces requests, honors
+Retry-After and robots.txt. URLs that just failed, and hosts that keep
+timing out, are skipped without a request for an exponentially growing
+period (see `breaker.py`).
+
+Pages are streamed rather than read whole: the fetch stops at `</head>`
+(where every tag we extract lives) or at a byte budget, and responses that
+advertise a non-HTML Content-Type or an oversized Content-Length are
+rejected before their body is downloaded.
+
+Results are cached in-process and in Redis with their ETag/Last-Modified
+validators (see `cache.py`), so known URLs cost a conditional request —
+or nothing — instead of a full download and parse.
 """
 
 from __future__ import annotations
 
+import importlib.util
 import logging
+import re
+import time
+from dataclasses import replace
 from typing import Any
+from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 
-logger = logging.getLogger("SaveLinks.scraper")
+from src.core.link.domain.urls import url_hash
+from src.infrastructure.config import settings
+from src.infrastructure.scraper.breaker import CircuitBreaker
+from src.infrastructure.scraper.cache import CachedScrape, ScrapeCache
+from src.infrastructure.scraper.errors import ScrapeError
+from src.infrastructure.scraper.executor import get_parse_executor
+from src.infrastructure.scraper.parser import empty_result
+from src.infrastructure.scraper.politeness import DomainScheduler, parse_retry_after
 
-# Default timeout for HTTP requests (seconds)
-_REQUEST_TIMEOUT = 10.0
+logger = logging.getLogger("SaveLinks.scraper")
 
 # Default user-agent to avoid bot blocks
 _USER_AGENT = (
     "Mozilla/5.0 (compatible; SaveLinksBot/1.0; +https://github.com/savelinks)"
 )
 
+# Content types worth parsing for metadata
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# End of the document head — everything we extract lives before it
+_HEAD_END = re.compile(rb"</head\s*>", re.IGNORECASE)
+
+# Global scraper client (initialized lazily)
+_scraper_client: httpx.AsyncClient | None = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (`pip install httpx[http2]`)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client from settings."""
+    http2 = settings.scraper_http2
+    if http2 and not _http2_available():
+        logger.warning("SCRAPER_HTTP2 is enabled but 'h2' is not installed; using HTTP/1.1.")
+        http2 = False
+
+    return httpx.AsyncClient(
+        timeout=settings.scraper_timeout_seconds,
+        follow_redirects=True,
+        headers={"User-Agent": _USER_AGENT},
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.scraper_max_connections,
+            max_keepalive_connections=settings.scraper_max_keepalive_connections,
+            keepalive_expiry=settings.scraper_keepalive_expiry_seconds,
+        ),
+    )
+
+
+async def get_scraper_client() -> httpx.AsyncClient:
+    """Get or create the shared scraper HTTP client."""
+    global _scraper_client
+    if _scraper_client is None or _scraper_client.is_closed:
+        _scraper_client = _build_client()
+    return _scraper_client
+
+
+async def close_scraper_client() -> None:
+    """Close the shared scraper client and its connection pool on shutdown."""
+    global _scraper_client
+    if _scraper_client is not None:
+        await _scraper_client.aclose()
+        _scraper_client = None
+
+
+# ── Per-domain politeness ───────────────────────────────────────
+
+_scheduler = DomainScheduler(
+    per_host=settings.scraper_max_connections_per_host,
+    min_delay=settings.scraper_min_host_delay_seconds,
+    max_wait=settings.scraper_max_host_wait_seconds,
+    max_retry_after=settings.scraper_retry_after_max_seconds,
+    respect_robots=settings.scraper_respect_robots,
+    robots_ttl=settings.scraper_robots_ttl_seconds,
+)
+
+
+# ── Failing targets ────────────────────────────────────────────────
+
+# Negative cache: a URL that just failed is not refetched right away
+_failed_urls = CircuitBreaker(
+    base_delay=settings.scraper_failure_backoff_seconds,
+    max_delay=settings.scraper_failure_backoff_max_seconds,
+)
+
+# Hosts that keep timing out / refusing connections are skipped entirely
+_host_breaker = CircuitBreaker(
+    threshold=settings.scraper_breaker_failure_threshold,
+    base_delay=settings.scraper_failure_backoff_seconds,
+    max_delay=settings.scraper_failure_backoff_max_seconds,
+)
+
+
+def _record_host_failure(key: str, host: str) -> None:
+    """The host is unreachable or too slow — count it against URL and host."""
+    _failed_urls.record_failure(key)
+    _host_breaker.record_failure(host)
+
+
+def _record_success(key: str, host: str) -> None:
+    _failed_urls.record_success(key)
+    _host_breaker.record_success(host)
+
+
+# ── Result cache ───────────────────────────────────────────────────
+
+_cache = ScrapeCache(
+    ttl=settings.scrape_cache_ttl_seconds,
+    stale_ttl=settings.scrape_cache_stale_ttl_seconds,
+    lru_size=settings.scrape_cache_lru_size,
+)
+
+
+# ── Streaming fetch ────────────────────────────────────────────────
+
+
+class _UnscrapableResponse(Exception):
+    """Raised when a response is skipped before its body is downloaded."""
+    pass
+
+
+async def _fetch_html(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str] | None = None
+) -> tuple[str | None, httpx.Headers]:
+    """
+    Stream a page and return (at most) its head as text, plus the headers.
+
+    Reads chunks until `</head>` is seen (when `scraper_head_only` is on) or
+    `scraper_max_read_bytes` is reached, then closes the connection without
+    draining the rest of the body. Returns None as the text when a
+    conditional request is answered with 304 Not Modified; a 304 to an
+    unconditional request has nothing to reuse and fails like other statuses.
+    """
+    max_bytes = settings.scraper_max_read_bytes
+    async with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304 and headers:
+            return None, response.headers
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "")
+        mime = content_type.split(";", 1)[0].strip().lower()
+        if mime and mime not in _HTML_CONTENT_TYPES:
+            raise _UnscrapableResponse(f"non-HTML content type {mime!r}")
+
+        content_length = response.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > settings.scraper_max_content_length:
+            raise _UnscrapableResponse(f"content length {content_length} exceeds limit")
+
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            # Resume the </head> search just before the new chunk so a tag
+            # split across chunk boundaries is still found.
+            search_from = max(0, len(body) - 8)
+            body += chunk
+            if settings.scraper_head_only:
+                match = _HEAD_END.search(body, search_from)
+                if match:
+                    del body[match.end():]
+                    break
+            if len(body) >= max_bytes:
+                del body[max_bytes:]
+                break
 
-async def extract_metadata(url: str) -> dict[str, Any]:
+        encoding = response.charset_encoding or "utf-8"
+
+    try:
+        return bytes(body).decode(encoding, errors="replace"), response.headers
+    except LookupError:  # unknown charset label in the Content-Type header
+        return bytes(body).decode("utf-8", errors="replace"), response.headers
+
+
+async def fetch_metadata(
+    url: str, client: httpx.AsyncClient | None = None
+) -> dict[str, Any]:
+    """
+    Fetch a URL and extract metadata, raising `ScrapeError` on failure.
+
+    Responses that are not worth parsing (non-HTML, oversized) are not
+    errors — they yield an empty result.
+
+    Results are cached: a fresh entry is returned without any request, and
+    a stale one is revalidated with a conditional request.
+
+    URLs that recently failed and hosts whose breaker is open fail fast with
+    a retryable `ScrapeError` (the link stays unprocessed) instead of
+    waiting for another timeout.
+    """
+    cache_key = url_hash(url)
+    cached = await _cache.get(cache_key)
+    if cached is not None and cached.is_fresh(_cache.ttl):
+        return cached.metadata
+
+    client = client or await get_scraper_client()
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+
+    blocked_for = max(_failed_urls.blocked_for(cache_key), _host_breaker.blocked_for(host))
+    if blocked_for > 0:
+        raise ScrapeError(
+            f"Skipping {url} after recent failures; retry in {blocked_for:.0f}s",
+            retryable=True,
+            retry_after=blocked_for,
+        )
+
+    if not await _scheduler.allowed(client, parsed.scheme, host, url):
+        raise ScrapeError(f"Disallowed by robots.txt: {url}", retryable=False)
+
+    try:
+        async with _scheduler.slot(host):
+            html, headers = await _fetch_html(
+                client, url, cached.conditional_headers() if cached else None
+            )
+    except httpx.TimeoutException as e:
+        _record_host_failure(cache_key, host)
+        raise ScrapeError(f"Timeout scraping metadata from: {url}", retryable=True) from e
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code
+        retry_after = None
+        if status in (429, 503):
+            retry_after = parse_retry_after(e.response.headers.get("retry-after"))
+            _scheduler.defer(host, retry_after or settings.scraper_min_host_delay_seconds)
+        else:
+            _failed_urls.record_failure(cache_key)
+        _host_breaker.record_success(host)  # the host answered
+        raise ScrapeError(
+            f"HTTP error scraping {url}: {status}",
+            retryable=status == 429 or status >= 500,
+            retry_after=retry_after,
+        ) from e
+    except httpx.TransportError as e:
+        _record_host_failure(cache_key, host)
+        raise ScrapeError(f"Failed to fetch {url}: {e}", retryable=True) from e
+    except _UnscrapableResponse as e:
+        _record_success(cache_key, host)
+        logger.info(f"Skipped scraping {url}: {e}")
+        metadata = empty_result()
+        await _cache.set(cache_key, CachedScrape(metadata, fetched_at=time.time()))
+        return metadata
+
+    _record_success(cache_key, host)
+    if html is None:
+        # 304 Not Modified — the stored metadata is still current
+        await _cache.set(cache_key, replace(cached, fetched_at=time.time()))
+        return cached.metadata
+
+    # Parsing is CPU-bound — run it in the executor, not on the event loop
+    metadata = await get_parse_executor().parse(html, url)
+    await _cache.set(
+        cache_key,
+        CachedScrape(
+            metadata,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            fetched_at=time.time(),
+        ),
+    )
+    return metadata
+
+
+async def extract_metadata(
+    url: str, client: httpx.AsyncClient | None = None
+) -> dict[str, Any]:
     """
     Fetch a URL and extract metadata.
 
+    Uses the shared pooled client unless an explicit `client` is given.
+
     Returns a dict with keys:
         - title: str | None
         - description: str | None
@@ -37,83 +317,12 @@ async def extract_metadata(url: str) -> dict[str, Any]:
         - og: dict (all OpenGraph tags)
         - twitter: dict (all Twitter Card tags)
 
-    Never raises — returns partial results on failure.
+    Never raises — returns an empty result on failure.
     """
-    result: dict[str, Any] = {
-        "title": None,
-        "description": None,
-        "image": None,
-        "favicon": None,
-        "og": {},
-        "twitter": {},
-    }
-
     try:
-        async with httpx.AsyncClient(
-            timeout=_REQUEST_TIMEOUT,
-            follow_redirects=True,
-            headers={"User-Agent": _USER_AGENT},
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # <title> tag
-        title_tag = soup.find("title")
-        if title_tag and title_tag.string:
-            result["title"] = title_tag.string.strip()
-
-        # Meta description
-        desc_tag = soup.find("meta", attrs={"name": "description"})
-        if desc_tag and desc_tag.get("content"):
-            result["description"] = desc_tag["content"].strip()
-
-        # OpenGraph tags
-        for tag in soup.find_all("meta", attrs={"property": True}):
-            prop = tag.get("property", "")
-            content = tag.get("content", "")
-            if prop.startswith("og:") and content:
-                key = prop[3:]  # strip "og:" prefix
-                result["og"][key] = content
-                if key == "title" and not result["title"]:
-                    result["title"] = content
-                elif key == "description" and not result["description"]:
-                    result["description"] = content
-                elif key == "image" and not result["image"]:
-                    result["image"] = content
-
-        # Twitter Card tags
-        for tag in soup.find_all("meta", attrs={"name": True}):
-            name = tag.get("name", "")
-            content = tag.get("content", "")
-            if name.startswith("twitter:") and content:
-                key = name[8:]  # strip "twitter:" prefix
-                result["twitter"][key] = content
-                if key == "title" and not result["title"]:
-                    result["title"] = content
-                elif key == "description" and not result["description"]:
-                    result["description"] = content
-                elif key == "image" and not result["image"]:
-                    result["image"] = content
-
-        # Favicon
-        icon_link = soup.find("link", rel=lambda r: r and "icon" in r)
-        if icon_link and icon_link.get("href"):
-            favicon_href = icon_link["href"]
-            # Make relative URLs absolute
-            if favicon_href.startswith("/"):
-                from urllib.parse import urlparse
-
-                parsed = urlparse(url)
-                favicon_href = f"{parsed.scheme}://{parsed.netloc}{favicon_href}"
-            result["favicon"] = favicon_href
-
-    except httpx.TimeoutException:
-        logger.warning(f"Timeout scraping metadata from: {url}")
-    except httpx.HTTPStatusError as e:
-        logger.warning(f"HTTP error scraping {url}: {e.response.status_code}")
+        return await fetch_metadata(url, client)
+    except ScrapeError as e:
+        logger.warning(str(e))
     except Exception as e:
         logger.warning(f"Failed to scrape metadata from {url}: {e}")
-
-    return result
+    return empty_result()
@@ -0,0 +1,81 @@
+"""
+Maintenance commands.
+
+    python -m src.manage migrate
+    python -m src.manage reconcile-counters
+
+`migrate` creates or upgrades the database schema to the version this
+release expects; run it before deploying (the API refuses to start on an
+older schema). Concurrent runs are serialized and it is a no-op when the
+schema is current.
+
+`reconcile-counters` recounts the links of every user and every tag and
+repairs maintained counters that drifted (e.g. after manual SQL or a
+restore). Safe to run at any time, for example from a nightly cron job.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from src.infrastructure.config import settings
+from src.infrastructure.database.database import async_session_factory, engine
+from src.infrastructure.database.migrations import SCHEMA_VERSION, get_schema_version, migrate
+from src.infrastructure.database.postgres_repository import PostgresLinkRepository
+
+logging.basicConfig(
+    level=getattr(logging, settings.log_level.upper(), logging.INFO),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger("SaveLinks.manage")
+
+
+async def migrate_schema() -> int:
+    """Apply pending schema migrations; returns the resulting version."""
+    before = await get_schema_version(engine)
+    version = await migrate(engine)
+    if version == before:
+        logger.info(f"Database schema already at version {version}.")
+    else:
+        logger.info(f"Migrated database schema from version {before} to {version}.")
+    return version
+
+
+async def reconcile_counters() -> int:
+    """Repair per-user and per-tag link counters; returns how many were corrected."""
+    async with async_session_factory() as session:
+        try:
+            repo = PostgresLinkRepository(session)
+            repaired = await repo.reconcile_link_counts()
+            repaired += await repo.reconcile_tag_counts()
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+    logger.info(f"Reconciled link counters: {repaired} corrected.")
+    return repaired
+
+
+async def _run(command: str) -> None:
+    try:
+        if command == "migrate":
+            await migrate_schema()
+        elif command == "reconcile-counters":
+            await reconcile_counters()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SaveLinks maintenance commands")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("migrate", help=f"Create or upgrade the schema (to version {SCHEMA_VERSION})")
+    subcommands.add_parser("reconcile-counters", help="Repair per-user and per-tag link counters")
+    args = parser.parse_args()
+    asyncio.run(_run(args.command))
+
+
+if __name__ == "__main__":
+    main()
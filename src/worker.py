@@ -0,0 +1,68 @@
+"""
+Scrape worker entrypoint.
+
+Consumes metadata scrape jobs from the Redis stream queue, independently of
+the API process, so scrape throughput scales by adding worker processes:
+
+    python -m src.worker [--concurrency N] [--name CONSUMER_NAME]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from src.infrastructure.cache.redis_client import close_redis
+from src.infrastructure.config import settings
+from src.infrastructure.database.database import engine
+from src.infrastructure.database.migrations import check_schema
+from src.infrastructure.database.write_buffer import close_metadata_writer
+from src.infrastructure.queue.scrape_queue import ScrapeWorker
+from src.infrastructure.scraper.executor import close_parse_executor, get_parse_executor
+from src.infrastructure.scraper.jobs import scrape_and_update
+from src.infrastructure.scraper.scraper import close_scraper_client, get_scraper_client
+
+logging.basicConfig(
+    level=getattr(logging, settings.log_level.upper(), logging.INFO),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger("SaveLinks.worker")
+
+
+async def _run(concurrency: int, name: str | None) -> None:
+    await check_schema(engine)
+    await get_scraper_client()
+    get_parse_executor()
+
+    worker = ScrapeWorker(scrape_and_update, concurrency=concurrency, consumer_name=name)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await close_scraper_client()
+        close_parse_executor()
+        await close_metadata_writer()
+        await close_redis()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SaveLinks metadata scrape worker")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.scrape_worker_concurrency,
+        help="Concurrent scrapes per process",
+    )
+    parser.add_argument("--name", default=None, help="Consumer name (default: random)")
+    args = parser.parse_args()
+    asyncio.run(_run(args.concurrency, args.name))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Tests for the durable scrape job queue (Redis streams).
+
+Runs the worker against `FakeRedis`, an in-memory stand-in for the stream,
+consumer group, sorted set and script calls the queue makes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+
+import pytest
+from redis.exceptions import ResponseError
+
+from src.infrastructure.config import settings
+from src.infrastructure.queue import scrape_queue
+from src.infrastructure.queue.scrape_queue import (
+    CONSUMER_GROUP,
+    DEAD_STREAM,
+    JOBS_STREAM,
+    RETRY_ZSET,
+    ScrapeWorker,
+    enqueue_scrape_jobs,
+)
+from src.infrastructure.scraper.errors import ScrapeDeferred
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio (decode_responses=True) for the scrape queue."""
+
+    def __init__(self) -> None:
+        self.streams: dict[str, dict[str, dict]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        # (stream, group) -> delivered ids and pending {id: (consumer, delivered_at)}
+        self.groups: dict[tuple[str, str], dict] = {}
+        self._sequence = 0
+
+    def pipeline(self, transaction: bool = True) -> "_FakePipeline":
+        return _FakePipeline(self)
+
+    async def xadd(self, name: str, fields: dict) -> str:
+        self._sequence += 1
+        message_id = f"{self._sequence}-0"
+        self.streams.setdefault(name, {})[message_id] = {k: str(v) for k, v in fields.items()}
+        return message_id
+
+    async def xgroup_create(self, name, group, id="0", mkstream=False) -> None:
+        if (name, group) in self.groups:
+            raise ResponseError("BUSYGROUP Consumer Group name already exists")
+        self.streams.setdefault(name, {})
+        self.groups[(name, group)] = {"delivered": set(), "pending": {}}
+
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        name = next(iter(streams))
+        state = self.groups[(name, group)]
+        entries = [
+            (message_id, fields)
+            for message_id, fields in self.streams[name].items()
+            if message_id not in state["delivered"]
+        ][:count]
+        for message_id, _ in entries:
+            state["delivered"].add(message_id)
+            state["pending"][message_id] = (consumer, time.monotonic())
+        if not entries:
+            await asyncio.sleep(0.01)  # Stands in for BLOCK
+            return []
+        return [[name, entries]]
+
+    async def xautoclaim(self, name, group, consumer, min_idle_time, count=None):
+        state = self.groups[(name, group)]
+        now = time.monotonic()
+        claimed = []
+        for message_id, (_, since) in list(state["pending"].items()):
+            if len(claimed) == count:
+                break
+            if (now - since) * 1000 >= min_idle_time:
+                state["pending"][message_id] = (consumer, now)
+                claimed.append((message_id, self.streams[name].get(message_id)))
+        return ["0-0", claimed, []]
+
+    async def xack(self, name, group, message_id) -> int:
+        return int(self.groups[(name, group)]["pending"].pop(message_id, None) is not None)
+
+    async def xdel(self, name, message_id) -> int:
+        return int(self.streams.get(name, {}).pop(message_id, None) is not None)
+
+    async def zadd(self, name, mapping: dict) -> int:
+        self.zsets.setdefault(name, {}).update(mapping)
+        return len(mapping)
+
+    def register_script(self, script: str):
+        assert script == scrape_queue._PROMOTE_DUE_LUA
+
+        async def promote_due(keys, args):
+            # Python rendering of _PROMOTE_DUE_LUA
+            zset, stream = keys
+            members = self.zsets.get(zset, {})
+            due = sorted(
+                (score, member) for member, score in members.items() if score <= float(args[0])
+            )[: int(args[1])]
+            for _, member in due:
+                del members[member]
+                job = json.loads(member)
+                await self.xadd(
+                    stream,
+                    {
+                        "link_id": job["link_id"],
+                        "user_id": job["user_id"],
+                        "url": job["url"],
+                        "attempt": job["attempt"],
+                    },
+                )
+            return len(due)
+
+        return promote_due
+
+
+class _FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def xadd(self, name, fields) -> None:
+        self._calls.append((name, fields))
+
+    async def execute(self) -> list[str]:
+        return [await self._redis.xadd(name, fields) for name, fields in self._calls]
+
+
+@pytest.fixture
+def redis(monkeypatch) -> FakeRedis:
+    fake = FakeRedis()
+
+    async def get_redis():
+        return fake
+
+    monkeypatch.setattr(scrape_queue, "get_redis", get_redis)
+    monkeypatch.setattr(settings, "scrape_queue_enabled", True)
+    return fake
+
+
+async def _worker(redis: FakeRedis, handler) -> ScrapeWorker:
+    """A worker wired to `redis` without entering its run loop."""
+    worker = ScrapeWorker(handler, concurrency=4, consumer_name="test")
+    worker._redis = redis
+    worker._promote_due = redis.register_script(scrape_queue._PROMOTE_DUE_LUA)
+    await worker._ensure_group()
+    return worker
+
+
+def _job(attempt: int = 0) -> dict:
+    return {
+        "link_id": str(uuid.uuid4()),
+        "user_id": str(uuid.uuid4()),
+        "url": "https://example.com/page",
+        "attempt": str(attempt),
+    }
+
+
+def _retries(redis: FakeRedis) -> list[tuple[dict, float]]:
+    return [(json.loads(member), score) for member, score in redis.zsets.get(RETRY_ZSET, {}).items()]
+
+
+def _pending(redis: FakeRedis) -> dict:
+    return redis.groups[(JOBS_STREAM, CONSUMER_GROUP)]["pending"]
+
+
+async def _fail(link_id, user_id, url):
+    raise RuntimeError("boom")
+
+
+@pytest.mark.asyncio
+async def test_completed_job_is_acked_and_deleted(redis):
+    """The run loop hands jobs to the handler, then XACKs and XDELs them."""
+    link_id, user_id = uuid.uuid4(), uuid.uuid4()
+    assert await enqueue_scrape_jobs([(link_id, user_id, "https://example.com/a")])
+    handled = []
+
+    async def handler(*job):
+        handled.append(job)
+        worker.stop()
+
+    worker = ScrapeWorker(handler, concurrency=2, consumer_name="test")
+    await asyncio.wait_for(worker.run(), timeout=5)
+
+    assert handled == [(link_id, user_id, "https://example.com/a")]
+    assert redis.streams[JOBS_STREAM] == {}
+    assert _pending(redis) == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_job_backs_off_exponentially_and_is_promoted(redis, monkeypatch):
+    """Failures park the job in the retry zset with doubling delays; due jobs return."""
+    monkeypatch.setattr(settings, "scrape_retry_base_seconds", 10.0)
+    monkeypatch.setattr(settings, "scrape_retry_max_seconds", 600.0)
+    worker = await _worker(redis, _fail)
+    await redis.xadd(JOBS_STREAM, _job())
+
+    for attempt, delay in ((1, 10.0), (2, 20.0)):
+        [(message_id, fields)] = await worker._read(10)
+        before = time.time()
+        await worker._process(message_id, fields)
+        [(job, due)] = _retries(redis)
+        assert job["attempt"] == attempt
+        assert before + delay / 2 <= due <= time.time() + delay
+        # Settled: acked and removed from the stream while it waits
+        assert _pending(redis) == {} and redis.streams[JOBS_STREAM] == {}
+
+        # Not due yet: stays parked
+        await worker._promote_due(keys=[RETRY_ZSET, JOBS_STREAM], args=[time.time(), 100])
+        assert redis.streams[JOBS_STREAM] == {}
+        await worker._promote_due(keys=[RETRY_ZSET, JOBS_STREAM], args=[due, 100])
+        assert _retries(redis) == []
+        [(_, promoted)] = redis.streams[JOBS_STREAM].items()
+        assert promoted["attempt"] == str(attempt)
+        assert promoted["user_id"] == fields["user_id"]
+
+
+@pytest.mark.asyncio
+async def test_job_is_dead_lettered_after_max_attempts(redis, monkeypatch):
+    """The last allowed failure moves the job to the dead-letter stream."""
+    monkeypatch.setattr(settings, "scrape_job_max_attempts", 3)
+    worker = await _worker(redis, _fail)
+    await redis.xadd(JOBS_STREAM, _job(attempt=2))
+    # Jobs missing their owner can never be written back: dead at once
+    await redis.xadd(JOBS_STREAM, {"link_id": str(uuid.uuid4()), "url": "https://x", "attempt": 0})
+
+    for message_id, fields in await worker._read(10):
+        await worker._process(message_id, fields)
+
+    dead = list(redis.streams[DEAD_STREAM].values())
+    assert [entry["attempt"] for entry in dead] == ["3", "3"]
+    assert dead[0]["error"] == "boom"
+    assert "Malformed" in dead[1]["error"]
+    assert _retries(redis) == []
+    assert _pending(redis) == {} and redis.streams[JOBS_STREAM] == {}
+
+
+@pytest.mark.asyncio
+async def test_stale_pending_jobs_are_reclaimed(redis, monkeypatch):
+    """XAUTOCLAIM takes over jobs a crashed worker left pending; deleted ones are skipped."""
+    monkeypatch.setattr(settings, "scrape_job_claim_idle_seconds", 0)
+    handled = []
+
+    async def handler(*job):
+        handled.append(job)
+
+    crashed = await _worker(redis, handler)
+    kept = await redis.xadd(JOBS_STREAM, _job())
+    gone = await redis.xadd(JOBS_STREAM, _job())
+    assert len(await crashed._read(10)) == 2  # Delivered, never settled
+    await redis.xdel(JOBS_STREAM, gone)
+
+    worker = ScrapeWorker(handler, concurrency=4, consumer_name="rescuer")
+    worker._redis = redis
+    entries = await worker._reclaim(10)
+    assert [message_id for message_id, _ in entries] == [kept]
+
+    await worker._process(*entries[0])
+    assert len(handled) == 1
+    assert kept not in _pending(redis)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("retry_after, delay", [(30.0, 30.0), (0.0, scrape_queue._MIN_DEFER_SECONDS)])
+async def test_deferred_job_is_requeued_without_using_an_attempt(redis, retry_after, delay):
+    """A busy host requeues the job after its hint (never less than the floor)."""
+
+    async def defer(link_id, user_id, url):
+        raise ScrapeDeferred("example.com", retry_after)
+
+    worker = await _worker(redis, defer)
+    await redis.xadd(JOBS_STREAM, _job(attempt=1))
+    [(message_id, fields)] = await worker._read(10)
+    before = time.time()
+    await worker._process(message_id, fields)
+
+    [(job, due)] = _retries(redis)
+    assert job["attempt"] == 1
+    assert before + delay <= due <= time.time() + delay
+    assert _pending(redis) == {}
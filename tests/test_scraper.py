@@ -0,0 +1,421 @@
+"""
+Tests for the metadata scraper adapter.
+
+Uses `httpx.MockTransport` so no real network traffic is made.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.infrastructure.scraper import scraper
+from src.infrastructure.scraper.breaker import CircuitBreaker
+from src.infrastructure.scraper.cache import ScrapeCache
+from src.infrastructure.scraper.errors import ScrapeDeferred, ScrapeError
+from src.infrastructure.scraper.executor import ParseExecutor
+from src.infrastructure.scraper.parser import parse_metadata, parse_metadata_bs4
+from src.infrastructure.scraper.politeness import DomainScheduler
+from src.infrastructure.scraper.scraper import (
+    close_scraper_client,
+    extract_metadata,
+    fetch_metadata,
+    get_scraper_client,
+)
+
+
+_PAGE = """
+<html>
+  <head>
+    <title> Example Page </title>
+    <meta name="description" content="An example description.">
+    <meta property="og:image" content="https://example.com/og.png">
+    <meta name="twitter:card" content="summary">
+    <link rel="shortcut icon" href="/favicon.ico">
+  </head>
+  <body><p>Hello</p></body>
+</html>
+"""
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture(autouse=True)
+def _no_politeness_delays(monkeypatch):
+    """Tests hit the same fake hosts repeatedly — skip spacing and robots.txt."""
+    monkeypatch.setattr(
+        scraper, "_scheduler", DomainScheduler(min_delay=0, respect_robots=False)
+    )
+
+
+@pytest.fixture(autouse=True)
+def _empty_scrape_cache(monkeypatch):
+    """Each test starts with an empty, in-process-only result cache."""
+    monkeypatch.setattr(scraper, "_cache", ScrapeCache(use_redis=False))
+
+
+@pytest.fixture(autouse=True)
+def _no_failure_memory(monkeypatch):
+    """Failures recorded by one test must not block scrapes in another."""
+    monkeypatch.setattr(scraper, "_failed_urls", CircuitBreaker())
+    monkeypatch.setattr(scraper, "_host_breaker", CircuitBreaker(threshold=3))
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused():
+    """The pooled client is created once and reused until closed."""
+    first = await get_scraper_client()
+    second = await get_scraper_client()
+    assert first is second
+
+    await close_scraper_client()
+    assert first.is_closed
+    third = await get_scraper_client()
+    assert third is not first
+    await close_scraper_client()
+
+
+@pytest.mark.asyncio
+async def test_extract_metadata_parses_page():
+    """Title, description, OpenGraph, Twitter and favicon are extracted."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, html=_PAGE)
+
+    async with _mock_client(handler) as client:
+        result = await extract_metadata("https://example.com/page", client=client)
+
+    assert result["title"] == "Example Page"
+    assert result["description"] == "An example description."
+    assert result["image"] == "https://example.com/og.png"
+    assert result["og"] == {"image": "https://example.com/og.png"}
+    assert result["twitter"] == {"card": "summary"}
+    assert result["favicon"] == "https://example.com/favicon.ico"
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_is_capped(monkeypatch):
+    """No more than the per-host limit of requests run against one host."""
+    monkeypatch.setattr(
+        scraper, "_scheduler", DomainScheduler(per_host=2, min_delay=0, respect_robots=False)
+    )
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, html=_PAGE)
+
+    async with _mock_client(handler) as client:
+        await asyncio.gather(
+            *(extract_metadata(f"https://example.com/{i}", client=client) for i in range(6))
+        )
+
+    assert peak == 2
+    assert scraper._scheduler._hosts == {}
+
+
+@pytest.mark.asyncio
+async def test_busy_host_defers_instead_of_waiting(monkeypatch):
+    """Scrapes beyond the host's wait budget are deferred; other hosts still run."""
+    monkeypatch.setattr(
+        scraper,
+        "_scheduler",
+        DomainScheduler(per_host=1, min_delay=5, max_wait=1, respect_robots=False),
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, html=_PAGE)
+
+    async with _mock_client(handler) as client:
+        await fetch_metadata("https://busy.example/1", client=client)
+        with pytest.raises(ScrapeDeferred) as excinfo:
+            await fetch_metadata("https://busy.example/2", client=client)
+        other = await fetch_metadata("https://other.example/", client=client)
+
+    assert excinfo.value.retry_after > 1
+    assert other["title"] == "Example Page"
+
+
+@pytest.mark.asyncio
+async def test_retry_after_backs_off_host(monkeypatch):
+    """A 429 with Retry-After holds off the host and is reported as retryable."""
+    monkeypatch.setattr(
+        scraper, "_scheduler", DomainScheduler(min_delay=0, max_wait=5, respect_robots=False)
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "120"})
+
+    async with _mock_client(handler) as client:
+        with pytest.raises(ScrapeError) as excinfo:
+            await fetch_metadata("https://limited.example/", client=client)
+        assert excinfo.value.retryable
+        assert excinfo.value.retry_after == 120
+
+        with pytest.raises(ScrapeDeferred):
+            await fetch_metadata("https://limited.example/again", client=client)
+
+
+@pytest.mark.asyncio
+async def test_robots_txt_is_honored_and_cached(monkeypatch):
+    """Disallowed paths are not fetched and robots.txt is fetched once per host."""
+    monkeypatch.setattr(scraper, "_scheduler", DomainScheduler(min_delay=0))
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path == "/robots.txt":
+            return httpx.Response(200, text="User-agent: SaveLinksBot\nDisallow: /private/\n")
+        return httpx.Response(200, html=_PAGE)
+
+    async with _mock_client(handler) as client:
+        with pytest.raises(ScrapeError) as excinfo:
+            await fetch_metadata("https://robots.example/private/page", client=client)
+        public = await fetch_metadata("https://robots.example/public", client=client)
+
+    assert excinfo.value.retryable is False
+    assert public["title"] == "Example Page"
+    assert requested == ["/robots.txt", "/public"]
+
+
+@pytest.mark.asyncio
+async def test_cached_result_is_revalidated_with_etag(monkeypatch):
+    """Fresh hits skip the network; stale entries send If-None-Match and reuse a 304."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, html=_PAGE, headers={"ETag": '"v1"'})
+
+    async with _mock_client(handler) as client:
+        first = await fetch_metadata("https://cached.example/", client=client)
+        again = await fetch_metadata("https://CACHED.example/#top", client=client)
+        assert len(requests) == 1
+
+        monkeypatch.setattr(scraper._cache, "ttl", 0)
+        revalidated = await fetch_metadata("https://cached.example/", client=client)
+
+    assert first == again == revalidated
+    assert revalidated["title"] == "Example Page"
+    assert len(requests) == 2
+    assert requests[1].headers["if-none-match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_not_modified_without_cached_entry_fails():
+    """A 304 to a request sent without validators is a failed fetch, not a cache hit."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert "if-none-match" not in request.headers
+        return httpx.Response(304, headers={"ETag": '"v1"'})
+
+    async with _mock_client(handler) as client:
+        with pytest.raises(ScrapeError) as excinfo:
+            await fetch_metadata("https://not-modified.example/", client=client)
+        assert await extract_metadata("https://not-modified.example/", client=client) == (
+            scraper.empty_result()
+        )
+
+    assert excinfo.value.retryable is False
+    assert "304" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_failing_host_trips_breaker():
+    """Repeated timeouts open the host's breaker; later scrapes fail fast."""
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    async with _mock_client(handler) as client:
+        for i in range(3):
+            with pytest.raises(ScrapeError):
+                await fetch_metadata(f"https://dead.example/{i}", client=client)
+        with pytest.raises(ScrapeError) as excinfo:
+            await fetch_metadata("https://dead.example/new", client=client)
+
+    assert requested == ["/0", "/1", "/2"]
+    assert excinfo.value.retryable
+    assert excinfo.value.retry_after > 0
+
+
+@pytest.mark.asyncio
+async def test_failed_url_is_negatively_cached():
+    """A URL that just failed is not refetched; other URLs on the host are."""
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path == "/broken":
+            return httpx.Response(500)
+        return httpx.Response(200, html=_PAGE)
+
+    async with _mock_client(handler) as client:
+        assert (await extract_metadata("https://flaky.example/broken", client=client))["title"] is None
+        assert (await extract_metadata("https://flaky.example/broken", client=client))["title"] is None
+        ok = await extract_metadata("https://flaky.example/ok", client=client)
+
+    assert ok["title"] == "Example Page"
+    assert requested == ["/broken", "/ok"]
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_at_end_of_head():
+    """An endless body is never drained once </head> has been read."""
+    chunks_sent = 0
+
+    async def endless_body():
+        nonlocal chunks_sent
+        yield b"<html><head><title>Streamed</title></he"
+        yield b"ad><body>"
+        while True:
+            chunks_sent += 1
+            yield b"<p>" + b"x" * 1024 + b"</p>"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"Content-Type": "text/html"}, content=endless_body()
+        )
+
+    async with _mock_client(handler) as client:
+        result = await extract_metadata("https://example.com/", client=client)
+
+    assert result["title"] == "Streamed"
+    assert chunks_sent == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_respects_byte_budget(monkeypatch):
+    """A page without </head> is cut off at the configured byte budget."""
+    monkeypatch.setattr(scraper.settings, "scraper_max_read_bytes", 4096)
+    chunks_sent = 0
+
+    async def endless_head():
+        nonlocal chunks_sent
+        yield b"<html><head><title>Budget</title>"
+        while True:
+            chunks_sent += 1
+            yield b"<meta name='x' content='" + b"y" * 1024 + b"'>"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=endless_head())
+
+    async with _mock_client(handler) as client:
+        result = await extract_metadata("https://example.com/", client=client)
+
+    assert result["title"] == "Budget"
+    assert chunks_sent < 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Content-Type": "application/pdf"},
+        {"Content-Type": "text/html", "Content-Length": str(50 * 1024 * 1024)},
+    ],
+)
+async def test_unscrapable_responses_are_not_downloaded(headers):
+    """Non-HTML and oversized responses are rejected from their headers alone."""
+    body_read = False
+
+    async def body():
+        nonlocal body_read
+        body_read = True
+        yield _PAGE.encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers=headers, content=body())
+
+    async with _mock_client(handler) as client:
+        result = await extract_metadata("https://example.com/", client=client)
+
+    assert result["title"] is None
+    assert body_read is False
+
+
+@pytest.mark.parametrize(
+    "markup",
+    [
+        _PAGE,
+        "<title>a<b>x</b></title><meta property='og:title' content='OG'>",
+        "<title><b>Nested</b></title><link rel='apple-touch-icon' href='/t.png'>",
+        "<title>  </title><meta name='twitter:title' content='TW'>",
+        "<title>Q &amp; A &#39;x&#39; &foo;</title><meta name='description'>"
+        "<meta property='og:description' content='OD'>",
+        "<meta property='og:image' content='1'><meta property='og:image' content='2'>"
+        "<meta name='twitter:image' content='3'><link rel='icon'><link rel='icon' href='/x'>",
+        "<script>var t = '<title>no</title>';</script><!-- <title>no</title> --><title>yes",
+        "<title>  <?pi?>",
+        "<title><?pi x?></title>",
+        "<title>a<?pi?></title>",
+        "<title><![CDATA[ x ]]></title>",
+        "<title><![if x]></title>",
+        "<title><!DOCTYPE html></title>",
+        "<title><b><!-- c --></b></title>",
+        "<title><!----></title><meta property='og:title' content='OG'>",
+    ],
+)
+def test_fast_parser_matches_bs4(markup: str):
+    """The single-pass parser returns exactly what the BeautifulSoup parser does."""
+    url = "https://example.com/page"
+    assert parse_metadata(markup, url, head_only=False) == parse_metadata_bs4(markup, url)
+
+
+def test_fast_parser_stops_at_end_of_head():
+    """With head_only, tags after </head> are ignored."""
+    markup = "<head><title>Head</title></head><body><meta property='og:image' content='x'>"
+    result = parse_metadata(markup, "https://example.com/")
+    assert result["title"] == "Head"
+    assert result["og"] == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+async def test_parse_executor_modes(mode: str):
+    """Every executor mode returns the same metadata as parsing directly."""
+    executor = ParseExecutor(mode=mode, workers=1, thread_max_bytes=64)
+    try:
+        result = await executor.parse(_PAGE, "https://example.com/page")
+    finally:
+        executor.shutdown()
+    assert result == parse_metadata(_PAGE, "https://example.com/page")
+    assert executor.backlog == 0
+
+
+@pytest.mark.asyncio
+async def test_parse_executor_bounds_backlog(monkeypatch):
+    """No more than max_pending parses run at once; the rest wait their turn."""
+    executor = ParseExecutor(mode="thread", workers=4, max_pending=2)
+    peak_running = 0
+    real_run = asyncio.get_running_loop().run_in_executor
+
+    async def observed(*args):
+        nonlocal peak_running
+        peak_running = max(peak_running, executor.stats()["running"])
+        await asyncio.sleep(0.01)
+        return await real_run(*args)
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "run_in_executor", observed)
+    try:
+        await asyncio.gather(
+            *(executor.parse(_PAGE, "https://example.com/") for _ in range(8))
+        )
+    finally:
+        executor.shutdown()
+
+    assert peak_running == 2
+    assert executor.stats()["queued"] == 0